@@ -0,0 +1,205 @@
+from typing import Dict, Optional
+import asyncio
+import heapq
+import itertools
+import json
+import math
+import time
+
+from app.config import settings
+from app import metrics
+
+# Waiters allowed per class, as a multiple of its concurrency limit
+QUEUE_FACTOR = 4
+
+
+class PriorityGate:
+    """동시 실행 수 제한 게이트 (대기자는 priority 가 작은 순, 같으면 도착 순)"""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.active = 0
+        self.waiting = 0
+        self._waiters = []
+        self._seq = itertools.count()
+
+    async def acquire(self, priority: int, timeout: float) -> bool:
+        """timeout 안에 슬롯을 얻으면 True"""
+        if self.active < self.capacity and not self.waiting:
+            self.active += 1
+            return True
+        if timeout <= 0:
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), future))
+        self.waiting += 1
+        try:
+            await asyncio.wait_for(future, timeout)
+            return True
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            # The slot may have been handed over just as the wait ended
+            if future.done() and not future.cancelled():
+                self.release()
+            else:
+                future.cancel()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            return False
+        finally:
+            self.waiting -= 1
+
+    def release(self) -> None:
+        """슬롯 반환 (대기자가 있으면 가장 우선인 대기자에게 넘김)"""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(True)
+                return
+        self.active -= 1
+
+
+class AdmissionClass:
+    """엔드포인트 우선순위 클래스 (동시 실행 한도, 대기열 한도, 대기 시간 예산)"""
+
+    def __init__(self, name: str, priority: int, limit: int, queue_budget_ms: float):
+        self.name = name
+        self.priority = priority
+        self.gate = PriorityGate(limit)
+        self.max_queue = limit * QUEUE_FACTOR
+        self.queue_budget = queue_budget_ms / 1000
+        metrics.ADMISSION_QUEUE_DEPTH.labels(priority_class=name).set_function(lambda: self.gate.waiting)
+        metrics.ADMISSION_INFLIGHT.labels(priority_class=name).set_function(lambda: self.gate.active)
+
+
+class Rejected(Exception):
+    """대기 예산 초과로 요청 거절"""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class AdmissionController:
+    """우선순위 기반 입장 제어
+
+    요청은 먼저 클래스별 슬롯을, 다음으로 DB 풀 크기에 맞춘 전역 슬롯을 얻는다.
+    전역 슬롯 대기열은 우선순위 순이라 과부하 시 autocomplete 가 집계 요청보다 먼저
+    들어가고, 대기열이 가득 차거나 대기 시간 예산을 넘기면 즉시 거절(503)한다.
+    """
+
+    def __init__(self, classes: Dict[str, AdmissionClass], routes: Dict[str, str], global_limit: int):
+        self.classes = classes
+        self.routes = routes
+        self.global_gate = PriorityGate(global_limit)
+        metrics.ADMISSION_QUEUE_DEPTH.labels(priority_class="global").set_function(lambda: self.global_gate.waiting)
+
+    def classify(self, path: str) -> Optional[AdmissionClass]:
+        """경로의 우선순위 클래스 (제어 대상이 아니면 None)"""
+        if path in self.routes:
+            name = self.routes[path]
+        else:
+            name = "standard" if path.startswith("/api/") else None
+        return self.classes.get(name) if name else None
+
+    async def admit(self, admission_class: AdmissionClass) -> None:
+        """슬롯 확보 (실패 시 Rejected)"""
+        started = time.monotonic()
+        if admission_class.gate.waiting >= admission_class.max_queue:
+            self._reject(admission_class, "queue_full")
+
+        if not await admission_class.gate.acquire(admission_class.priority, admission_class.queue_budget):
+            self._reject(admission_class, "queue_timeout")
+
+        remaining = admission_class.queue_budget - (time.monotonic() - started)
+        try:
+            admitted = await self.global_gate.acquire(admission_class.priority, remaining)
+        except BaseException:
+            admission_class.gate.release()
+            raise
+        if not admitted:
+            admission_class.gate.release()
+            self._reject(admission_class, "queue_timeout")
+
+        metrics.ADMISSION_QUEUE_SECONDS.labels(priority_class=admission_class.name).observe(time.monotonic() - started)
+
+    def release(self, admission_class: AdmissionClass) -> None:
+        self.global_gate.release()
+        admission_class.gate.release()
+
+    def _reject(self, admission_class: AdmissionClass, reason: str) -> None:
+        metrics.ADMISSION_SHED_TOTAL.labels(priority_class=admission_class.name, reason=reason).inc()
+        raise Rejected(reason)
+
+
+def default_controller() -> AdmissionController:
+    """설정값으로 기본 컨트롤러 생성"""
+    classes = {
+        "critical": AdmissionClass("critical", 0, settings.ADMISSION_CRITICAL_LIMIT, settings.ADMISSION_CRITICAL_QUEUE_MS),
+        "standard": AdmissionClass("standard", 1, settings.ADMISSION_STANDARD_LIMIT, settings.ADMISSION_STANDARD_QUEUE_MS),
+        "background": AdmissionClass("background", 2, settings.ADMISSION_BACKGROUND_LIMIT, settings.ADMISSION_BACKGROUND_QUEUE_MS),
+    }
+    routes = {
+        "/api/autocomplete": "critical",
+        "/api/items": "critical",
+        "/api/search": "standard",
+        "/api/search/batch": "standard",
+        "/api/suggestions": "standard",
+        "/api/search/popular": "background",
+        "/api/search/stats": "background",
+        "/api/search/analytics": "background",
+        "/api/search/export": "background",
+        # Introspection endpoints never touch the database
+        "/api/search/cache-stats": None,
+    }
+    return AdmissionController(classes, routes, settings.ADMISSION_GLOBAL_LIMIT)
+
+
+class AdmissionControlMiddleware:
+    """입장 제어 ASGI 미들웨어 (거절 시 503 + Retry-After)
+
+    스트리밍 응답도 본문 전송이 끝날 때까지 슬롯을 유지한다.
+    """
+
+    def __init__(self, app, controller: Optional[AdmissionController] = None):
+        self.app = app
+        self.controller = controller or default_controller()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        admission_class = self.controller.classify(scope["path"])
+        if admission_class is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            await self.controller.admit(admission_class)
+        except Rejected as e:
+            await self._overloaded(send, admission_class, e.reason)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(admission_class)
+
+    async def _overloaded(self, send, admission_class: AdmissionClass, reason: str) -> None:
+        retry_after = max(1, math.ceil(settings.ADMISSION_RETRY_AFTER_SECONDS))
+        body = json.dumps({
+            "detail": "Server is overloaded, retry later",
+            "priority_class": admission_class.name,
+            "reason": reason,
+        }).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(retry_after).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,41 @@
+from fastapi import Request, Response
+from typing import Optional
+import hashlib
+
+from app.services.change_feed import change_feed
+
+
+def make_etag(*parts) -> Optional[str]:
+    """(요청 키, 데이터 버전) 기반 약한 ETag (데이터 버전을 모르면 None)"""
+    version = change_feed.data_version
+    if version is None:
+        return None
+    digest = hashlib.sha1(repr((parts, version)).encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def is_not_modified(request: Request, etag: Optional[str]) -> bool:
+    """If-None-Match 가 현재 ETag 와 일치하는지 (약한 비교)"""
+    if etag is None:
+        return False
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag.removeprefix("W/") in candidates
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+
+def set_cache_headers(response: Response, etag: Optional[str], cache_control: str) -> None:
+    response.headers["Cache-Control"] = cache_control
+    if etag is not None:
+        response.headers["ETag"] = etag
+
+
+def public_max_age(seconds: float) -> str:
+    return f"public, max-age={int(seconds)}"
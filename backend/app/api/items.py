@@ -0,0 +1,58 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from app.config import settings
+from app.database import get_read_db
+from app.schemas import ItemsRequest, ItemsResponse
+from app.services.search_service import SearchService
+
+router = APIRouter(prefix="/api", tags=["items"])
+
+
+def _parse_ids(ids: str) -> List[int]:
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=422, detail="ids must be comma-separated integers")
+    if not parsed:
+        raise HTTPException(status_code=422, detail="ids must not be empty")
+    if len(parsed) > settings.ITEMS_MAX_IDS:
+        raise HTTPException(status_code=422, detail=f"at most {settings.ITEMS_MAX_IDS} ids per request")
+    return parsed
+
+
+async def _get_items(ids: List[int], db: AsyncSession) -> ItemsResponse:
+    unique_ids = list(dict.fromkeys(ids))
+    items = await SearchService(db).get_items(unique_ids)
+    found = {item.id for item in items}
+    return ItemsResponse(
+        items=items,
+        missing=[item_id for item_id in unique_ids if item_id not in found]
+    )
+
+
+@router.get("/items", response_model=ItemsResponse)
+async def get_items(
+    ids: str = Query(..., description="쉼표로 구분한 아이템 id 목록 (최대 100개)"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    아이템 일괄 조회 API
+    
+    id 목록의 아이템을 요청 순서대로 반환합니다. 캐시에 없는 id 만 한 번의 쿼리로 조회합니다.
+    """
+    return await _get_items(_parse_ids(ids), db)
+
+
+@router.post("/items", response_model=ItemsResponse)
+async def post_items(
+    request: ItemsRequest,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    아이템 일괄 조회 API (POST)
+    
+    id 목록이 URL 길이 제한을 넘을 때 사용합니다.
+    """
+    return await _get_items(request.ids, db)
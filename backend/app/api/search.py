@@ -1,16 +1,43 @@
-from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Optional, List
+from typing import Awaitable, Callable, Optional, List
+from contextlib import nullcontext
+from datetime import datetime
+import csv
+import io
+import json
 import time
 import uuid
 import hashlib
 import os
+import numpy as np
 
-from app.database import get_db
-from app.services.search_service import SearchService
+from app.database import (
+    get_db,
+    get_analytics_db,
+    get_read_sessions,
+    get_analytics_sessions,
+    kill_on_cancel
+)
+from app.api.http_cache import make_etag, is_not_modified, not_modified, set_cache_headers, public_max_age
+from app.services.search_service import SearchService, EXPORT_COLUMNS, ascii_fold, query_key
+from app.services.batch_search import error_message, run_batch
+from app.services.cpu_executor import cpu_executor
+from app.services.facets import price_facets
+from app.services.heavy_hitters import query_sketch
+from app.services.item_cache import item_cache
+from app.services.autocomplete_cache import autocomplete_cache
+from app.services.singleflight import SingleFlight
+from app.services.latest_only import LatestOnly, Superseded
+from app.rate_limit import client_key
+from app.services.swr_cache import SWRCache
 from app.schemas import (
     SearchQuery,
     SearchResponse,
+    BatchSearchRequest,
+    BatchSearchResult,
+    BatchSearchResponse,
     SearchItem as SearchItemSchema,
     AutocompleteResponse,
     SuggestionResponse,
@@ -22,10 +49,24 @@ from app.config import settings
 
 router = APIRouter(prefix="/api", tags=["search"])
 
+# Coalesces identical in-flight /api/search executions
+search_flight = SingleFlight("search")
+
+# Cancels a client session's previous autocomplete when the next keystroke arrives
+autocomplete_latest = LatestOnly("autocomplete")
+
+# Suggestions, popular queries and stats served stale-while-revalidate
+aggregate_cache = SWRCache(
+    "aggregates",
+    ttl=settings.AGGREGATE_CACHE_TTL_SECONDS,
+    stale_ttl=settings.AGGREGATE_CACHE_STALE_SECONDS
+)
+
 
 @router.get("/search", response_model=SearchResponse)
 async def search(
     request: Request,
+    response: Response,
     q: str = Query(..., min_length=1, max_length=255, description="검색 키워드"),
     category: Optional[str] = Query(None, description="카테고리 필터"),
     min_price: Optional[float] = Query(None, ge=0, description="최소 가격"),
@@ -34,7 +75,8 @@ async def search(
     order: str = Query("desc", description="정렬 순서"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(20, ge=1, le=100, description="페이지 크기"),
-    db: AsyncSession = Depends(get_db)
+    sessions: Callable[[], AsyncSession] = Depends(get_read_sessions),
+    write_db: AsyncSession = Depends(get_db)
 ):
     """
     검색 API - v2.0 (카나리 배포)
@@ -73,6 +115,18 @@ async def search(
         size=size
     )
     
+    # Conditional request: answer 304 without running the search. Related suggestions come
+    # from search_logs, which the data version does not cover, so the ETag also rolls over
+    # every SEARCH_SUGGESTIONS_ETAG_SECONDS. Revalidated searches are still logged, without
+    # the result count and latency that only running the query would give.
+    cache_control = public_max_age(settings.SEARCH_CACHE_MAX_AGE_SECONDS)
+    suggestions_bucket = int(time.time() // settings.SEARCH_SUGGESTIONS_ETAG_SECONDS)
+    etag = make_etag("search", query_key(search_query), suggestions_bucket)
+    if is_not_modified(request, etag):
+        await SearchService(write_db).log_revalidated(q)
+        return not_modified(etag, cache_control)
+    set_cache_headers(response, etag, cache_control)
+    
     # Check if database is available (for performance tests)
     if os.getenv("SKIP_DB_INIT"):
         # Return comprehensive mock data for performance tests
@@ -96,42 +150,49 @@ async def search(
         response_time = 0.001
         facets = {
             "categories": ["전자제품", "의류", "도서", "식품", "가구", "스포츠", "완구", "화장품"],
-            "price_ranges": ["0-1000", "1000-5000", "5000-10000", "10000+"]
+            **price_facets(
+                np.array([item["price"] for item in mock_items], dtype=np.float64),
+                settings.price_bucket_edges,
+                settings.FACET_PRICE_HISTOGRAM_BINS
+            )
         }
         suggestions = [f"{q} related", f"{q} suggestion", f"{q} alternative", f"{q} similar", f"{q} popular"]
         service = None  # No service for mock data
     else:
-        service = SearchService(db)
-        items, total, response_time = await service.search(search_query)
-        
-        # Get facets
-        facets = await service.get_facets(q)
+        async def execute():
+            # The shared execution can outlive the request that started it, so it owns its session
+            async with sessions() as db:
+                shared = SearchService(db)
+                found, count, elapsed = await shared.search(search_query, log=False)
+                return (
+                    found,
+                    count,
+                    elapsed,
+                    await shared.get_facets(q),
+                    # 관련 검색어 제안 (새로운 기능)
+                    await shared.get_related_suggestions(q, limit=5)
+                )
         
-        # 관련 검색어 제안 (새로운 기능)
-        suggestions = await service.get_related_suggestions(q, limit=5)
+        # Identical concurrent searches share one execution; each request is still logged
+        items, total, response_time, facets, suggestions = await search_flight.do(
+            query_key(search_query),
+            execute
+        )
+        service = SearchService(write_db)
+        await service.log_search(q, total, response_time)
     
     # Highlight search terms
-    highlighted_items = []
-    # Use service.highight_text if service exists, otherwise fallback simple highlighter
-    def _fallback_highlight(title: str, query: str) -> str:
-        try:
-            return title.replace(query, f"[{query}]") if title and query else title
-        except Exception:
-            return title
-
-    highlight_text = None
+    results = [SearchItemSchema.model_validate(item) for item in items]
+    titles = [result.title for result in results]
     if service is not None:
-        try:
-            highlight_text = service.highlight_text
-        except Exception:
-            highlight_text = _fallback_highlight
+        # Large pages are highlighted off the event loop
+        highlights = (await cpu_executor.highlight([(q, titles)]))[0]
     else:
-        highlight_text = _fallback_highlight
-
-    for item in items:
-        item_dict = SearchItemSchema.model_validate(item).model_dump()
-        item_dict['highlight'] = highlight_text(item_dict.get('title', ''), q)
-        highlighted_items.append(SearchItemSchema(**item_dict))
+        highlights = [title.replace(q, f"[{q}]") if title else title for title in titles]
+    # Copies: coalesced requests share the item objects
+    highlighted_items = [
+        result.model_copy(update={"highlight": text}) for result, text in zip(results, highlights)
+    ]
     
     total_pages = (total + size - 1) // size
     
@@ -158,20 +219,164 @@ async def search(
     )
 
 
+@router.post("/search/batch", response_model=BatchSearchResponse)
+async def batch_search(
+    batch: BatchSearchRequest,
+    write_db: AsyncSession = Depends(get_db),
+    sessions: Callable[[], AsyncSession] = Depends(get_read_sessions)
+):
+    """
+    배치 검색 API
+    
+    여러 검색 쿼리를 한 번의 요청으로 실행하고 요청 순서대로 결과를 반환합니다.
+    동일한 쿼리는 한 번만 실행되며, 개별 쿼리의 실패는 해당 결과의 error 로 표시됩니다.
+    """
+    start_time = time.time()
+    
+    outcomes, unique_queries = await run_batch(
+        batch.queries,
+        sessions,
+        settings.BATCH_SEARCH_CONCURRENCY,
+        settings.BATCH_SEARCH_QUERY_TIMEOUT_SECONDS
+    )
+    
+    service = SearchService(write_db)
+    # Every page in one offloaded call, so a large batch never blocks the event loop
+    pages = [
+        (query.q, [SearchItemSchema.model_validate(item) for item in outcome[0]])
+        for query, outcome in zip(batch.queries, outcomes)
+        if not isinstance(outcome, Exception)
+    ]
+    highlights = await cpu_executor.highlight([(text, [item.title for item in items]) for text, items in pages])
+    highlighted = iter(
+        [item.model_copy(update={"highlight": marked}) for item, marked in zip(items, titles)]
+        for (_, items), titles in zip(pages, highlights)
+    )
+    
+    results, logs = [], []
+    for query, outcome in zip(batch.queries, outcomes):
+        if isinstance(outcome, Exception):
+            results.append(BatchSearchResult(
+                query=query.q,
+                page=query.page,
+                size=query.size,
+                error=error_message(outcome)
+            ))
+            continue
+        
+        _, total, response_time = outcome
+        
+        results.append(BatchSearchResult(
+            query=query.q,
+            total=total,
+            page=query.page,
+            size=query.size,
+            total_pages=(total + query.size - 1) // query.size,
+            items=next(highlighted),
+            response_time_ms=round(response_time, 2)
+        ))
+        logs.append((query.q, total, response_time))
+    
+    # One commit for the whole batch instead of one per query
+    if logs:
+        await service.log_searches(logs)
+    
+    return BatchSearchResponse(
+        results=results,
+        unique_queries=unique_queries,
+        response_time_ms=round((time.time() - start_time) * 1000, 2)
+    )
+
+
+def _export_ndjson(rows: List[dict]) -> bytes:
+    return "".join(json.dumps(row, default=_export_value, ensure_ascii=False) + "\n" for row in rows).encode()
+
+
+def _export_csv(rows: List[dict], header: bool) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if header:
+        writer.writerow(column.key for column in EXPORT_COLUMNS)
+    writer.writerows(
+        ["" if value is None else _export_value(value) for value in row.values()]
+        for row in rows
+    )
+    return buffer.getvalue().encode()
+
+
+def _export_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+@router.get("/search/export")
+async def export_search(
+    q: str = Query(..., min_length=1, max_length=255, description="검색 키워드"),
+    category: Optional[str] = Query(None, description="카테고리 필터"),
+    min_price: Optional[float] = Query(None, ge=0, description="최소 가격"),
+    max_price: Optional[float] = Query(None, ge=0, description="최대 가격"),
+    sort: str = Query("relevance", description="정렬 기준"),
+    order: str = Query("desc", description="정렬 순서"),
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="출력 형식 (ndjson, csv)"),
+    sessions: Callable[[], AsyncSession] = Depends(get_read_sessions)
+):
+    """
+    검색 결과 내보내기 API
+    
+    조건에 맞는 모든 행을 NDJSON 또는 CSV 로 스트리밍합니다.
+    서버 사이드 커서로 EXPORT_CHUNK_SIZE 행씩 읽으므로 결과 크기와 무관하게 메모리 사용이 일정합니다.
+    """
+    search_query = SearchQuery(
+        q=q,
+        category=category,
+        min_price=min_price,
+        max_price=max_price,
+        sort=sort,
+        order=order
+    )
+    
+    async def body():
+        # The session lives as long as the stream, not the request handler
+        async with sessions() as db:
+            header = True
+            async for rows in SearchService(db).stream_matches(search_query, settings.EXPORT_CHUNK_SIZE):
+                yield _export_csv(rows, header) if format == "csv" else _export_ndjson(rows)
+                header = False
+            if format == "csv" and header:
+                yield _export_csv([], True)
+    
+    media_type = "text/csv; charset=utf-8" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        body(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="search-export.{format}"'}
+    )
+
+
 @router.get("/autocomplete", response_model=AutocompleteResponse)
 async def autocomplete(
+    request: Request,
+    response: Response,
     q: str = Query(..., min_length=1, max_length=100, description="부분 검색어"),
     limit: int = Query(10, ge=1, le=20, description="제안 개수"),
-    db: AsyncSession = Depends(get_db)
+    session_id: Optional[str] = Header(None, alias="X-Session-Id", max_length=64),
+    sessions: Callable[[], AsyncSession] = Depends(get_read_sessions)
 ):
     """
     자동완성 API
     
     - **q**: 부분 검색어
     - **limit**: 제안 개수 (최대 20)
+    - **X-Session-Id** (헤더): 같은 세션의 새 요청이 오면 처리 중인 이전 요청은 취소되고 409 를 받습니다
     """
     start_time = time.time()
     
+    # Conditional request: answer 304 before any DB work
+    cache_control = public_max_age(settings.AUTOCOMPLETE_CACHE_MAX_AGE_SECONDS)
+    etag = make_etag("autocomplete", ascii_fold(q), limit)
+    if is_not_modified(request, etag):
+        return not_modified(etag, cache_control)
+    set_cache_headers(response, etag, cache_control)
+    
     # Check if database is available (for performance tests)
     if os.getenv("SKIP_DB_INIT"):
         # Return comprehensive mock suggestions for performance tests
@@ -182,8 +387,22 @@ async def autocomplete(
         ]
         suggestions = random.sample(base_suggestions, min(limit, len(base_suggestions)))
     else:
-        service = SearchService(db)
-        suggestions = await service.autocomplete(q, limit)
+        # Own session so a superseded lookup releases its connection; with a session id the
+        # query is also killed on the server (MySQL), which cancelling the task alone does not do
+        async def load(candidates: int):
+            async with sessions() as db, (kill_on_cancel(db) if session_id else nullcontext()):
+                return await SearchService(db).autocomplete_candidates(q, candidates)
+        
+        async def lookup():
+            return await autocomplete_cache.get(q, limit, load)
+        
+        if session_id:
+            try:
+                suggestions = await autocomplete_latest.run((client_key(request.scope), session_id), lookup)
+            except Superseded:
+                raise HTTPException(status_code=409, detail="Superseded by a newer request from the same session")
+        else:
+            suggestions = await lookup()
     
     response_time = (time.time() - start_time) * 1000
     
@@ -193,56 +412,98 @@ async def autocomplete(
     )
 
 
+async def _cached_aggregate(
+    key: str,
+    sessions: Callable[[], AsyncSession],
+    compute: Callable[[SearchService], Awaitable],
+    response: Response
+):
+    """집계 결과를 SWR 캐시에서 반환 (갱신은 자체 세션으로 실행)"""
+    async def load():
+        async with sessions() as db:
+            return await compute(SearchService(db))
+    
+    value, age = await aggregate_cache.get(key, load)
+    response.headers["Age"] = str(int(age))
+    # Aggregates come from search_logs, so they expire by age rather than data version
+    response.headers["Cache-Control"] = public_max_age(max(aggregate_cache.ttl - age, 0))
+    return value
+
+
 @router.get("/suggestions", response_model=SuggestionResponse)
 async def get_suggestions(
-    db: AsyncSession = Depends(get_db)
+    response: Response,
+    sessions: Callable[[], AsyncSession] = Depends(get_read_sessions)
 ):
     """
     추천 검색어 API
     
-    인기 검색어와 최근 검색어를 반환합니다.
+    인기 검색어와 최근 검색어를 반환합니다. (캐시된 값, Age 헤더로 나이 표시)
     """
-    service = SearchService(db)
-    suggestions = await service.get_suggestions()
+    suggestions = await _cached_aggregate(
+        "suggestions", sessions, lambda service: service.get_suggestions(), response
+    )
     
     return SuggestionResponse(**suggestions)
 
 
 @router.get("/search/stats", response_model=SearchStats)
 async def get_search_stats(
-    db: AsyncSession = Depends(get_db)
+    response: Response,
+    sessions: Callable[[], AsyncSession] = Depends(get_analytics_sessions)
 ):
     """
     검색 통계 API
     
-    전체 검색 통계 정보를 반환합니다.
+    전체 검색 통계 정보를 반환합니다. (캐시된 값, Age 헤더로 나이 표시)
     """
-    service = SearchService(db)
-    stats = await service.get_stats()
+    stats = await _cached_aggregate(
+        "stats", sessions, lambda service: service.get_stats(), response
+    )
     
     return SearchStats(**stats)
 
 
 @router.get("/search/popular", response_model=List[PopularQueries])
 async def get_popular_queries(
+    response: Response,
     limit: int = Query(10, ge=1, le=50, description="조회할 인기 검색어 개수"),
-    db: AsyncSession = Depends(get_db)
+    sessions: Callable[[], AsyncSession] = Depends(get_analytics_sessions)
 ):
     """
     인기 검색어 API - v2.0 (카나리 배포)
     
-    가장 많이 검색된 쿼리들을 반환합니다.
+    가장 많이 검색된 쿼리들을 반환합니다. (캐시된 값, Age 헤더로 나이 표시)
     """
-    service = SearchService(db)
-    popular_queries = await service.get_popular_queries(limit)
+    popular_queries = await _cached_aggregate(
+        f"popular:{limit}", sessions, lambda service: service.get_popular_queries(limit), response
+    )
     
     return popular_queries
 
 
+@router.get("/search/cache-stats")
+async def get_cache_stats():
+    """
+    캐시 상태 API
+    
+    집계 캐시의 키별 나이/갱신 상태, 아이템/자동완성 캐시 적중률, 검색 요청 병합 통계,
+    자동완성 세션별 취소 통계, 인기 검색어 요약 상태를 반환합니다.
+    """
+    return {
+        "aggregates": aggregate_cache.stats(),
+        "items": item_cache.stats(),
+        "autocomplete": autocomplete_cache.stats(),
+        "search_coalescing": search_flight.stats(),
+        "autocomplete_sessions": autocomplete_latest.stats(),
+        "query_sketch": query_sketch.stats(),
+    }
+
+
 @router.get("/search/analytics", response_model=SearchAnalytics)
 async def get_search_analytics(
     query: str = Query(..., description="분석할 검색 쿼리"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_analytics_db)
 ):
     """
     검색 분석 API - v2.0 (카나리 배포)
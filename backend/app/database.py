@@ -1,32 +1,117 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
+from contextlib import asynccontextmanager
+from typing import Callable, Dict, Optional
 from app.config import settings
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-)
+
+def create_engine(url: str, pool_size: int, max_overflow: int, pool_timeout: float = 30.0) -> AsyncEngine:
+    """비동기 엔진 생성 (SQLite 는 풀 크기 옵션을 받지 않는 풀을 사용)"""
+    options = {"echo": False, "pool_pre_ping": True}
+    if not url.startswith("sqlite"):
+        options.update(pool_size=pool_size, max_overflow=max_overflow, pool_timeout=pool_timeout)
+    return create_async_engine(url, **options)
+
+
+def _sessionmaker(bind: AsyncEngine) -> async_sessionmaker:
+    return async_sessionmaker(
+        bind,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+class DatabaseRouter:
+    """엔진별 세션 라우팅
+
+    쓰기는 primary, 읽기는 replica(없거나 장애 시 primary), 무거운 분석 집계는
+    작은 전용 풀로 보내 검색 트래픽과 연결을 다투지 않게 한다.
+    replica 상태는 헬스 모니터가 mark_replica() 로 갱신한다.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replica: Optional[AsyncEngine] = None,
+        analytics: Optional[AsyncEngine] = None,
+    ):
+        self.engines: Dict[str, AsyncEngine] = {"primary": primary}
+        if replica is not None:
+            self.engines["replica"] = replica
+        if analytics is not None:
+            self.engines["analytics"] = analytics
+
+        self._primary = _sessionmaker(primary)
+        self._replica = _sessionmaker(replica) if replica is not None else None
+        self._analytics = _sessionmaker(analytics) if analytics is not None else None
+        self.replica_healthy = replica is not None
+
+    @property
+    def primary(self) -> AsyncEngine:
+        return self.engines["primary"]
+
+    @property
+    def replica(self) -> Optional[AsyncEngine]:
+        return self.engines.get("replica")
+
+    def write_session(self) -> AsyncSession:
+        return self._primary()
+
+    def read_session(self) -> AsyncSession:
+        if self._replica is not None and self.replica_healthy:
+            return self._replica()
+        return self._primary()
+
+    def analytics_session(self) -> AsyncSession:
+        if self._analytics is not None:
+            return self._analytics()
+        return self.read_session()
+
+    def mark_replica(self, healthy: bool) -> None:
+        """replica 상태 갱신 (장애 시 읽기를 primary 로 전환)"""
+        if self.replica is None or healthy == self.replica_healthy:
+            return
+        self.replica_healthy = healthy
+        if healthy:
+            logger.info("Read replica recovered, routing reads to replica")
+        else:
+            logger.warning("Read replica unavailable, routing reads to primary")
+
+    async def dispose(self) -> None:
+        for db_engine in self.engines.values():
+            await db_engine.dispose()
+
+
+# Primary engine (writes, schema, fallback for reads)
+engine = create_engine(settings.DATABASE_URL, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW)
 
 # Create async session maker
-AsyncSessionLocal = async_sessionmaker(
+AsyncSessionLocal = _sessionmaker(engine)
+
+db_router = DatabaseRouter(
     engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
+    replica=create_engine(
+        settings.DATABASE_REPLICA_URL,
+        settings.DB_POOL_SIZE,
+        settings.DB_MAX_OVERFLOW,
+    ) if settings.DATABASE_REPLICA_URL else None,
+    analytics=create_engine(
+        settings.DATABASE_REPLICA_URL or settings.DATABASE_URL,
+        settings.ANALYTICS_POOL_SIZE,
+        settings.ANALYTICS_MAX_OVERFLOW,
+        settings.ANALYTICS_POOL_TIMEOUT_SECONDS,
+    ),
 )
 
 
-async def get_db():
-    """데이터베이스 세션 의존성"""
-    async with AsyncSessionLocal() as session:
+async def _session_scope(session: AsyncSession):
+    async with session:
         try:
             yield session
         except Exception as e:
@@ -37,18 +122,71 @@ async def get_db():
             await session.close()
 
 
+@asynccontextmanager
+async def kill_on_cancel(db: AsyncSession):
+    """블록이 취소되면 세션 연결에서 실행 중인 쿼리를 서버에서도 중단
+
+    태스크 취소는 클라이언트 쪽 대기만 끝내고 서버의 쿼리는 계속 돈다. MySQL 은
+    CONNECTION_ID() 를 미리 읽어 두었다가 취소되면 별도 연결로 KILL QUERY 를 보낸다
+    (세션이 아직 연결을 쥐고 있을 때 보내므로 다른 요청의 쿼리를 죽이지 않는다).
+    SQLite 는 서버가 없어 aiosqlite 스레드의 쿼리가 끝까지 돌고 결과만 버려진다.
+    """
+    conn = await db.connection()
+    if conn.dialect.name != "mysql":
+        yield
+        return
+    connection_id = (await conn.exec_driver_sql("SELECT CONNECTION_ID()")).scalar()
+    try:
+        yield
+    except asyncio.CancelledError:
+        try:
+            async with conn.engine.connect() as killer:
+                await killer.exec_driver_sql(f"KILL QUERY {int(connection_id)}")
+        except Exception as e:
+            logger.warning(f"KILL QUERY {connection_id} failed: {e}")
+        raise
+
+
+async def get_db():
+    """데이터베이스 세션 의존성 (primary, 쓰기용)"""
+    async for session in _session_scope(db_router.write_session()):
+        yield session
+
+
+async def get_read_db():
+    """읽기 전용 세션 의존성 (replica 우선)"""
+    async for session in _session_scope(db_router.read_session()):
+        yield session
+
+
+async def get_analytics_db():
+    """분석 집계 세션 의존성 (전용 소형 풀)"""
+    async for session in _session_scope(db_router.analytics_session()):
+        yield session
+
+
+def get_read_sessions() -> Callable[[], AsyncSession]:
+    """읽기 세션 팩토리 의존성 (요청 이후에도 실행되는 백그라운드 갱신용)"""
+    return db_router.read_session
+
+
+def get_analytics_sessions() -> Callable[[], AsyncSession]:
+    """분석 세션 팩토리 의존성 (요청 이후에도 실행되는 백그라운드 갱신용)"""
+    return db_router.analytics_session
+
+
 async def init_db():
-    """데이터베이스 초기화"""
-    from app.models import Base
+    """데이터베이스 초기화 (기록된 스키마 버전이 같으면 DDL 생략)"""
+    from app.migrations import upgrade, SCHEMA_VERSION
     
     async with engine.begin() as conn:
-        # Create all tables
-        await conn.run_sync(Base.metadata.create_all)
-        logger.info("Database tables created successfully")
+        if await conn.run_sync(upgrade):
+            logger.info(f"Database schema upgraded to v{SCHEMA_VERSION}")
+        else:
+            logger.info(f"Database schema v{SCHEMA_VERSION} is current, skipping DDL")
 
 
 async def close_db():
     """데이터베이스 연결 종료"""
-    await engine.dispose()
+    await db_router.dispose()
     logger.info("Database connections closed")
-
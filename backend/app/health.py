@@ -0,0 +1,180 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from typing import Dict, Optional
+from datetime import datetime
+import asyncio
+import copy
+import logging
+import time
+
+from app.config import settings
+from app.database import DatabaseRouter, db_router
+from app.loop_monitor import LoopMonitor, loop_monitor
+from app.services.change_feed import ChangeFeed, change_feed
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def pool_usage(db_engine: AsyncEngine) -> Optional[dict]:
+    """연결 풀 사용량 (크기 제한이 없는 풀이면 None)"""
+    pool = db_engine.pool
+    if not hasattr(pool, "checkedout"):
+        return None
+
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    checked_out = pool.checkedout()
+    return {
+        "size": pool.size(),
+        "capacity": capacity,
+        "checked_out": checked_out,
+        "overflow": max(pool.overflow(), 0),
+        "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+    }
+
+
+class HealthState:
+    """마지막 헬스 프로브 결과"""
+
+    def __init__(
+        self,
+        database: str,
+        pools: Dict[str, dict],
+        event_loop_lag_ms: float,
+        index_lag_seconds: Optional[float],
+        replica: Optional[str] = None,
+    ):
+        self.database = database
+        self.replica = replica
+        self.pools = pools
+        self.event_loop_lag_ms = event_loop_lag_ms
+        self.index_lag_seconds = index_lag_seconds
+        self.checked_at = datetime.now()
+        self.checked_monotonic = time.monotonic()
+        # Set when the monitor stopped refreshing this state
+        self.stale = False
+
+    @property
+    def status(self) -> str:
+        if self.stale:
+            return "degraded"
+        if self.database != "healthy" or self.replica not in (None, "healthy"):
+            return "degraded"
+        if any(pool["saturation"] >= settings.HEALTH_POOL_SATURATION_THRESHOLD for pool in self.pools.values()):
+            return "degraded"
+        if self.event_loop_lag_ms >= settings.HEALTH_EVENT_LOOP_LAG_THRESHOLD_MS:
+            return "degraded"
+        if self.index_lag_seconds is not None and self.index_lag_seconds >= settings.HEALTH_INDEX_LAG_THRESHOLD_SECONDS:
+            return "degraded"
+        return "healthy"
+
+
+class HealthMonitor:
+    """백그라운드 헬스 모니터
+
+    주기적으로 primary/replica 에 SELECT 1 을 보내고 풀별 포화도, 이벤트 루프 지연
+    (LoopMonitor 가 측정), 인덱스 신선도를 수집해 캐시한다. /health 는 캐시된
+    결과만 반환하므로 프로브 요청이 많아도 연결을 새로 열지 않는다.
+    """
+
+    def __init__(
+        self,
+        router: DatabaseRouter,
+        feed: ChangeFeed,
+        monitor: Optional[LoopMonitor] = None,
+        interval: float = settings.HEALTH_PROBE_INTERVAL_SECONDS,
+        timeout: float = settings.HEALTH_DB_TIMEOUT_SECONDS,
+    ):
+        self.router = router
+        self.feed = feed
+        self.monitor = monitor or loop_monitor
+        self.interval = interval
+        self.timeout = timeout
+        self.state: Optional[HealthState] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @staticmethod
+    async def _select_one(db_engine: AsyncEngine) -> None:
+        async with db_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    async def _probe_database(self, db_engine: AsyncEngine, name: str) -> str:
+        try:
+            # Connecting counts too: a pool waiting on a dead host must not stall the probe loop
+            await asyncio.wait_for(self._select_one(db_engine), self.timeout)
+            status = "healthy"
+        except Exception as e:
+            logger.error(f"Database health check failed ({name}): {e}")
+            status = "unhealthy"
+        metrics.HEALTH_DATABASE_UP.labels(database=name).set(1 if status == "healthy" else 0)
+        return status
+
+    async def probe(self) -> HealthState:
+        """한 번 프로브해 캐시 갱신 (replica 장애 시 읽기를 primary 로 전환)"""
+        database = await self._probe_database(self.router.primary, "primary")
+        replica = None
+        if self.router.replica is not None:
+            replica = await self._probe_database(self.router.replica, "replica")
+            self.router.mark_replica(replica == "healthy")
+        index_lag = self.feed.freshness_lag if self.feed.running else None
+
+        pools = {}
+        for name, db_engine in self.router.engines.items():
+            usage = pool_usage(db_engine)
+            if usage is None:
+                continue
+            pools[name] = usage
+            metrics.DB_POOL_CONNECTIONS.labels(pool=name, state="checked_out").set(usage["checked_out"])
+            metrics.DB_POOL_CONNECTIONS.labels(pool=name, state="capacity").set(usage["capacity"])
+        loop_lag_ms = self.monitor.take_peak_lag() * 1000
+
+        self.state = HealthState(database, pools, loop_lag_ms, index_lag, replica)
+        return self.state
+
+    async def current(self) -> HealthState:
+        """캐시된 상태 반환 (프로브가 멈춰 오래됐으면 stale 로 표시해 degraded)"""
+        state = self.state
+        if state is None:
+            state = HealthState("unknown", {}, 0.0, None)
+            state.stale = True
+        elif time.monotonic() - state.checked_monotonic > self.interval * 3:
+            state = copy.copy(state)
+            state.stale = True
+        return state
+
+    async def run(self) -> None:
+        """프로브 루프"""
+        while True:
+            try:
+                await self.probe()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Health probe failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        """백그라운드 프로브 시작"""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self.run())
+        logger.info(f"Health monitor started (interval={self.interval}s)")
+
+    async def stop(self) -> None:
+        """백그라운드 프로브 중지"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+# Process-wide monitor serving /health
+health_monitor = HealthMonitor(db_router, change_feed)
@@ -0,0 +1,158 @@
+from collections import deque
+from typing import Deque, Dict, Optional
+from datetime import datetime
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from app.config import settings
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class LoopMonitor:
+    """이벤트 루프 스케줄링 지연 측정과 (디버그 모드) 블로킹 호출 탐지
+
+    interval 초마다 깨어나는 태스크가 예정보다 늦게 깨어난 시간을 히스토그램에
+    기록한다. detect_blocking 이면 별도 스레드가 이 태스크의 마지막 실행 시각을
+    지켜보다가 threshold 이상 멈추면 루프 스레드의 현재 스택을 떠서, 그 순간 실행
+    중인 태스크가 처리하던 경로와 함께 로그로 남긴다. 스택은 멈춘 동안 찍으므로
+    블로킹을 일으킨 바로 그 호출을 가리킨다.
+    """
+
+    def __init__(
+        self,
+        interval: float = settings.LOOP_MONITOR_INTERVAL_SECONDS,
+        threshold_ms: float = settings.LOOP_BLOCKING_THRESHOLD_MS,
+        detect_blocking: bool = settings.DEBUG,
+        history: int = 50,
+    ):
+        self.interval = interval
+        self.threshold = threshold_ms / 1000
+        self.detect_blocking = detect_blocking
+        self.reports: Deque[dict] = deque(maxlen=history)
+        self._routes: Dict[asyncio.Task, str] = {}
+        self._beat = time.monotonic()
+        self._peak_lag = 0.0
+        self._reported_beat: Optional[float] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def run(self) -> None:
+        """지연 측정 루프 (블로킹 탐지 스레드의 심장 박동 역할도 함)"""
+        while True:
+            self._beat = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.monotonic() - self._beat - self.interval)
+            metrics.EVENT_LOOP_SCHEDULING_LAG_SECONDS.observe(lag)
+            self._peak_lag = max(self._peak_lag, lag)
+
+    def take_peak_lag(self) -> float:
+        """마지막 호출 이후 가장 큰 스케줄링 지연(초)을 반환하고 초기화"""
+        peak, self._peak_lag = self._peak_lag, 0.0
+        return peak
+
+    def track(self, task: asyncio.Task, route: str) -> None:
+        self._routes[task] = route
+
+    def untrack(self, task: asyncio.Task) -> None:
+        self._routes.pop(task, None)
+
+    def check(self) -> Optional[dict]:
+        """루프가 threshold 이상 멈춰 있으면 한 번만 보고 (탐지 스레드에서 호출)"""
+        beat = self._beat
+        stalled = time.monotonic() - beat - self.interval
+        if stalled < self.threshold or beat == self._reported_beat:
+            return None
+        frame = sys._current_frames().get(self._loop_thread)
+        if frame is None:
+            return None
+        self._reported_beat = beat
+
+        # Reading the loop's current task from another thread is a plain dict lookup
+        task = asyncio.current_task(self._loop)
+        route = self._routes.get(task) if task is not None else None
+        report = {
+            "detected_at": datetime.now().isoformat(),
+            "blocked_ms": round(stalled * 1000, 1),
+            "route": route,
+            "task": task.get_name() if task is not None else None,
+            "stack": "".join(traceback.format_stack(frame)),
+        }
+        self.reports.append(report)
+        metrics.EVENT_LOOP_BLOCKED_TOTAL.labels(source="request" if route else "background").inc()
+        logger.warning(
+            f"Event loop blocked for {report['blocked_ms']}ms+ "
+            f"(route={route}, task={report['task']}):\n{report['stack']}"
+        )
+        return report
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self.threshold / 4):
+            try:
+                self.check()
+            except Exception as e:
+                logger.error(f"Blocking-call detector failed: {e}")
+
+    def start(self) -> None:
+        """측정 태스크 시작 (디버그 모드면 탐지 스레드도 시작)"""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._task = asyncio.create_task(self.run())
+        if self.detect_blocking:
+            self._stopped.clear()
+            self._watchdog = threading.Thread(target=self._watch, name="loop-blocking-detector", daemon=True)
+            self._watchdog.start()
+        logger.info(f"Loop monitor started (interval={self.interval}s, blocking detector={self.detect_blocking})")
+
+    async def stop(self) -> None:
+        if self._watchdog is not None:
+            self._stopped.set()
+            self._watchdog.join()
+            self._watchdog = None
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+# Process-wide monitor started with the application
+loop_monitor = LoopMonitor()
+
+
+class LoopMonitorMiddleware:
+    """요청을 처리하는 태스크에 경로를 붙여 블로킹 보고에 경로가 나오게 하는 ASGI 미들웨어"""
+
+    def __init__(self, app, monitor: Optional[LoopMonitor] = None):
+        self.app = app
+        self.monitor = monitor or loop_monitor
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.monitor.detect_blocking:
+            await self.app(scope, receive, send)
+            return
+
+        task = asyncio.current_task()
+        self.monitor.track(task, f"{scope['method']} {scope['path']}")
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.monitor.untrack(task)
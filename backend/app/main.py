@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_fastapi_instrumentator import Instrumentator
 from contextlib import asynccontextmanager
@@ -7,8 +8,14 @@ import os
 from datetime import datetime
 
 from app.config import settings
-from app.database import init_db, close_db
-from app.api import search
+from app.database import close_db
+from app.admission import AdmissionControlMiddleware
+from app.health import health_monitor
+from app.loop_monitor import LoopMonitorMiddleware, loop_monitor
+from app.rate_limit import RateLimitMiddleware
+from app.services.latency_sketch import LatencyMiddleware
+from app.startup import startup_state, start_pipeline, shutdown
+from app.api import search, items
 from app.schemas import HealthCheck
 
 # Configure logging   
@@ -27,16 +34,23 @@ async def lifespan(app: FastAPI):
     
     # Skip database initialization if SKIP_DB_INIT is set
     if not os.getenv("SKIP_DB_INIT"):
-        await init_db()
+        # Schema, pool and index warmup run in the background; /ready reports completion
+        start_pipeline()
     else:
         logger.info("Skipping database initialization for performance tests")
+        startup_state.mark_ready()
     
+    loop_monitor.start()
+    health_monitor.start()
     logger.info("Application started successfully")
     
     yield
     
     # Shutdown 
     logger.info("Shutting down SearchPilot API...")
+    await health_monitor.stop()
+    await loop_monitor.stop()
+    await shutdown()
     if not os.getenv("SKIP_DB_INIT"):
         await close_db()
     logger.info("Application shut down successfully")
@@ -50,6 +64,20 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# Admission control (added first so CORS headers also wrap 503 responses)
+if settings.ADMISSION_ENABLED:
+    app.add_middleware(AdmissionControlMiddleware)
+
+# Rate limiting runs before admission so throttled clients never take a queue slot
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+
+# Latency sketches see the full server-side time, including rate limiting and admission queueing
+app.add_middleware(LatencyMiddleware)
+
+# Tags the request's task so blocking-call reports (debug mode) name the route
+app.add_middleware(LoopMonitorMiddleware)
+
 # Configure CORS 
 app.add_middleware(
     CORSMiddleware,
@@ -64,6 +92,7 @@ Instrumentator().instrument(app).expose(app)
 
 # Include routers
 app.include_router(search.router)
+app.include_router(items.router)
 
 
 @app.get("/", tags=["root"])
@@ -100,27 +129,37 @@ async def root():
 
 @app.get("/health", response_model=HealthCheck, tags=["health"])
 async def health_check():
-    """Health check endpoint"""
-    from app.database import engine
-    from sqlalchemy import text
-    
-    # Check database connection
-    try:
-        async with engine.connect() as conn:
-            await conn.execute(text("SELECT 1"))
-        db_status = "healthy"
-    except Exception as e:
-        logger.error(f"Database health check failed: {e}")
-        db_status = "unhealthy"
+    """Health check endpoint - 백그라운드 모니터가 캐시한 결과 반환"""
+    state = await health_monitor.current()
     
     return HealthCheck(
-        status="healthy" if db_status == "healthy" else "degraded",
+        status=state.status,
         version=settings.APP_VERSION,
-        database=db_status,
-        timestamp=datetime.now()
+        database=state.database,
+        timestamp=datetime.now(),
+        replica=state.replica,
+        checked_at=state.checked_at,
+        stale=state.stale,
+        pools=state.pools,
+        event_loop_lag_ms=round(state.event_loop_lag_ms, 1),
+        index_lag_seconds=state.index_lag_seconds,
     )
 
 
+@app.get("/ready", tags=["health"])
+async def readiness_check():
+    """Readiness endpoint - 시작 파이프라인(스키마/풀/인덱스/예열) 완료 전에는 503"""
+    body = {
+        "ready": startup_state.ready,
+        "phase": startup_state.phase,
+        "started_at": startup_state.started_at.isoformat(),
+        "ready_at": startup_state.ready_at.isoformat() if startup_state.ready_at else None,
+        "error": startup_state.error,
+        "details": startup_state.details,
+    }
+    return JSONResponse(status_code=200 if startup_state.ready else 503, content=body)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -0,0 +1,124 @@
+from prometheus_client import Counter, Gauge, Histogram
+
+# Application metrics exported on /metrics next to the HTTP instrumentator metrics
+
+# In-memory search index
+INDEX_ROWS = Gauge(
+    "searchpilot_index_rows",
+    "Rows held by the in-memory search index",
+    ["state"],
+)
+INDEX_CHANGES_TOTAL = Counter(
+    "searchpilot_index_changes_total",
+    "Changes applied to the in-memory search index from the change feed",
+    ["kind"],
+)
+INDEX_FRESHNESS_LAG_SECONDS = Gauge(
+    "searchpilot_index_freshness_lag_seconds",
+    "Seconds since the change feed last caught up with search_items",
+)
+
+# Health monitor
+HEALTH_DATABASE_UP = Gauge(
+    "searchpilot_health_database_up",
+    "Whether the last background database probe succeeded",
+    ["database"],
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "searchpilot_db_pool_connections",
+    "Database pool connections by pool and state",
+    ["pool", "state"],
+)
+EVENT_LOOP_SCHEDULING_LAG_SECONDS = Histogram(
+    "searchpilot_event_loop_scheduling_lag_seconds",
+    "How late the loop monitor's periodic wakeup ran",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+EVENT_LOOP_BLOCKED_TOTAL = Counter(
+    "searchpilot_event_loop_blocked_total",
+    "Event loop stalls past the blocking threshold (debug mode), by request or background task",
+    ["source"],
+)
+
+# Request coalescing
+SINGLEFLIGHT_REQUESTS_TOTAL = Counter(
+    "searchpilot_singleflight_requests_total",
+    "Requests passing through a singleflight group, by leader (executed) or follower (coalesced)",
+    ["name", "role"],
+)
+SINGLEFLIGHT_INFLIGHT = Gauge(
+    "searchpilot_singleflight_inflight",
+    "Executions currently in flight per singleflight group",
+    ["name"],
+)
+SINGLEFLIGHT_COALESCING_RATIO = Gauge(
+    "searchpilot_singleflight_coalescing_ratio",
+    "Share of requests served by another request's execution since process start",
+    ["name"],
+)
+
+# Application caches
+CACHE_REQUESTS_TOTAL = Counter(
+    "searchpilot_cache_requests_total",
+    "Cache lookups by cache and result (hit, stale, miss)",
+    ["cache", "result"],
+)
+
+# Admission control
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "searchpilot_admission_queue_depth",
+    "Requests waiting for an admission slot, per priority class (global = shared gate)",
+    ["priority_class"],
+)
+ADMISSION_INFLIGHT = Gauge(
+    "searchpilot_admission_inflight",
+    "Admitted requests currently running, per priority class",
+    ["priority_class"],
+)
+ADMISSION_SHED_TOTAL = Counter(
+    "searchpilot_admission_shed_total",
+    "Requests rejected with 503 by admission control, by priority class and reason",
+    ["priority_class", "reason"],
+)
+ADMISSION_QUEUE_SECONDS = Histogram(
+    "searchpilot_admission_queue_seconds",
+    "Time admitted requests waited for their slots",
+    ["priority_class"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+# Rate limiting
+RATE_LIMIT_REJECTED_TOTAL = Counter(
+    "searchpilot_rate_limit_rejected_total",
+    "Requests rejected with 429 by the per-client rate limiter, by budget",
+    ["budget"],
+)
+RATE_LIMIT_TRACKED_CLIENTS = Gauge(
+    "searchpilot_rate_limit_tracked_clients",
+    "Token buckets held by the in-process rate limiter",
+)
+
+# Superseded-request cancellation
+SUPERSEDED_REQUESTS_TOTAL = Counter(
+    "searchpilot_superseded_requests_total",
+    "In-flight requests cancelled because a newer request arrived for the same client session",
+    ["name"],
+)
+SUPERSEDED_WORK_SECONDS = Histogram(
+    "searchpilot_superseded_work_seconds",
+    "Time cancelled requests had already run when they were superseded",
+    ["name"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+SUPERSEDE_INFLIGHT = Gauge(
+    "searchpilot_supersede_inflight",
+    "Client sessions with a request currently in flight",
+    ["name"],
+)
+
+# CPU offload of request-path stages
+CPU_OFFLOAD_TASKS_TOTAL = Counter(
+    "searchpilot_cpu_offload_tasks_total",
+    "CPU-bound request stages by where they ran (inline, thread, process)",
+    ["stage", "mode"],
+)
@@ -0,0 +1,90 @@
+from sqlalchemy import inspect, select, update, insert, text
+from sqlalchemy.engine import Connection
+from typing import Callable, Dict, Optional
+import logging
+
+from app.config import settings
+from app.models import Base, SearchItem, SchemaVersion, QuerySketchSnapshot, LatencySketchSnapshot
+from app.services.log_partitions import database_now, mysql_partition_ddl, period_start
+
+logger = logging.getLogger(__name__)
+
+# Bump together with a new MIGRATIONS entry whenever the schema changes
+SCHEMA_VERSION = 5
+
+
+def _index(table, name: str):
+    return next(index for index in table.indexes if index.name == name)
+
+
+def _add_updated_at_index(conn: Connection) -> None:
+    """v2: 변경 피드 워터마크 인덱스 (updated_at, id)"""
+    existing = {index["name"] for index in inspect(conn).get_indexes("search_items")}
+    if "idx_updated_at_id" not in existing:
+        _index(SearchItem.__table__, "idx_updated_at_id").create(conn)
+
+
+def _partition_search_logs(conn: Connection) -> None:
+    """v3: search_logs 를 created_at 범위 파티션으로 전환 (MySQL 만, 집계 테이블은 create_all 이 생성)"""
+    if conn.dialect.name != "mysql":
+        return
+    partitioned = conn.execute(text(
+        "SELECT COUNT(*) FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'search_logs' AND PARTITION_NAME IS NOT NULL"
+    )).scalar()
+    if partitioned:
+        return
+    boundary = period_start(database_now(conn), settings.SEARCH_LOG_PARTITION_PERIOD)
+    for statement in mysql_partition_ddl(boundary):
+        conn.execute(text(statement))
+
+
+def _add_query_sketch_snapshots(conn: Connection) -> None:
+    """v4: 워커별 검색어 빈도 요약 테이블"""
+    QuerySketchSnapshot.__table__.create(conn, checkfirst=True)
+
+
+def _add_latency_sketch_snapshots(conn: Connection) -> None:
+    """v5: 워커별 응답 시간 분위수 요약 테이블"""
+    LatencySketchSnapshot.__table__.create(conn, checkfirst=True)
+
+
+# version -> upgrade step from version - 1; steps must be idempotent
+MIGRATIONS: Dict[int, Callable[[Connection], None]] = {
+    2: _add_updated_at_index,
+    3: _partition_search_logs,
+    4: _add_query_sketch_snapshots,
+    5: _add_latency_sketch_snapshots,
+}
+
+
+def recorded_version(conn: Connection) -> Optional[int]:
+    """기록된 스키마 버전 (기록 없으면 None)"""
+    if not inspect(conn).has_table(SchemaVersion.__tablename__):
+        return None
+    return conn.execute(select(SchemaVersion.version).where(SchemaVersion.id == 1)).scalar()
+
+
+def upgrade(conn: Connection) -> bool:
+    """스키마를 SCHEMA_VERSION 으로 맞추고 DDL 실행 여부 반환
+
+    기록된 버전이 같으면 DDL 을 건너뛴다. 기록이 없는 DB(신규 또는 버전 기록 이전)는
+    create_all 후 모든 마이그레이션을 순서대로 적용한다.
+    """
+    current = recorded_version(conn)
+    if current == SCHEMA_VERSION:
+        return False
+    if current is not None and current > SCHEMA_VERSION:
+        logger.warning(f"Database schema version {current} is newer than {SCHEMA_VERSION}, skipping DDL")
+        return False
+
+    Base.metadata.create_all(conn)
+    for version in range((current or 1) + 1, SCHEMA_VERSION + 1):
+        logger.info(f"Applying schema migration v{version}")
+        MIGRATIONS[version](conn)
+
+    if current is None:
+        conn.execute(insert(SchemaVersion).values(id=1, version=SCHEMA_VERSION))
+    else:
+        conn.execute(update(SchemaVersion).where(SchemaVersion.id == 1).values(version=SCHEMA_VERSION))
+    return True
@@ -1,10 +1,18 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Index, LargeBinary
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 from datetime import datetime
 
 Base = declarative_base()
 
+# SQLite stores server-side CURRENT_TIMESTAMP without fractional seconds. Bind Python
+# datetimes in the same format so comparisons behave like MySQL DATETIME columns.
+Timestamp = DateTime().with_variant(
+    sqlite.DATETIME(storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"),
+    "sqlite"
+)
+
 
 class SearchItem(Base):
     """검색 대상 아이템 모델"""
@@ -17,8 +25,8 @@ class SearchItem(Base):
     tags = Column(String(500), nullable=True)
     price = Column(Float, nullable=True)
     popularity = Column(Integer, nullable=False, default=0, server_default="0")
-    created_at = Column(DateTime, default=func.now())
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    created_at = Column(Timestamp, default=func.now())
+    updated_at = Column(Timestamp, default=func.now(), onupdate=func.now())
     
     def __init__(self, **kwargs):
         # Set default value for popularity if not provided
@@ -31,6 +39,8 @@ class SearchItem(Base):
         Index('idx_title_fulltext', 'title', mysql_prefix='FULLTEXT'),
         Index('idx_description_fulltext', 'description', mysql_prefix='FULLTEXT'),
         Index('idx_category_price', 'category', 'price'),
+        # Change feed watermark scans (updated_at, id)
+        Index('idx_updated_at_id', 'updated_at', 'id'),
     )
 
 
@@ -42,5 +52,50 @@ class SearchLog(Base):
     query = Column(String(255), nullable=False, index=True)
     result_count = Column(Integer, default=0)
     response_time_ms = Column(Float, nullable=True)
-    created_at = Column(DateTime, default=func.now(), index=True)
+    created_at = Column(Timestamp, default=func.now(), index=True)
+
+
+class SearchLogRollup(Base):
+    """보존 기간이 지나 삭제된 검색 로그의 기간/검색어별 집계"""
+    __tablename__ = "search_log_rollups"
+    
+    period_start = Column(Timestamp, primary_key=True)
+    query = Column(String(255), primary_key=True)
+    searches = Column(Integer, nullable=False, default=0)
+    total_results = Column(Integer, nullable=False, default=0)
+    # Sum and count of non-null response times, so averages can be recombined
+    total_response_time_ms = Column(Float, nullable=False, default=0.0)
+    timed_searches = Column(Integer, nullable=False, default=0)
+    last_searched = Column(Timestamp, nullable=True)
+
+
+class QuerySketchSnapshot(Base):
+    """워커별 검색어 빈도 요약 (Count-Min Sketch 카운터 + SpaceSaving top-k)"""
+    __tablename__ = "query_sketch_snapshots"
+    
+    worker_id = Column(String(128), primary_key=True)
+    updated_at = Column(Timestamp, nullable=False, index=True)
+    width = Column(Integer, nullable=False)
+    depth = Column(Integer, nullable=False)
+    counts = Column(LargeBinary, nullable=False)  # little-endian float32, depth x width
+    top = Column(Text, nullable=False)  # JSON {query: [count, error, last_seen]}
+
+
+class LatencySketchSnapshot(Base):
+    """워커별 응답 시간 분위수 요약 (엔드포인트/상위 검색어별 DDSketch)"""
+    __tablename__ = "latency_sketch_snapshots"
+    
+    worker_id = Column(String(128), primary_key=True)
+    kind = Column(String(16), primary_key=True)  # endpoint | query
+    name = Column(String(255), primary_key=True)
+    updated_at = Column(Timestamp, nullable=False, index=True)
+    sketch = Column(Text, nullable=False)  # JSON {accuracy, zero, bins: [[index, count], ...]}
+
 
+class SchemaVersion(Base):
+    """스키마 버전 기록 모델"""
+    __tablename__ = "schema_version"
+    
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False)
+    applied_at = Column(Timestamp, default=func.now(), onupdate=func.now())
@@ -0,0 +1,200 @@
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+import ipaddress
+import json
+import logging
+import math
+import time
+
+from app.config import settings
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class Budget:
+    """엔드포인트 그룹별 토큰 버킷 예산 (초당 rate 개 충전, 최대 burst 개)"""
+
+    def __init__(self, name: str, rate: float, burst: float):
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+
+
+class RateLimitBackend:
+    """토큰 버킷 저장소 인터페이스
+
+    take 는 버킷에서 cost 만큼 꺼내고 (허용 여부, 재시도까지 남은 초) 를 반환한다.
+    여러 파드가 한도를 공유하려면 이 인터페이스를 공유 저장소(예: Redis 스크립트)로
+    구현해 RateLimiter 에 넘긴다.
+    """
+
+    async def take(self, key: str, rate: float, burst: float, cost: float = 1.0) -> Tuple[bool, float]:
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        pass
+
+
+class MemoryTokenBuckets(RateLimitBackend):
+    """프로세스 내 토큰 버킷 (최대 max_keys 개, 오래 쓰이지 않은 버킷부터 제거)
+
+    제거된 버킷은 다음 요청 때 가득 찬 상태로 다시 만들어지므로, 한도를 넘긴
+    클라이언트만 제거되는 일이 없도록 max_keys 는 동시 활성 클라이언트보다 넉넉히 잡는다.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def take(self, key: str, rate: float, burst: float, cost: float = 1.0) -> Tuple[bool, float]:
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (burst, now))
+        tokens = min(burst, tokens + (now - updated) * rate)
+
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+        self._buckets[key] = (tokens, now)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+
+        retry_after = 0.0 if allowed else (cost - tokens) / rate if rate > 0 else math.inf
+        return allowed, retry_after
+
+    def reset(self) -> None:
+        self._buckets.clear()
+
+
+class RateLimiter:
+    """클라이언트 키 x 엔드포인트 예산 단위 속도 제한
+
+    저장소 오류 시에는 요청을 허용한다 (fail open).
+    """
+
+    def __init__(self, backend: RateLimitBackend, budgets: Dict[str, Optional[Budget]], default: Budget):
+        self.backend = backend
+        self.budgets = budgets
+        self.default = default
+
+    def budget_for(self, path: str) -> Optional[Budget]:
+        """경로의 예산 (제한 대상이 아니면 None)"""
+        if path in self.budgets:
+            return self.budgets[path]
+        return self.default if path.startswith("/api/") else None
+
+    async def check(self, client: str, budget: Budget) -> Tuple[bool, float]:
+        try:
+            allowed, retry_after = await self.backend.take(f"{budget.name}:{client}", budget.rate, budget.burst)
+        except Exception as e:
+            logger.warning(f"Rate limit backend failed, allowing request: {e!r}")
+            return True, 0.0
+        if not allowed:
+            metrics.RATE_LIMIT_REJECTED_TOTAL.labels(budget=budget.name).inc()
+        return allowed, retry_after
+
+    def reset(self) -> None:
+        self.backend.reset()
+
+
+@lru_cache(maxsize=8)
+def _trusted_networks(spec: str) -> tuple:
+    return tuple(ipaddress.ip_network(cidr.strip(), strict=False) for cidr in spec.split(",") if cidr.strip())
+
+
+def _is_trusted(address: str, networks: tuple) -> bool:
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in networks)
+
+
+def client_key(scope) -> str:
+    """요청 클라이언트 식별자
+
+    연결한 쪽이 RATE_LIMIT_TRUSTED_PROXIES 안의 프록시일 때만 X-Forwarded-For 를
+    오른쪽(가장 가까운 홉)부터 읽어 신뢰하는 프록시가 아닌 첫 주소를 쓴다. 그보다
+    왼쪽 주소는 클라이언트가 마음대로 넣을 수 있으므로 쓰지 않는다.
+    """
+    client = scope.get("client")
+    peer = client[0] if client else "unknown"
+    networks = _trusted_networks(settings.RATE_LIMIT_TRUSTED_PROXIES)
+    if not networks or not _is_trusted(peer, networks):
+        return peer
+
+    hops = [
+        hop.strip()
+        for name, value in scope.get("headers", [])
+        if name == b"x-forwarded-for"
+        for hop in value.decode("latin-1").split(",")
+    ]
+    hops = [hop for hop in hops if hop]
+    for hop in reversed(hops):
+        if not _is_trusted(hop, networks):
+            return hop
+    # Every hop is a proxy: the leftmost is the closest thing to a client
+    return hops[0] if hops else peer
+
+
+def default_limiter() -> RateLimiter:
+    """설정값으로 기본 속도 제한기 생성"""
+    autocomplete = Budget("autocomplete", settings.RATE_LIMIT_AUTOCOMPLETE_RATE, settings.RATE_LIMIT_AUTOCOMPLETE_BURST)
+    aggregates = Budget("aggregates", settings.RATE_LIMIT_AGGREGATE_RATE, settings.RATE_LIMIT_AGGREGATE_BURST)
+    export = Budget("export", settings.RATE_LIMIT_EXPORT_RATE, settings.RATE_LIMIT_EXPORT_BURST)
+    budgets = {
+        "/api/autocomplete": autocomplete,
+        "/api/search/popular": aggregates,
+        "/api/search/stats": aggregates,
+        "/api/search/analytics": aggregates,
+        "/api/search/export": export,
+        "/api/search/cache-stats": None,
+    }
+    default = Budget("default", settings.RATE_LIMIT_DEFAULT_RATE, settings.RATE_LIMIT_DEFAULT_BURST)
+    return RateLimiter(MemoryTokenBuckets(settings.RATE_LIMIT_MAX_CLIENTS), budgets, default)
+
+
+# Process-wide limiter; swap rate_limiter.backend for a shared store to coordinate pods
+rate_limiter = default_limiter()
+metrics.RATE_LIMIT_TRACKED_CLIENTS.set_function(
+    lambda: len(rate_limiter.backend) if isinstance(rate_limiter.backend, MemoryTokenBuckets) else 0
+)
+
+
+class RateLimitMiddleware:
+    """속도 제한 ASGI 미들웨어 (초과 시 429 + Retry-After)"""
+
+    def __init__(self, app, limiter: Optional[RateLimiter] = None):
+        self.app = app
+        self.limiter = limiter or rate_limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        budget = self.limiter.budget_for(scope["path"])
+        if budget is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed, retry_after = await self.limiter.check(client_key(scope), budget)
+        if allowed:
+            await self.app(scope, receive, send)
+            return
+
+        body = json.dumps({"detail": "Too many requests", "budget": budget.name}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(min(retry_after, 3600)))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Dict, Optional, List
 from datetime import datetime
 
 
@@ -57,6 +57,41 @@ class SearchResponse(BaseModel):
     suggestions: Optional[List[str]] = None
 
 
+class ItemsRequest(BaseModel):
+    """아이템 일괄 조회 요청 스키마"""
+    ids: List[int] = Field(..., min_length=1, max_length=100, description="아이템 id 목록 (최대 100개)")
+
+
+class ItemsResponse(BaseModel):
+    """아이템 일괄 조회 응답 스키마 (요청 순서, 없는 id 는 missing)"""
+    items: List[SearchItem]
+    missing: List[int]
+
+
+class BatchSearchRequest(BaseModel):
+    """배치 검색 요청 스키마"""
+    queries: List[SearchQuery] = Field(..., min_length=1, max_length=50, description="검색 쿼리 목록 (최대 50개)")
+
+
+class BatchSearchResult(BaseModel):
+    """배치 검색 개별 결과 스키마 (실패 시 error 만 채워짐)"""
+    query: str
+    total: int = 0
+    page: int
+    size: int
+    total_pages: int = 0
+    items: List[SearchItem] = []
+    response_time_ms: float = 0.0
+    error: Optional[str] = None
+
+
+class BatchSearchResponse(BaseModel):
+    """배치 검색 응답 스키마 (요청 순서 유지)"""
+    results: List[BatchSearchResult]
+    unique_queries: int
+    response_time_ms: float
+
+
 class AutocompleteResponse(BaseModel):
     """자동완성 응답 스키마"""
     suggestions: List[str]
@@ -69,12 +104,21 @@ class SuggestionResponse(BaseModel):
     recent: List[str]
 
 
+class LatencyPercentiles(BaseModel):
+    """응답 시간 분위수 스키마 (DDSketch 추정, 상대 오차 약 1%)"""
+    count: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
 class SearchStats(BaseModel):
     """검색 통계 스키마"""
     total_items: int
     total_searches: int
     avg_response_time_ms: float
     popular_queries: List[dict]
+    latency: Dict[str, LatencyPercentiles] = {}
 
 
 class HealthCheck(BaseModel):
@@ -83,6 +127,12 @@ class HealthCheck(BaseModel):
     version: str
     database: str
     timestamp: datetime
+    replica: Optional[str] = None
+    checked_at: Optional[datetime] = None
+    stale: bool = False
+    pools: Optional[dict] = None
+    event_loop_lag_ms: Optional[float] = None
+    index_lag_seconds: Optional[float] = None
 
 
 class SearchAnalytics(BaseModel):
@@ -93,6 +143,7 @@ class SearchAnalytics(BaseModel):
     timestamp: datetime
     user_agent: Optional[str] = None
     ip_address: Optional[str] = None
+    latency: Optional[LatencyPercentiles] = None
 
 
 class PopularQueries(BaseModel):
@@ -0,0 +1,167 @@
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+import time
+
+from app.config import settings
+from app.services.search_service import ascii_fold
+from app import metrics
+
+
+# Candidate loader result: (title, smallest id with that title)
+Candidate = Tuple[str, int]
+
+
+class _Entry:
+    __slots__ = ("titles", "ids", "complete", "stored_at")
+
+    def __init__(self, titles: List[str], ids: List[int], complete: bool):
+        self.titles = titles
+        self.ids = ids
+        self.complete = complete
+        self.stored_at = time.monotonic()
+
+
+class AutocompleteCache:
+    """자동완성 접두어 후보 캐시 (짧은 접두어 결과를 걸러 긴 접두어에 응답)
+
+    미스일 때 candidate_limit 개까지 후보를 조회해 저장한다. 조회 결과가 한도보다
+    적으면 그 접두어로 시작하는 제목 전체이므로(complete), 이 접두어로 시작하는 더 긴
+    입력은 DB 조회 없이 후보를 걸러서 답한다.
+
+    변경 피드 리스너로 등록되어 제목이 실제로 바뀐 행에 걸린 접두어만 비운다. 후보마다
+    그 제목을 가진 가장 작은 id(대표 id)를 함께 저장해, 대표 행의 제목이 바뀌거나
+    삭제되면 그 제목이 든 접두어를, 새 제목으로 시작하는 완전한 목록에 새 제목이
+    없으면 그 접두어를 비운다. 피드가 멈춘 경우를 대비해 항목마다 ttl 이 지나면 다시 조회한다.
+    """
+
+    def __init__(self, capacity: int, ttl: float, candidate_limit: int):
+        self.capacity = capacity
+        self.ttl = ttl
+        self.candidate_limit = candidate_limit
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        # Representative id -> (cached title, prefixes listing it)
+        self._by_id: Dict[int, Tuple[str, Set[str]]] = {}
+        self.hits = 0
+        self.refined = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, prefix: str, limit: int, loader: Callable[[int], Awaitable[List[Candidate]]]) -> List[str]:
+        """prefix 의 제안 최대 limit 개 (캐시로 답할 수 없으면 loader(candidate_limit) 호출)"""
+        # LIKE wildcards in the input cannot be answered by a plain prefix filter
+        if limit > self.candidate_limit or any(c in prefix for c in "%_\\"):
+            return [title for title, _ in await loader(limit)]
+
+        key = ascii_fold(prefix)
+        cached = self._lookup(key, limit)
+        if cached is not None:
+            return cached
+
+        self.misses += 1
+        metrics.CACHE_REQUESTS_TOTAL.labels(cache="autocomplete", result="miss").inc()
+        candidates = await loader(self.candidate_limit)
+        titles = [title for title, _ in candidates]
+        self._put(key, titles, [row_id for _, row_id in candidates], complete=len(candidates) < self.candidate_limit)
+        return titles[:limit]
+
+    def _lookup(self, key: str, limit: int) -> Optional[List[str]]:
+        now = time.monotonic()
+        entry = self._fresh(key, now)
+        if entry is not None and (entry.complete or len(entry.titles) >= limit):
+            self.hits += 1
+            metrics.CACHE_REQUESTS_TOTAL.labels(cache="autocomplete", result="hit").inc()
+            return entry.titles[:limit]
+
+        # Longest cached shorter prefix whose candidate list is complete
+        for length in range(len(key) - 1, 0, -1):
+            entry = self._fresh(key[:length], now)
+            if entry is None or not entry.complete:
+                continue
+            matches = [i for i, title in enumerate(entry.titles) if ascii_fold(title[:len(key)]) == key]
+            titles = [entry.titles[i] for i in matches]
+            self._put(key, titles, [entry.ids[i] for i in matches], complete=True)
+            self.refined += 1
+            metrics.CACHE_REQUESTS_TOTAL.labels(cache="autocomplete", result="refined").inc()
+            return titles[:limit]
+        return None
+
+    def _fresh(self, key: str, now: float) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if now - entry.stored_at >= self.ttl:
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _put(self, key: str, titles: List[str], ids: List[int], complete: bool) -> None:
+        self._drop(key)
+        self._entries[key] = _Entry(titles, ids, complete)
+        for title, row_id in zip(titles, ids):
+            self._by_id.setdefault(row_id, (title, set()))[1].add(key)
+        while len(self._entries) > self.capacity:
+            self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for row_id in entry.ids:
+            tracked = self._by_id.get(row_id)
+            if tracked is None:
+                continue
+            tracked[1].discard(key)
+            if not tracked[1]:
+                del self._by_id[row_id]
+
+    def apply_changes(self, rows: Sequence[Sequence], deleted_ids: Sequence[int]) -> None:
+        """변경 피드 리스너: 제목이 바뀌거나 삭제된 행에 영향받는 접두어만 비움 (rows 는 FEED_COLUMNS 순서)"""
+        stale: Set[str] = set()
+        for row in rows:
+            tracked = self._by_id.get(row.id)
+            if tracked is not None and tracked[0] != row.title:
+                # The title may be gone now; prefixes listing it must be reloaded
+                stale.update(tracked[1])
+            if row.title:
+                folded = ascii_fold(row.title)
+                for length in range(1, len(folded) + 1):
+                    entry = self._entries.get(folded[:length])
+                    # Truncated lists stay valid: they never promised every match
+                    if entry is not None and entry.complete and row.title not in entry.titles:
+                        stale.add(folded[:length])
+        for row_id in deleted_ids:
+            tracked = self._by_id.get(row_id)
+            if tracked is not None:
+                stale.update(tracked[1])
+
+        for key in stale:
+            self._drop(key)
+        self.invalidated += len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_id.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.refined + self.misses
+        return {
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "refined": self.refined,
+            "misses": self.misses,
+            "invalidated": self.invalidated,
+            "hit_ratio": round((self.hits + self.refined) / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Process-wide cache, registered on the change feed at startup
+autocomplete_cache = AutocompleteCache(
+    settings.AUTOCOMPLETE_CACHE_SIZE,
+    settings.AUTOCOMPLETE_CACHE_TTL_SECONDS,
+    settings.AUTOCOMPLETE_CANDIDATE_LIMIT
+)
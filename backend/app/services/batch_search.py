@@ -0,0 +1,65 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Callable, List, Tuple, Union
+import asyncio
+import logging
+
+from app.schemas import SearchQuery
+from app.services.search_service import SearchService, query_key
+
+logger = logging.getLogger(__name__)
+
+SearchOutcome = Union[Tuple[list, int, float], Exception]
+
+
+def error_message(error: Exception) -> str:
+    """클라이언트에 돌려줄 실패 사유 (예외 내용은 SQL/파라미터를 담을 수 있어 서버 로그에만 남김)"""
+    return "timeout" if isinstance(error, asyncio.TimeoutError) else "internal error"
+
+
+async def run_batch(
+    queries: List[SearchQuery],
+    sessions: Callable[[], AsyncSession],
+    concurrency: int,
+    timeout: float,
+) -> Tuple[List[SearchOutcome], int]:
+    """여러 검색을 한 번에 실행하고 (요청 순서의 결과 목록, 고유 쿼리 수) 반환
+
+    같은 키의 쿼리는 한 번만 실행한다. 최대 concurrency 개의 세션을 열어 두고
+    돌려 쓰므로 동시 실행 수도 그만큼으로 제한된다. 개별 쿼리의 실패/시간 초과는
+    해당 위치에 예외로 담기고 나머지 결과에는 영향이 없다. 검색 로그는 남기지 않는다.
+    """
+    keys = [query_key(query) for query in queries]
+    unique = {}
+    for key, query in zip(keys, queries):
+        unique.setdefault(key, query)
+
+    pool: asyncio.Queue = asyncio.Queue()
+    opened = [sessions() for _ in range(max(1, min(concurrency, len(unique))))]
+    for db in opened:
+        pool.put_nowait(db)
+
+    async def run(query: SearchQuery) -> SearchOutcome:
+        db = await pool.get()
+        try:
+            return await asyncio.wait_for(SearchService(db).search(query, log=False), timeout)
+        except Exception as e:
+            if isinstance(e, asyncio.TimeoutError):
+                logger.warning(f"Batch query '{query.q}' timed out after {timeout}s")
+            else:
+                logger.exception(f"Batch query '{query.q}' failed")
+            # A query interrupted mid-flight may leave the session unusable; swap it out
+            await db.close()
+            db = sessions()
+            opened.append(db)
+            return e
+        finally:
+            pool.put_nowait(db)
+
+    try:
+        outcomes = await asyncio.gather(*(run(query) for query in unique.values()))
+    finally:
+        for db in opened:
+            await db.close()
+
+    by_key = dict(zip(unique, outcomes))
+    return [by_key[key] for key in keys], len(unique)
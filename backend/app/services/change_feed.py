@@ -0,0 +1,235 @@
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import select, func, or_, and_
+from typing import Dict, List, Optional, Sequence, Tuple
+from datetime import datetime, timedelta
+import numpy as np
+import asyncio
+import hashlib
+import logging
+import time
+
+from app.config import settings
+from app.models import SearchItem
+from app.services.search_index import SearchIndex, INDEX_COLUMNS, BUILD_BATCH_SIZE, search_index
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
+# Columns of the rows passed to listeners: the index columns, then updated_at and title
+FEED_COLUMNS = (*INDEX_COLUMNS, SearchItem.updated_at, SearchItem.title)
+_UPDATED_AT = len(INDEX_COLUMNS)
+
+
+class ChangeFeed:
+    """search_items 변경 피드
+
+    (updated_at, id) 워터마크 이후 변경된 행을 주기적으로 폴링해 리스너에 upsert 로 전달하고,
+    주기적인 id 집합 대조(reconcile)로 삭제를 감지한다. 리스너는
+    apply_changes(rows, deleted_ids) 를 구현하며 rows 는 FEED_COLUMNS 순서다.
+
+    updated_at 은 초 단위로 저장될 수 있어, 매 폴링은 워터마크보다 lookback 만큼
+    앞에서 읽는다. 겹쳐 읽힌 행 중 이미 같은 내용으로 전달한 행은 건너뛰므로
+    (lookback 구간의 행만 기억) 변경이 없으면 폴링은 아무것도 전달하지 않는다.
+
+    data_version 은 (워터마크, 행 수, id 합)에서 유도한 데이터 버전이다. 추가/수정은
+    워터마크를, 삭제(tombstone)는 행 수와 id 합을 바꾸므로 같은 버전은 같은 데이터를
+    뜻하고, 같은 DB 를 따라가는 모든 워커에서 같은 값이 된다.
+    """
+
+    def __init__(
+        self,
+        index: SearchIndex,
+        interval: float = settings.INDEX_REFRESH_INTERVAL_SECONDS,
+        batch_size: int = settings.INDEX_REFRESH_BATCH_SIZE,
+        lookback_seconds: float = settings.INDEX_REFRESH_LOOKBACK_SECONDS,
+        reconcile_interval: float = settings.INDEX_RECONCILE_INTERVAL_SECONDS,
+        compaction_ratio: float = settings.INDEX_COMPACTION_RATIO,
+    ):
+        self.index = index
+        self.listeners = [index]
+        self.interval = interval
+        self.batch_size = batch_size
+        self.lookback = timedelta(seconds=lookback_seconds)
+        self.reconcile_interval = reconcile_interval
+        self.compaction_ratio = compaction_ratio
+        self.watermark: Optional[Tuple[datetime, int]] = None
+        self.row_count: Optional[int] = None
+        self.id_sum = 0
+        self.last_caught_up: Optional[float] = None
+        # Rows already delivered inside the lookback window, by id
+        self._seen: Dict[int, tuple] = {}
+        self._last_reconcile = time.monotonic()
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def freshness_lag(self) -> float:
+        """마지막으로 DB 변경을 모두 따라잡은 뒤 경과한 시간(초)"""
+        if self.last_caught_up is None:
+            return 0.0
+        return max(0.0, time.time() - self.last_caught_up)
+
+    @property
+    def data_version(self) -> Optional[str]:
+        """search_items 데이터 버전 (초기화 전이면 None)"""
+        if self.index.ready:
+            count, id_sum = self.index.size - self.index.tombstones, self.index.id_sum
+        elif self.row_count is not None:
+            count, id_sum = self.row_count, self.id_sum
+        else:
+            return None
+        stamp = f"{self.watermark[0].isoformat()}.{self.watermark[1]}" if self.watermark else "empty"
+        return hashlib.sha1(f"{stamp}:{count}:{id_sum}".encode()).hexdigest()[:16]
+
+    def add_listener(self, listener) -> None:
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    async def initialize(self, db: AsyncSession) -> None:
+        """현재 DB 상태로 워터마크 설정 (인덱스 빌드 전에 호출)"""
+        started = time.time()
+        stmt = select(SearchItem.updated_at, SearchItem.id)\
+            .where(SearchItem.updated_at.isnot(None))\
+            .order_by(SearchItem.updated_at.desc(), SearchItem.id.desc())\
+            .limit(1)
+        result = await db.execute(stmt)
+        row = result.first()
+        self.watermark = (row[0], row[1]) if row else None
+        await self._count(db)
+        self.last_caught_up = started
+
+        # The index is built from this state, so the window is already delivered
+        self._seen = {}
+        if self.watermark is not None:
+            result = await db.execute(self._changes_since((self.watermark[0] - self.lookback, 0), None))
+            self._seen = {row.id: tuple(row) for row in result}
+
+    async def _count(self, db: AsyncSession) -> None:
+        """인덱스 없이 data_version 을 계산하기 위한 행 수/id 합 갱신"""
+        result = await db.execute(select(func.count(SearchItem.id), func.coalesce(func.sum(SearchItem.id), 0)))
+        count, id_sum = result.one()
+        self.row_count, self.id_sum = count, int(id_sum)
+
+    def resume(self, watermark: Optional[Tuple[datetime, int]], as_of: float) -> None:
+        """저장된 워터마크에서 재개 (다음 폴링에서 삭제 대조도 수행)"""
+        self.watermark = watermark
+        self.last_caught_up = as_of
+        self._seen = {}
+        self._last_reconcile = float("-inf")
+
+    def _changes_since(self, cursor: Optional[Tuple[datetime, int]], limit: Optional[int]):
+        stmt = select(*FEED_COLUMNS)\
+            .where(SearchItem.updated_at.isnot(None))
+        if cursor is not None:
+            stmt = stmt.where(
+                or_(
+                    SearchItem.updated_at > cursor[0],
+                    and_(SearchItem.updated_at == cursor[0], SearchItem.id > cursor[1])
+                )
+            )
+        stmt = stmt.order_by(SearchItem.updated_at, SearchItem.id)
+        return stmt.limit(limit) if limit else stmt
+
+    async def poll_once(self, db: AsyncSession) -> int:
+        """워터마크 이후 변경분을 리스너에 전달하고 전달한 행 수 반환"""
+        started = time.time()
+        previous = self.watermark
+        cursor = (self.watermark[0] - self.lookback, 0) if self.watermark else None
+        delivered = 0
+
+        while True:
+            result = await db.execute(self._changes_since(cursor, self.batch_size))
+            rows = result.all()
+            if rows:
+                # Re-read overlap rows are delivered again only if they changed
+                fresh = [row for row in rows if self._seen.get(row.id) != tuple(row)]
+                if fresh:
+                    self._notify(fresh, [])
+                    self._seen.update((row.id, tuple(row)) for row in fresh)
+                cursor = (rows[-1].updated_at, rows[-1].id)
+                if self.watermark is None or cursor > self.watermark:
+                    self.watermark = cursor
+                delivered += len(fresh)
+            if len(rows) < self.batch_size:
+                break
+
+        # Rows older than the next poll's starting point are never read again
+        if self.watermark is not None:
+            horizon = self.watermark[0] - self.lookback
+            self._seen = {row_id: row for row_id, row in self._seen.items() if row[_UPDATED_AT] >= horizon}
+
+        # Without the index, the row count for data_version comes from the database
+        if self.watermark != previous and not self.index.ready:
+            await self._count(db)
+        self.last_caught_up = started
+        return delivered
+
+    async def reconcile(self, db: AsyncSession) -> int:
+        """DB id 집합과 인덱스를 대조해 삭제된 id 를 전달하고 그 수를 반환"""
+        self._last_reconcile = time.monotonic()
+        if not self.index.ready:
+            await self._count(db)
+            return 0
+
+        stmt = select(SearchItem.id).order_by(SearchItem.id).execution_options(yield_per=BUILD_BATCH_SIZE)
+        chunks = []
+        result = await db.stream(stmt)
+        async for partition in result.partitions():
+            chunks.append(np.fromiter((row[0] for row in partition), dtype=np.int64, count=len(partition)))
+        db_ids = np.concatenate(chunks) if chunks else np.empty(0, dtype=np.int64)
+
+        deleted = np.setdiff1d(self.index.live_ids(), db_ids, assume_unique=True)
+        if len(deleted):
+            self._notify([], deleted.tolist())
+        return len(deleted)
+
+    def _notify(self, rows: Sequence, deleted_ids: List[int]) -> None:
+        for listener in self.listeners:
+            try:
+                listener.apply_changes(rows, deleted_ids)
+            except Exception as e:
+                logger.error(f"Change feed listener {type(listener).__name__} failed: {e}")
+
+    async def run(self, session_factory: async_sessionmaker) -> None:
+        """폴링 루프 (reconcile/compaction 포함)"""
+        while True:
+            try:
+                async with session_factory() as db:
+                    await self.poll_once(db)
+                    if time.monotonic() - self._last_reconcile >= self.reconcile_interval:
+                        deleted = await self.reconcile(db)
+                        if deleted:
+                            logger.info(f"Change feed detected {deleted} deleted items")
+                if self.index.tombstone_ratio > self.compaction_ratio:
+                    self.index.compact()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Change feed poll failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self, session_factory: async_sessionmaker) -> None:
+        """백그라운드 폴링 시작"""
+        if self.running:
+            return
+        metrics.INDEX_FRESHNESS_LAG_SECONDS.set_function(lambda: self.freshness_lag)
+        self._task = asyncio.create_task(self.run(session_factory))
+        logger.info(f"Change feed started (interval={self.interval}s)")
+
+    async def stop(self) -> None:
+        """백그라운드 폴링 중지"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+
+# Process-wide feed keeping search_index fresh
+change_feed = ChangeFeed(search_index)
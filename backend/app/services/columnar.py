@@ -0,0 +1,149 @@
+import numpy as np
+from typing import Iterable, List, Optional, Sequence, Tuple
+from datetime import datetime
+
+# NULL timestamps sort first, like NULLs in MySQL/SQLite ascending order
+NULL_TIMESTAMP = np.iinfo(np.int64).min
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def to_timestamp(value: Optional[datetime]) -> int:
+    """datetime 을 epoch 마이크로초로 변환"""
+    if value is None:
+        return NULL_TIMESTAMP
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None) - value.utcoffset()
+    delta = value - EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+class ColumnarSnapshot:
+    """search_items 컬럼형 스냅샷
+
+    id 오름차순으로 정렬된 NumPy 컬럼(id, price, popularity, created_at,
+    사전 인코딩된 category)을 보관하고, 후보 행에 대한 벡터화 정렬과
+    argpartition 기반 top-k 선택을 제공한다.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        prices: np.ndarray,
+        popularity: np.ndarray,
+        created_at: np.ndarray,
+        category_codes: np.ndarray,
+        categories: List[str],
+    ):
+        self.ids = ids
+        self.prices = prices
+        self.popularity = popularity
+        self.created_at = created_at
+        self.category_codes = category_codes
+        self.categories = categories
+
+    @classmethod
+    def empty(cls) -> "ColumnarSnapshot":
+        return cls.from_rows([])
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence]) -> "ColumnarSnapshot":
+        """(id, category, price, popularity, created_at) 행으로 스냅샷 생성 (id 오름차순)"""
+        ids, categories, prices, popularity, created_at = [], [], [], [], []
+        for row in rows:
+            ids.append(row[0])
+            categories.append(row[1])
+            prices.append(row[2] if row[2] is not None else np.nan)
+            popularity.append(row[3] or 0)
+            created_at.append(to_timestamp(row[4]))
+
+        names = sorted({category for category in categories if category})
+        lookup = {name: code for code, name in enumerate(names)}
+
+        return cls(
+            ids=np.asarray(ids, dtype=np.int64),
+            prices=np.asarray(prices, dtype=np.float64),
+            popularity=np.asarray(popularity, dtype=np.int64),
+            created_at=np.asarray(created_at, dtype=np.int64),
+            category_codes=np.asarray(
+                [lookup[category] if category else -1 for category in categories],
+                dtype=np.int32,
+            ),
+            categories=names,
+        )
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    def take(self, positions: np.ndarray) -> "ColumnarSnapshot":
+        """지정 행만 담은 새 스냅샷 (카테고리 사전은 공유)"""
+        return ColumnarSnapshot(
+            ids=self.ids[positions],
+            prices=self.prices[positions],
+            popularity=self.popularity[positions],
+            created_at=self.created_at[positions],
+            category_codes=self.category_codes[positions],
+            categories=self.categories,
+        )
+
+    def latest_by_id(self) -> "ColumnarSnapshot":
+        """id 오름차순으로 정렬하고 중복 id 는 마지막 행만 남긴 스냅샷"""
+        order = np.argsort(self.ids, kind="stable")
+        ids = self.ids[order]
+        keep = np.append(ids[1:] != ids[:-1], True) if len(ids) else np.empty(0, dtype=bool)
+        return self.take(order[keep])
+
+    def extend(self, other: "ColumnarSnapshot") -> "ColumnarSnapshot":
+        """행을 덧붙인 새 스냅샷 (other 의 카테고리 코드는 같은 사전 기준)"""
+        merged = ColumnarSnapshot(
+            ids=np.concatenate((self.ids, other.ids)),
+            prices=np.concatenate((self.prices, other.prices)),
+            popularity=np.concatenate((self.popularity, other.popularity)),
+            created_at=np.concatenate((self.created_at, other.created_at)),
+            category_codes=np.concatenate((self.category_codes, other.category_codes)),
+            categories=self.categories,
+        )
+        # New ids are normally above the current maximum; re-sort only when they are not
+        if self.size and other.size and other.ids.min() < self.ids[-1]:
+            merged = merged.take(np.argsort(merged.ids, kind="stable"))
+        return merged
+
+    def positions_of(self, ids: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+        """id 배열의 행 위치와 존재 여부"""
+        ids = np.asarray(ids, dtype=np.int64)
+        positions = np.searchsorted(self.ids, ids)
+        known = positions < self.size
+        known[known] = self.ids[positions[known]] == ids[known]
+        return positions, known
+
+    def sort_key(self, positions: np.ndarray, sort: str, order: str) -> np.ndarray:
+        """후보 행의 오름차순 정렬 키 (SearchService.search 의 ORDER BY 와 동일)"""
+        if sort == "date":
+            key = self.created_at[positions].astype(np.float64)
+        elif sort == "price":
+            key = np.nan_to_num(self.prices[positions], nan=-np.inf)
+        else:  # popularity, relevance
+            key = self.popularity[positions].astype(np.float64)
+
+        descending = order == "desc" or sort not in ("date", "popularity", "price")
+        return -key if descending else key
+
+    def top_k(self, positions: np.ndarray, sort: str, order: str, offset: int, limit: int) -> np.ndarray:
+        """정렬 기준 [offset, offset + limit) 구간의 행 위치"""
+        k = offset + limit
+        if limit <= 0 or offset >= len(positions):
+            return np.empty(0, dtype=np.int64)
+
+        key = self.sort_key(positions, sort, order)
+        if k < len(positions):
+            # Only rows up to the k-th key need ordering; find it in O(n),
+            # keeping every row tied with it so the id tie-break stays exact
+            kth = key[np.argpartition(key, k - 1)[k - 1]]
+            selected = np.flatnonzero(key <= kth)
+        else:
+            selected = np.arange(len(positions))
+
+        # Ties are broken by id so consecutive pages stay consistent
+        ranked = selected[np.lexsort((self.ids[positions[selected]], key[selected]))]
+        return positions[ranked[offset:k]]
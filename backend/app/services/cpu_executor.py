@@ -0,0 +1,81 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Sequence
+import asyncio
+import logging
+import multiprocessing
+
+from app import metrics
+from app.config import settings
+from app.services.highlight import HighlightPage, highlight_cost, highlight_pages
+
+logger = logging.getLogger(__name__)
+
+
+class CpuExecutor:
+    """CPU 작업을 비용에 따라 이벤트 루프 / 스레드 / 프로세스 풀로 보내는 실행기
+
+    cost 가 thread_min_cost 미만이면 루프에서 바로 실행한다(스레드 전환 비용이 더
+    크다). 그 이상은 스레드에서 실행해 GIL 전환 주기마다 루프가 돌 수 있게 하고,
+    process_min_cost 이상은 프로세스 풀에서 실행해 루프를 전혀 막지 않는다. 프로세스
+    풀은 처음 필요할 때 만들며, 인자/결과가 피클링되므로 문자열/ID 배열처럼 가벼운
+    값만 주고받는 함수를 넘겨야 한다. 풀이 깨지면(워커 강제 종료 등) 스레드로
+    실행하고 다음 호출에서 새로 만든다.
+    """
+
+    def __init__(
+        self,
+        processes: int = settings.CPU_OFFLOAD_PROCESSES,
+        threads: int = settings.CPU_OFFLOAD_THREADS,
+        thread_min_cost: int = settings.CPU_OFFLOAD_THREAD_MIN_COST,
+        process_min_cost: int = settings.CPU_OFFLOAD_PROCESS_MIN_COST,
+    ):
+        self.processes = processes
+        self.thread_min_cost = thread_min_cost
+        self.process_min_cost = process_min_cost
+        self._threads = ThreadPoolExecutor(max(1, threads), thread_name_prefix="cpu-offload")
+        self._processes: Optional[ProcessPoolExecutor] = None
+
+    def mode_for(self, cost: int) -> str:
+        if self.processes > 0 and cost >= self.process_min_cost:
+            return "process"
+        if cost >= self.thread_min_cost:
+            return "thread"
+        return "inline"
+
+    def _process_pool(self) -> ProcessPoolExecutor:
+        if self._processes is None:
+            # Forking a process that runs an event loop and DB pools is unsafe
+            method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+            self._processes = ProcessPoolExecutor(self.processes, mp_context=multiprocessing.get_context(method))
+        return self._processes
+
+    async def run(self, stage: str, fn: Callable[..., Any], *args: Any, cost: int) -> Any:
+        """fn(*args) 실행 (fn 은 프로세스 풀에서도 돌 수 있게 모듈 최상위 함수여야 함)"""
+        mode = self.mode_for(cost)
+        metrics.CPU_OFFLOAD_TASKS_TOTAL.labels(stage=stage, mode=mode).inc()
+        if mode == "inline":
+            return fn(*args)
+
+        loop = asyncio.get_running_loop()
+        if mode == "process":
+            try:
+                return await loop.run_in_executor(self._process_pool(), fn, *args)
+            except BrokenProcessPool as e:
+                logger.warning(f"CPU offload process pool broke, running '{stage}' in a thread: {e}")
+                self._processes.shutdown(wait=False, cancel_futures=True)
+                self._processes = None
+        return await loop.run_in_executor(self._threads, fn, *args)
+
+    async def highlight(self, pages: Sequence[HighlightPage]) -> List[List[Optional[str]]]:
+        """페이지별 제목 하이라이트"""
+        return await self.run("highlight", highlight_pages, pages, cost=highlight_cost(pages))
+
+    def shutdown(self) -> None:
+        if self._processes is not None:
+            self._processes.shutdown(wait=False, cancel_futures=True)
+            self._processes = None
+
+
+# Process-wide executor for request-path CPU stages
+cpu_executor = CpuExecutor()
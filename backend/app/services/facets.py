@@ -0,0 +1,60 @@
+import numpy as np
+from typing import List, Optional, Sequence
+
+
+def _bound(value: float) -> Optional[float]:
+    return None if np.isinf(value) else round(float(value), 2)
+
+
+def price_range_facets(prices: np.ndarray, edges: Sequence[float]) -> List[dict]:
+    """고정 가격 구간별 아이템 수
+
+    구간 k 는 [edges[k-1], edges[k]) 이며 양 끝 구간은 열려 있다.
+    """
+    prices = prices[~np.isnan(prices)]
+    edges = np.asarray(sorted(edges), dtype=np.float64)
+    counts = np.bincount(
+        np.searchsorted(edges, prices, side="right"),
+        minlength=len(edges) + 1,
+    )
+
+    bounds = np.concatenate(([-np.inf], edges, [np.inf]))
+    facets = []
+    for bucket, count in enumerate(counts):
+        lo, hi = _bound(bounds[bucket]), _bound(bounds[bucket + 1])
+        facets.append({
+            "key": f"{'*' if lo is None else f'{lo:g}'}-{'*' if hi is None else f'{hi:g}'}",
+            "from": lo,
+            "to": hi,
+            "count": int(count),
+        })
+    return facets
+
+
+def price_histogram(prices: np.ndarray, bins: int) -> List[dict]:
+    """분위수 기반 적응형 가격 히스토그램
+
+    구간 경계를 매치된 가격의 분위수로 정해 각 구간에 비슷한 수의 아이템이 들어가도록 한다.
+    """
+    prices = prices[~np.isnan(prices)]
+    if not len(prices) or bins < 1:
+        return []
+
+    edges = np.unique(np.quantile(prices, np.linspace(0, 1, bins + 1)))
+    if len(edges) == 1:
+        return [{"from": _bound(edges[0]), "to": _bound(edges[0]), "count": len(prices)}]
+
+    counts, _ = np.histogram(prices, bins=edges)
+    return [
+        {"from": _bound(lo), "to": _bound(hi), "count": int(count)}
+        for lo, hi, count in zip(edges[:-1], edges[1:], counts)
+    ]
+
+
+def price_facets(prices: np.ndarray, edges: Sequence[float], bins: int) -> dict:
+    """매치된 가격 배열로 가격 구간/히스토그램 패싯 계산"""
+    prices = np.asarray(prices, dtype=np.float64)
+    return {
+        "price_ranges": price_range_facets(prices, edges),
+        "price_histogram": price_histogram(prices, bins),
+    }
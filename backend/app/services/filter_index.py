@@ -0,0 +1,189 @@
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Bit count of every byte value, used to popcount packed bitmaps
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def pack(mask: np.ndarray) -> np.ndarray:
+    """bool 마스크를 압축 비트맵(uint8)으로 변환"""
+    return np.packbits(np.asarray(mask, dtype=bool))
+
+
+def unpack(bitmap: np.ndarray, size: int) -> np.ndarray:
+    """압축 비트맵을 bool 마스크로 변환"""
+    return np.unpackbits(bitmap, count=size).astype(bool)
+
+
+def popcount(bitmap: np.ndarray) -> int:
+    """비트맵의 1 비트 개수"""
+    return int(_POPCOUNT[bitmap].sum(dtype=np.int64))
+
+
+def _bit_masks(positions: np.ndarray) -> np.ndarray:
+    # np.packbits is big-endian: position 0 is the high bit of byte 0
+    return (0x80 >> (positions & 7)).astype(np.uint8)
+
+
+def set_bits(bitmap: np.ndarray, positions: np.ndarray) -> None:
+    """비트맵의 지정 위치 비트를 1 로 설정"""
+    positions = np.asarray(positions, dtype=np.int64)
+    np.bitwise_or.at(bitmap, positions >> 3, _bit_masks(positions))
+
+
+def clear_bits(bitmap: np.ndarray, positions: np.ndarray) -> None:
+    """비트맵의 지정 위치 비트를 0 으로 설정"""
+    positions = np.asarray(positions, dtype=np.int64)
+    np.bitwise_and.at(bitmap, positions >> 3, ~_bit_masks(positions))
+
+
+class FilterIndex:
+    """카테고리/가격 구간 비트맵 필터 인덱스
+
+    행 위치(position) 기준의 압축 비트맵을 카테고리별, 가격 구간별로 유지한다.
+    결합 필터는 비트 AND/OR, 패싯 카운트는 매치 비트맵과의 popcount로 계산한다.
+    categories 와 prices 는 복사하지 않고 소유자(ColumnarSnapshot)와 공유한다.
+    """
+
+    def __init__(
+        self,
+        category_codes: np.ndarray,
+        categories: List[str],
+        prices: np.ndarray,
+        price_edges: Sequence[float],
+        bitmaps: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ):
+        self.size = len(category_codes)
+        self.categories = categories
+        self.prices = prices
+        self.price_edges = np.asarray(sorted(price_edges), dtype=np.float64)
+        self._category_lookup = {name: code for code, name in enumerate(self.categories)}
+
+        if bitmaps is not None:
+            # Prebuilt bitmaps (e.g. views into a loaded snapshot), one row per category/bucket
+            self._category_bitmaps = list(bitmaps[0])
+            self._price_bitmaps = list(bitmaps[1])
+            return
+
+        self._category_bitmaps = [
+            pack(category_codes == code) for code in range(len(self.categories))
+        ]
+
+        # Bucket k covers [edges[k-1], edges[k]); rows without a price are in no bucket
+        buckets = self.price_buckets(self.prices)
+        self._price_bitmaps = [pack(buckets == k) for k in range(len(self.price_edges) + 1)]
+
+    def export_bitmaps(self) -> Tuple[np.ndarray, np.ndarray]:
+        """카테고리/가격 구간 비트맵을 2차원 배열로 반환 (행 = 카테고리/구간)"""
+        width = len(self.empty())
+        categories = np.stack(self._category_bitmaps) if self._category_bitmaps else np.zeros((0, width), dtype=np.uint8)
+        return categories, np.stack(self._price_bitmaps)
+
+    def empty(self) -> np.ndarray:
+        """빈 비트맵"""
+        return np.zeros((self.size + 7) // 8, dtype=np.uint8)
+
+    def price_buckets(self, prices: np.ndarray) -> np.ndarray:
+        """가격별 구간 번호 (가격이 없으면 -1)"""
+        buckets = np.searchsorted(self.price_edges, prices, side="right")
+        buckets[np.isnan(prices)] = -1
+        return buckets
+
+    def bucket_bounds(self, bucket: int) -> Tuple[float, float]:
+        """가격 구간의 [하한, 상한) 경계"""
+        lo = self.price_edges[bucket - 1] if bucket > 0 else -np.inf
+        hi = self.price_edges[bucket] if bucket < len(self.price_edges) else np.inf
+        return float(lo), float(hi)
+
+    def category_bitmap(self, category: str) -> np.ndarray:
+        """카테고리 비트맵 (없는 카테고리는 빈 비트맵)"""
+        code = self._category_lookup.get(category)
+        if code is None:
+            return self.empty()
+        return self._category_bitmaps[code]
+
+    def price_bitmap(self, min_price: Optional[float], max_price: Optional[float]) -> np.ndarray:
+        """가격 범위 비트맵 (min_price <= price <= max_price)"""
+        lo_bound = -np.inf if min_price is None else min_price
+        hi_bound = np.inf if max_price is None else max_price
+
+        result = self.empty()
+        partial = self.empty()
+        for bucket, bitmap in enumerate(self._price_bitmaps):
+            lo, hi = self.bucket_bounds(bucket)
+            if hi <= lo_bound or lo > hi_bound:
+                continue
+            if lo >= lo_bound and hi <= hi_bound:
+                result |= bitmap
+            else:
+                partial |= bitmap
+
+        # Boundary buckets are only partly inside the range; check their rows exactly
+        positions = np.flatnonzero(unpack(partial, self.size))
+        if len(positions):
+            prices = self.prices[positions]
+            hits = positions[(prices >= lo_bound) & (prices <= hi_bound)]
+            mask = np.zeros(self.size, dtype=bool)
+            mask[hits] = True
+            result |= pack(mask)
+
+        return result
+
+    def filter_bitmap(
+        self,
+        category: Optional[str] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> Optional[np.ndarray]:
+        """필터 조건의 결합 비트맵 (조건이 없으면 None)"""
+        bitmap = None
+        if category:
+            bitmap = self.category_bitmap(category)
+        if min_price is not None or max_price is not None:
+            price = self.price_bitmap(min_price, max_price)
+            bitmap = price if bitmap is None else bitmap & price
+        return bitmap
+
+    def add_category(self, category: str) -> int:
+        """새 카테고리 등록 후 코드 반환"""
+        code = self._category_lookup.get(category)
+        if code is None:
+            code = len(self.categories)
+            self.categories.append(category)
+            self._category_lookup[category] = code
+            self._category_bitmaps.append(self.empty())
+        return code
+
+    def code_of(self, category: Optional[str]) -> int:
+        """카테고리 코드 (없으면 -1)"""
+        return self._category_lookup.get(category, -1) if category else -1
+
+    def clear_rows(self, positions: np.ndarray, codes: np.ndarray, prices: np.ndarray) -> None:
+        """행들의 카테고리/가격 구간 비트를 해제"""
+        self._apply_rows(positions, codes, prices, clear_bits)
+
+    def set_rows(self, positions: np.ndarray, codes: np.ndarray, prices: np.ndarray) -> None:
+        """행들의 카테고리/가격 구간 비트를 설정"""
+        self._apply_rows(positions, codes, prices, set_bits)
+
+    def _apply_rows(self, positions, codes, prices, apply) -> None:
+        positions = np.asarray(positions, dtype=np.int64)
+        for code in np.unique(codes[codes >= 0]):
+            apply(self._category_bitmaps[code], positions[codes == code])
+        buckets = self.price_buckets(np.asarray(prices, dtype=np.float64))
+        for bucket in np.unique(buckets[buckets >= 0]):
+            apply(self._price_bitmaps[bucket], positions[buckets == bucket])
+
+    def category_counts(self, match: np.ndarray) -> Dict[str, int]:
+        """매치 비트맵 기준 카테고리별 아이템 수 (내림차순)"""
+        counts = {
+            name: popcount(match & bitmap)
+            for name, bitmap in zip(self.categories, self._category_bitmaps)
+        }
+        return dict(
+            sorted(
+                ((name, count) for name, count in counts.items() if count),
+                key=lambda entry: entry[1],
+                reverse=True,
+            )
+        )
@@ -0,0 +1,335 @@
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+
+import numpy as np
+
+from app.config import settings
+from app.models import QuerySketchSnapshot
+from app.services.log_partitions import log_partitions
+
+logger = logging.getLogger(__name__)
+
+# Snapshot row holding the seed from search_logs plus the sketches of stopped workers
+BASE_WORKER = "__base__"
+
+
+def normalize_query(query: str) -> str:
+    """집계 키: 앞뒤 공백 제거, 연속 공백 하나로, 소문자"""
+    return " ".join(query.split()).lower()
+
+
+class CountMinSketch:
+    """Count-Min Sketch (depth 개 해시 행 x width 칸, 추정치는 과대 추정만 함)"""
+
+    def __init__(self, width: int, depth: int, counts: Optional[np.ndarray] = None):
+        self.width = width
+        self.depth = depth
+        self.counts = counts if counts is not None else np.zeros((depth, width), dtype=np.float32)
+
+    def _columns(self, key: str) -> np.ndarray:
+        digest = hashlib.blake2b(key.encode(), digest_size=8 * self.depth).digest()
+        return np.frombuffer(digest, dtype="<u8") % np.uint64(self.width)
+
+    def add(self, key: str, count: float = 1.0) -> None:
+        self.counts[np.arange(self.depth), self._columns(key)] += count
+
+    def estimate(self, key: str) -> float:
+        return float(self.counts[np.arange(self.depth), self._columns(key)].min())
+
+    def merge(self, other: "CountMinSketch", weight: float = 1.0) -> None:
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("cannot merge sketches of different shape")
+        self.counts += other.counts * np.float32(weight)
+
+    def scale(self, factor: float) -> None:
+        self.counts *= np.float32(factor)
+
+
+class SpaceSaving:
+    """SpaceSaving top-k (최대 capacity 개 키, 키별 [count, error, last_seen, display])
+
+    꽉 찬 상태에서 새 키가 오면 가장 작은 항목을 내보내고 그 count 를 error 로
+    물려받는다. count - error 는 실제 빈도의 하한이다. display 는 가장 최근에 검색된
+    원래 표기다.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.entries: Dict[str, List[float]] = {}
+
+    def add(self, key: str, count: float = 1.0, seen: float = 0.0, display: Optional[str] = None) -> None:
+        display = display or key
+        entry = self.entries.get(key)
+        if entry is not None:
+            entry[0] += count
+            if seen >= entry[2]:
+                entry[2], entry[3] = seen, display
+            return
+        if len(self.entries) < self.capacity:
+            self.entries[key] = [count, 0.0, seen, display]
+            return
+        victim = min(self.entries, key=lambda k: self.entries[k][0])
+        floor = self.entries.pop(victim)[0]
+        self.entries[key] = [floor + count, floor, seen, display]
+
+    def merge(self, other: "SpaceSaving", weight: float = 1.0) -> None:
+        """두 요약 합치기 (한쪽에 없는 키는 그쪽 최솟값만큼 error 증가)"""
+        own_floor = self.floor if len(self.entries) >= self.capacity else 0.0
+        other_floor = (other.floor if len(other.entries) >= other.capacity else 0.0) * weight
+        merged = {}
+        for key in self.entries.keys() | other.entries.keys():
+            mine = self.entries.get(key, [own_floor, own_floor, 0.0, key])
+            theirs = other.entries.get(key)
+            theirs = [c * weight for c in theirs[:2]] + theirs[2:] if theirs else [other_floor, other_floor, 0.0, key]
+            latest = mine if mine[2] >= theirs[2] else theirs
+            merged[key] = [mine[0] + theirs[0], mine[1] + theirs[1], latest[2], latest[3]]
+        top = sorted(merged.items(), key=lambda item: item[1][0], reverse=True)[:self.capacity]
+        self.entries = dict(top)
+
+    @property
+    def floor(self) -> float:
+        return min((entry[0] for entry in self.entries.values()), default=0.0)
+
+    def scale(self, factor: float) -> None:
+        for entry in self.entries.values():
+            entry[0] *= factor
+            entry[1] *= factor
+
+
+class QuerySketch:
+    """검색어 빈도 스트리밍 요약 (Count-Min Sketch + SpaceSaving, 선택적 시간 감쇠)
+
+    half_life 가 0 보다 크면 빈도가 half_life 초마다 절반으로 줄어 최근 검색어가
+    우선한다. 메모리는 로그 양과 무관하게 O(width x depth + k) 이다.
+    """
+
+    def __init__(self, k: int, width: int, depth: int, half_life: float = 0.0):
+        self.k = k
+        self.half_life = half_life
+        self.cms = CountMinSketch(width, depth)
+        self.top = SpaceSaving(k)
+        self.decayed_at = time.time()
+
+    def record(self, query: str, count: float = 1.0, at: Optional[float] = None) -> None:
+        key = normalize_query(query)
+        if not key:
+            return
+        self.cms.add(key, count)
+        self.top.add(key, count, at or time.time(), query)
+
+    def decay(self, now: Optional[float] = None) -> None:
+        """마지막 감쇠 이후 경과 시간만큼 빈도 감쇠"""
+        now = now or time.time()
+        if self.half_life > 0 and now > self.decayed_at:
+            factor = 0.5 ** ((now - self.decayed_at) / self.half_life)
+            self.cms.scale(factor)
+            self.top.scale(factor)
+        self.decayed_at = now
+
+    @property
+    def observations(self) -> float:
+        """기록된 (감쇠 반영) 검색 수 (CMS 한 행의 합)"""
+        return float(self.cms.counts[0].sum())
+
+    def merge(self, other: "QuerySketch", weight: float = 1.0) -> None:
+        self.cms.merge(other.cms, weight)
+        self.top.merge(other.top, weight)
+
+    def heavy_hitters(self, limit: int) -> List[Tuple[str, float, float]]:
+        """상위 limit 개 (최근 표기, 추정 빈도, 마지막 검색 epoch)
+
+        추정 빈도는 SpaceSaving count 와 CMS 추정치 중 작은 값이다.
+        """
+        estimates = [
+            (entry[3], min(entry[0], self.cms.estimate(key)), entry[2])
+            for key, entry in self.top.entries.items()
+        ]
+        estimates.sort(key=lambda item: item[1], reverse=True)
+        return estimates[:limit]
+
+    def dumps(self) -> Tuple[bytes, str]:
+        """(CMS 카운터 바이트, top-k JSON) 직렬화"""
+        return self.cms.counts.astype("<f4").tobytes(), json.dumps(self.top.entries, ensure_ascii=False)
+
+    @classmethod
+    def loads(cls, counts: bytes, top: str, k: int, width: int, depth: int, half_life: float = 0.0) -> "QuerySketch":
+        sketch = cls(k, width, depth, half_life)
+        sketch.cms.counts = np.frombuffer(counts, dtype="<f4").reshape(depth, width).astype(np.float32)
+        # Entries written before display forms were kept have three fields
+        sketch.top.entries = {key: (list(entry) + [key])[:4] for key, entry in json.loads(top).items()}
+        return sketch
+
+
+class SharedQuerySketch:
+    """워커별 QuerySketch 와 전 워커 병합 스냅샷
+
+    각 워커는 자기 요약을 query_sketch_snapshots 에 주기적으로 덮어쓰고, 모든 행을
+    합쳐 snapshot 을 만든다. 인기 검색어 조회는 snapshot 이 있으면 search_logs 를
+    GROUP BY 하지 않고 snapshot 의 상위 k 개로 답한다.
+
+    오래 갱신되지 않은 워커(종료된 파드)의 행은 버리지 않고 기준 행(BASE_WORKER)에
+    합친 뒤 지우므로, 배포로 워커가 모두 바뀌어도 빈도가 이어진다. 기준 행이 없으면
+    (첫 배포) search_logs 와 만료 집계의 검색어별 합계(started_at 이전)로 한 번 만든다.
+    워커마다 과거 로그를 싣지 않으므로 워커 수만큼 중복 집계되지 않는다.
+
+    snapshot 이 본 검색이 min_observations 보다 적으면 순위를 믿을 수 없으므로 None 을
+    돌려 search_logs 집계로 답하게 한다. 시각은 created_at 과 같은 DB 시계
+    (log_partitions.now())를 쓰고, 검색어는 가장 최근 원래 표기로 돌려준다.
+    """
+
+    def __init__(
+        self,
+        k: int = settings.HEAVY_HITTERS_K,
+        width: int = settings.HEAVY_HITTERS_CMS_WIDTH,
+        depth: int = settings.HEAVY_HITTERS_CMS_DEPTH,
+        half_life: float = settings.HEAVY_HITTERS_HALF_LIFE_SECONDS,
+        interval: float = settings.HEAVY_HITTERS_SYNC_INTERVAL_SECONDS,
+        stale_after: float = settings.HEAVY_HITTERS_STALE_SECONDS,
+        min_observations: float = settings.HEAVY_HITTERS_MIN_OBSERVATIONS,
+    ):
+        self.k = k
+        self.width = width
+        self.depth = depth
+        self.half_life = half_life
+        self.interval = interval
+        self.stale_after = timedelta(seconds=stale_after)
+        self.min_observations = min_observations
+        self.worker_id = f"{os.getenv('HOSTNAME', 'local')}:{os.getpid()}"
+        self.local = QuerySketch(k, width, depth, half_life)
+        self.snapshot: Optional[QuerySketch] = None
+        self.merged_workers = 0
+        # Searches before this are in search_logs and may seed the base row; reset when run() starts
+        self.started_at = log_partitions.now()
+
+    def record(self, queries: Iterable[str]) -> None:
+        for query in queries:
+            self.local.record(query)
+
+    @property
+    def ready(self) -> bool:
+        return self.snapshot is not None and self.snapshot.observations >= self.min_observations
+
+    def top_queries(self, limit: int) -> Optional[List[Tuple[str, float, datetime]]]:
+        """병합 스냅샷의 상위 (검색어, 추정 빈도, 마지막 검색 시각) (관측이 부족하면 None)"""
+        if not self.ready:
+            return None
+        return [
+            (query, count, log_partitions.from_epoch(seen))
+            for query, count, seen in self.snapshot.heavy_hitters(limit)
+        ]
+
+    def _weight(self, updated_at: datetime, now: datetime) -> float:
+        """updated_at 에 감쇠된 행을 now 시점으로 맞추는 가중치"""
+        age = (now - updated_at).total_seconds()
+        return 0.5 ** (age / self.half_life) if self.half_life > 0 and age > 0 else 1.0
+
+    def _load(self, row) -> QuerySketch:
+        return QuerySketch.loads(row.counts, row.top, self.k, self.width, self.depth)
+
+    async def _seed(self, db: AsyncSession, now: datetime) -> QuerySketch:
+        """started_at 이전 search_logs 와 만료 집계의 검색어별 합계로 만든 요약"""
+        if log_partitions.needs_refresh():
+            await (await db.connection()).run_sync(log_partitions.refresh)
+        totals = log_partitions.query_totals(until=self.started_at)
+        result = await db.execute(
+            select(totals.c.query, totals.c.searches, totals.c.last_searched)
+            .order_by(totals.c.searches.desc())
+            .limit(settings.HEAVY_HITTERS_SEED_QUERIES)
+        )
+        seed = QuerySketch(self.k, self.width, self.depth, self.half_life)
+        for query, searches, last_searched in result:
+            seen = log_partitions.to_epoch(last_searched or now)
+            seed.record(query, searches * self._weight(last_searched or now, now), at=seen)
+        return seed
+
+    async def _retire_stale(self, db: AsyncSession, now: datetime) -> None:
+        """멈춘 워커의 행을 기준 행에 합치고 삭제 (기준 행이 없으면 search_logs 로 생성)"""
+        table = QuerySketchSnapshot.__table__
+        # Row locks keep two workers from folding the same rows (SQLite serializes writers anyway)
+        result = await db.execute(select(table).where(
+            (table.c.worker_id == BASE_WORKER) | (table.c.updated_at < now - self.stale_after)
+        ).with_for_update())
+        rows = result.fetchall()
+        base = next((row for row in rows if row.worker_id == BASE_WORKER), None)
+        stale = [row for row in rows if row.worker_id != BASE_WORKER]
+        if base is not None and (base.width, base.depth) != (self.width, self.depth):
+            base = None
+        if base is not None and not stale:
+            return
+
+        if base is not None:
+            merged = self._load(base)
+            merged.cms.scale(self._weight(base.updated_at, now))
+            merged.top.scale(self._weight(base.updated_at, now))
+        else:
+            merged = await self._seed(db, now)
+        for row in stale:
+            if (row.width, row.depth) == (self.width, self.depth):
+                merged.merge(self._load(row), self._weight(row.updated_at, now))
+
+        counts, top = merged.dumps()
+        await db.execute(delete(table).where(table.c.worker_id.in_([BASE_WORKER, *(row.worker_id for row in stale)])))
+        await db.execute(table.insert().values(
+            worker_id=BASE_WORKER, updated_at=now, width=self.width, depth=self.depth, counts=counts, top=top
+        ))
+
+    async def sync(self, db: AsyncSession, now: Optional[datetime] = None) -> None:
+        """자기 요약을 저장하고 모든 요약을 병합해 snapshot 갱신"""
+        now = now or log_partitions.now()
+        self.local.decay()
+        counts, top = self.local.dumps()
+
+        table = QuerySketchSnapshot.__table__
+        await db.execute(delete(table).where(table.c.worker_id == self.worker_id))
+        await db.execute(table.insert().values(
+            worker_id=self.worker_id, updated_at=now, width=self.width, depth=self.depth, counts=counts, top=top
+        ))
+        await self._retire_stale(db, now)
+        await db.commit()
+
+        result = await db.execute(select(table).where(
+            table.c.width == self.width, table.c.depth == self.depth
+        ))
+        merged = QuerySketch(self.k, self.width, self.depth, self.half_life)
+        workers = 0
+        for row in result:
+            # Rows were decayed when written; bring them to a common point in time
+            merged.merge(self._load(row), self._weight(row.updated_at, now))
+            workers += row.worker_id != BASE_WORKER
+        self.snapshot = merged
+        self.merged_workers = workers
+
+    async def run(self, session_factory: Callable[[], AsyncSession]) -> None:
+        """주기적 동기화 루프"""
+        # Startup has measured the DB clock by now; earlier searches were not recorded here
+        self.started_at = log_partitions.now()
+        while True:
+            try:
+                async with session_factory() as db:
+                    await self.sync(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Query sketch sync failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict:
+        return {
+            "worker_id": self.worker_id,
+            "tracked_queries": len(self.local.top.entries),
+            "merged_workers": self.merged_workers,
+            "observations": round(self.snapshot.observations, 1) if self.snapshot is not None else 0.0,
+            "snapshot_ready": self.ready,
+        }
+
+
+# Process-wide sketch fed by search logging
+query_sketch = SharedQuerySketch()
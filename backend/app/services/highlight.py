@@ -0,0 +1,29 @@
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+import re
+
+# Page of titles to highlight for one query: (query, titles)
+HighlightPage = Tuple[str, Sequence[Optional[str]]]
+
+
+@lru_cache(maxsize=1024)
+def compile_query(query: str) -> "re.Pattern":
+    """검색어 하이라이트 패턴 (프로세스별로 캐시되어 같은 검색어는 한 번만 컴파일)"""
+    return re.compile(f"({re.escape(query)})", re.IGNORECASE)
+
+
+def highlight(text: Optional[str], query: str) -> Optional[str]:
+    """검색어를 <mark> 로 감싼 텍스트"""
+    if not text or not query:
+        return text
+    return compile_query(query).sub(r"<mark>\1</mark>", text)
+
+
+def highlight_pages(pages: Sequence[HighlightPage]) -> List[List[Optional[str]]]:
+    """페이지별 제목 하이라이트 (프로세스 풀에서 실행되므로 문자열만 주고받음)"""
+    return [[highlight(title, query) for title in titles] for query, titles in pages]
+
+
+def highlight_cost(pages: Sequence[HighlightPage]) -> int:
+    """하이라이트 비용 추정치 (제목 글자 수 합)"""
+    return sum(len(title or "") for _, titles in pages for title in titles)
@@ -0,0 +1,231 @@
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from typing import Dict, Optional, Tuple
+from datetime import datetime
+import numpy as np
+import asyncio
+import fcntl
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+
+from app.services.change_feed import ChangeFeed
+from app.services.columnar import ColumnarSnapshot
+from app.services.filter_index import FilterIndex
+from app.services.search_index import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+# File layout: header | JSON manifest | padding | 64-byte aligned arrays
+SNAPSHOT_MAGIC = b"SPIDX\x00\x00\x00"
+SNAPSHOT_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<8sII")  # magic, format version, manifest length
+_ALIGNMENT = 64
+
+_COLUMNS = ("ids", "prices", "popularity", "created_at", "category_codes")
+
+
+class SnapshotError(Exception):
+    """인덱스 스냅샷을 읽을 수 없음"""
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def collect_snapshot(index: SearchIndex, watermark: Optional[Tuple[datetime, int]]) -> Tuple[dict, Dict[str, np.ndarray]]:
+    """인덱스의 일관된 사본(매니페스트, 배열) 수집 (이벤트 루프에서 호출)
+
+    tombstone 은 사본에서만 걸러낸다. 서빙 중인 인덱스의 압축은 변경 피드의 쓰기
+    경로에서만 일어나야 행 위치(generation)에 기대는 쪽이 어긋나지 않는다.
+    """
+    columns, filters = index.columns, index.filters
+    if index.tombstones:
+        columns = columns.take(np.flatnonzero(index.live))
+        filters = FilterIndex(columns.category_codes, columns.categories, columns.prices, index.price_edges)
+
+    category_bitmaps, price_bitmaps = filters.export_bitmaps()
+    arrays = {name: np.array(getattr(columns, name)) for name in _COLUMNS}
+    arrays["category_bitmaps"] = category_bitmaps
+    arrays["price_bitmaps"] = price_bitmaps
+
+    manifest = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "created_at": time.time(),
+        "size": columns.size,
+        "categories": list(columns.categories),
+        "price_edges": list(index.price_edges),
+        "watermark": [watermark[0].isoformat(), watermark[1]] if watermark else None,
+    }
+    return manifest, arrays
+
+
+def write_snapshot(path: str, manifest: dict, arrays: Dict[str, np.ndarray]) -> None:
+    """스냅샷 파일 쓰기 (임시 파일에 쓴 뒤 원자적으로 교체)"""
+    specs, offset = {}, 0
+    for name, array in arrays.items():
+        offset = _align(offset)
+        specs[name] = {
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+            "offset": offset,
+        }
+        offset += array.nbytes
+    manifest = dict(manifest, arrays=specs)
+
+    encoded = json.dumps(manifest).encode()
+    data_start = _align(_HEADER.size + len(encoded))
+
+    tmp_path = f"{path}.tmp-{os.getpid()}"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_FORMAT_VERSION, len(encoded)))
+        f.write(encoded)
+        for name, array in arrays.items():
+            f.seek(data_start + specs[name]["offset"])
+            f.write(np.ascontiguousarray(array).tobytes())
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: str) -> Tuple[dict, ColumnarSnapshot, Tuple[np.ndarray, np.ndarray]]:
+    """스냅샷 파일을 mmap 으로 열어 배열 뷰(zero-copy) 반환
+
+    ACCESS_COPY 매핑이므로 여러 워커가 같은 페이지를 공유하고,
+    인덱스 제자리 갱신은 해당 페이지만 프로세스 전용으로 복사된다.
+    """
+    try:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    except (OSError, ValueError) as e:
+        raise SnapshotError(f"cannot open snapshot {path}: {e}")
+
+    if len(buffer) < _HEADER.size:
+        raise SnapshotError(f"snapshot {path} is truncated")
+    magic, version, manifest_length = _HEADER.unpack_from(buffer, 0)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError(f"{path} is not an index snapshot")
+    if version != SNAPSHOT_FORMAT_VERSION:
+        raise SnapshotError(f"snapshot format {version} is not supported (expected {SNAPSHOT_FORMAT_VERSION})")
+
+    try:
+        manifest = json.loads(bytes(buffer[_HEADER.size:_HEADER.size + manifest_length]))
+        data_start = _align(_HEADER.size + manifest_length)
+        views = {}
+        for name, spec in manifest["arrays"].items():
+            count = int(np.prod(spec["shape"]))
+            views[name] = np.frombuffer(
+                buffer,
+                dtype=np.dtype(spec["dtype"]),
+                count=count,
+                offset=data_start + spec["offset"],
+            ).reshape(spec["shape"])
+    except (KeyError, ValueError, TypeError) as e:
+        raise SnapshotError(f"snapshot {path} is corrupt: {e}")
+
+    columns = ColumnarSnapshot(
+        categories=list(manifest["categories"]),
+        **{name: views[name] for name in _COLUMNS},
+    )
+    return manifest, columns, (views["category_bitmaps"], views["price_bitmaps"])
+
+
+def load_snapshot(path: str, index: SearchIndex, feed: ChangeFeed) -> None:
+    """스냅샷으로 인덱스를 적재하고 변경 피드를 스냅샷 워터마크에서 재개"""
+    manifest, columns, bitmaps = read_snapshot(path)
+
+    # Bitmaps built for other price buckets are rebuilt from the columns
+    if manifest["price_edges"] != list(index.price_edges):
+        bitmaps = None
+    index.load(columns, bitmaps)
+
+    watermark = manifest["watermark"]
+    feed.resume(
+        (datetime.fromisoformat(watermark[0]), watermark[1]) if watermark else None,
+        manifest["created_at"],
+    )
+
+
+class _FileLock:
+    """워커 간 스냅샷 빌드/쓰기 직렬화를 위한 파일 락"""
+
+    def __init__(self, path: str):
+        self.path = f"{path}.lock"
+        self._fd: Optional[int] = None
+
+    async def acquire(self, blocking: bool = True) -> bool:
+        self._fd = os.open(self.path, os.O_CREAT | os.O_RDWR, 0o644)
+        flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+        try:
+            await asyncio.to_thread(fcntl.flock, self._fd, flags)
+            return True
+        except BlockingIOError:
+            self.release()
+            return False
+
+    def release(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+async def load_or_build_index(
+    index: SearchIndex,
+    feed: ChangeFeed,
+    session_factory: async_sessionmaker,
+    path: str = "",
+) -> str:
+    """스냅샷이 있으면 mmap 으로 적재, 없으면 DB 에서 빌드 후 스냅샷 저장
+
+    같은 파드의 워커들은 파일 락으로 직렬화되어, 첫 워커만 DB 에서 빌드하고
+    나머지는 그 스냅샷을 적재한다. 적재 출처("snapshot" 또는 "database")를 반환한다.
+    """
+    lock = _FileLock(path) if path else None
+    if lock:
+        await lock.acquire()
+    try:
+        if path and os.path.exists(path):
+            try:
+                load_snapshot(path, index, feed)
+                logger.info(f"Search index loaded from snapshot {path}: {index.size} items")
+                return "snapshot"
+            except SnapshotError as e:
+                logger.warning(f"Ignoring index snapshot: {e}")
+
+        async with session_factory() as db:
+            # Watermark first, so changes made during the build are replayed
+            await feed.initialize(db)
+            await index.build(db)
+
+        if path:
+            manifest, arrays = collect_snapshot(index, feed.watermark)
+            await asyncio.to_thread(write_snapshot, path, manifest, arrays)
+            logger.info(f"Search index snapshot written to {path}")
+        return "database"
+    finally:
+        if lock:
+            lock.release()
+
+
+async def snapshot_loop(index: SearchIndex, feed: ChangeFeed, path: str, interval: float) -> None:
+    """주기적으로 스냅샷 갱신 (다른 워커가 쓰는 중이면 건너뜀)"""
+    while True:
+        await asyncio.sleep(interval)
+        lock = _FileLock(path)
+        try:
+            if not await lock.acquire(blocking=False):
+                continue
+            # Another worker may have just refreshed it
+            if os.path.exists(path) and time.time() - os.path.getmtime(path) < interval / 2:
+                continue
+            manifest, arrays = collect_snapshot(index, feed.watermark)
+            await asyncio.to_thread(write_snapshot, path, manifest, arrays)
+            logger.info(f"Search index snapshot refreshed: {index.size} items")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Search index snapshot refresh failed: {e}")
+        finally:
+            lock.release()
@@ -0,0 +1,93 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Sequence, Tuple
+import logging
+import time
+
+from app.config import settings
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class ItemCache:
+    """id 별 직렬화된 SearchItem 페이로드 LRU 캐시
+
+    /api/items 와 인메모리 검색 경로의 최종 페이지 조회가 함께 사용한다.
+    변경 피드 리스너로 등록되어 변경/삭제된 id 를 무효화하고, 피드가 멈춘
+    경우를 대비해 항목마다 ttl 이 지나면 다시 조회한다.
+    """
+
+    def __init__(self, capacity: int, ttl: float):
+        self.capacity = capacity
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, Tuple[dict, float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_many(self, ids: Iterable[int]) -> Tuple[Dict[int, dict], List[int]]:
+        """(캐시에 있는 id -> 페이로드, 없는 id 목록) 반환"""
+        now = time.monotonic()
+        found, missing = {}, []
+        for item_id in ids:
+            entry = self._entries.get(item_id)
+            if entry is not None and now - entry[1] < self.ttl:
+                self._entries.move_to_end(item_id)
+                found[item_id] = entry[0]
+            else:
+                missing.append(item_id)
+
+        self.hits += len(found)
+        self.misses += len(missing)
+        metrics.CACHE_REQUESTS_TOTAL.labels(cache="items", result="hit").inc(len(found))
+        metrics.CACHE_REQUESTS_TOTAL.labels(cache="items", result="miss").inc(len(missing))
+        return found, missing
+
+    def put_many(self, payloads: Dict[int, dict]) -> None:
+        now = time.monotonic()
+        for item_id, payload in payloads.items():
+            self._entries[item_id] = (payload, now)
+            self._entries.move_to_end(item_id)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, ids: Iterable[int]) -> None:
+        for item_id in ids:
+            self._entries.pop(item_id, None)
+
+    def apply_changes(self, rows: Sequence[Sequence], deleted_ids: Sequence[int]) -> None:
+        """변경 피드 리스너: 변경/삭제된 id 무효화 (rows 의 첫 컬럼이 id)"""
+        self.invalidate(row[0] for row in rows)
+        self.invalidate(deleted_ids)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+def create_item_cache():
+    """ITEM_CACHE_BACKEND 에 맞는 아이템 캐시 (memory: 워커별, shared: 파드 내 워커 공유)"""
+    if settings.ITEM_CACHE_BACKEND == "shared":
+        from app.services.shared_cache import SharedItemCache, SharedMemoryStore
+        try:
+            store = SharedMemoryStore(settings.SHARED_CACHE_PATH, settings.SHARED_CACHE_SIZE_MB * 1024 * 1024)
+            return SharedItemCache(store, settings.ITEM_CACHE_TTL_SECONDS)
+        except OSError as e:
+            # e.g. the container's /dev/shm is smaller than SHARED_CACHE_SIZE_MB
+            logger.warning(f"Shared item cache unavailable at {settings.SHARED_CACHE_PATH}, using per-worker cache: {e}")
+    return ItemCache(settings.ITEM_CACHE_SIZE, settings.ITEM_CACHE_TTL_SECONDS)
+
+
+# Process-wide cache, registered on the change feed at startup
+item_cache = create_item_cache()
@@ -0,0 +1,259 @@
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Callable, Dict, Iterable, Optional, Tuple
+from datetime import datetime, timedelta
+import asyncio
+import json
+import logging
+import math
+import os
+import time
+
+from app.config import settings
+from app.models import LatencySketchSnapshot
+from app.services.heavy_hitters import normalize_query, query_sketch
+from app.services.log_partitions import log_partitions
+
+logger = logging.getLogger(__name__)
+
+QUANTILES = (("p50_ms", 0.5), ("p95_ms", 0.95), ("p99_ms", 0.99))
+
+
+class DDSketch:
+    """DDSketch 분위수 요약 (상대 오차 relative_accuracy 보장, 병합 가능)
+
+    값 v 는 ceil(log_gamma(v)) 번 버킷에 세고, 분위수는 해당 버킷의 대표값으로
+    답한다. 버킷이 max_bins 를 넘으면 가장 작은 버킷들을 합쳐 하위 분위수 정확도를
+    포기하고 꼬리(p95/p99) 정확도를 지킨다.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048, min_value: float = 1e-3):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.max_bins = max_bins
+        self.min_value = min_value
+        self.bins: Dict[int, float] = {}
+        self.zero_count = 0.0
+        self.count = 0.0
+
+    def add(self, value: float, count: float = 1.0) -> None:
+        if value <= self.min_value:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.bins[key] = self.bins.get(key, 0.0) + count
+            self._collapse()
+        self.count += count
+
+    def merge(self, other: "DDSketch") -> None:
+        if other.gamma != self.gamma:
+            raise ValueError("cannot merge sketches with different accuracy")
+        for key, count in other.bins.items():
+            self.bins[key] = self.bins.get(key, 0.0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self._collapse()
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수 (값이 없으면 None)"""
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.bins):
+            seen += self.bins[key]
+            if seen > rank:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.bins) / (self.gamma + 1)
+
+    def summary(self) -> Optional[dict]:
+        """{count, p50_ms, p95_ms, p99_ms} (값이 없으면 None)"""
+        if self.count == 0:
+            return None
+        result = {"count": int(self.count)}
+        for name, q in QUANTILES:
+            result[name] = round(self.quantile(q), 2)
+        return result
+
+    def _collapse(self) -> None:
+        if len(self.bins) <= self.max_bins:
+            return
+        keys = sorted(self.bins)
+        overflow = keys[:len(keys) - self.max_bins + 1]
+        merged = sum(self.bins.pop(key) for key in overflow)
+        self.bins[overflow[-1]] = merged
+
+    def dumps(self) -> str:
+        return json.dumps({
+            "accuracy": self.relative_accuracy,
+            "zero": self.zero_count,
+            "bins": [[key, count] for key, count in self.bins.items()],
+        })
+
+    @classmethod
+    def loads(cls, payload: str, max_bins: int = 2048) -> "DDSketch":
+        data = json.loads(payload)
+        sketch = cls(data["accuracy"], max_bins)
+        sketch.zero_count = data["zero"]
+        sketch.bins = {int(key): count for key, count in data["bins"]}
+        sketch.count = sketch.zero_count + sum(sketch.bins.values())
+        return sketch
+
+
+SketchKey = Tuple[str, str]  # (kind, name): ("endpoint", "/api/search") or ("query", "노트북")
+
+
+class LatencySketches:
+    """엔드포인트별/상위 검색어별 응답 시간 분위수 요약
+
+    워커는 window 초마다 요약을 교체하며 직전 창과 현재 창을 합쳐 보고하므로 최근
+    1~2 창의 지연을 반영한다. 검색어별 요약은 검색어 빈도 요약(query_sketch)의 top-k
+    에 들어 있는 검색어만 유지한다. 주기적으로 latency_sketch_snapshots 에 워커별
+    행을 저장하고 모든 워커의 행을 병합해 snapshot 을 만든다. 행 시각은 검색어 빈도
+    요약과 같은 DB 시계(log_partitions.now())를 쓴다.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = settings.LATENCY_SKETCH_RELATIVE_ACCURACY,
+        window: float = settings.LATENCY_SKETCH_WINDOW_SECONDS,
+        interval: float = settings.LATENCY_SKETCH_SYNC_INTERVAL_SECONDS,
+        stale_after: float = settings.HEAVY_HITTERS_STALE_SECONDS,
+    ):
+        self.relative_accuracy = relative_accuracy
+        self.window = window
+        self.interval = interval
+        self.stale_after = timedelta(seconds=stale_after)
+        self.worker_id = f"{os.getenv('HOSTNAME', 'local')}:{os.getpid()}"
+        self.current: Dict[SketchKey, DDSketch] = {}
+        self.previous: Dict[SketchKey, DDSketch] = {}
+        self.rotated_at = time.monotonic()
+        self.snapshot: Optional[Dict[SketchKey, DDSketch]] = None
+
+    def record(self, kind: str, name: str, value_ms: float) -> None:
+        sketch = self.current.get((kind, name))
+        if sketch is None:
+            sketch = self.current[(kind, name)] = DDSketch(self.relative_accuracy)
+        sketch.add(value_ms)
+
+    def record_endpoint(self, path: str, value_ms: float) -> None:
+        self.record("endpoint", path, value_ms)
+
+    def record_queries(self, entries: Iterable[Tuple[str, float]]) -> None:
+        """(검색어, 응답 시간 ms) 기록 (빈도 상위 검색어만)"""
+        tracked = query_sketch.local.top.entries
+        for query, value_ms in entries:
+            key = normalize_query(query)
+            if key in tracked and value_ms is not None:
+                self.record("query", key, value_ms)
+
+    def rotate(self, now: Optional[float] = None) -> None:
+        now = now or time.monotonic()
+        if now - self.rotated_at >= self.window:
+            self.previous, self.current = self.current, {}
+            self.rotated_at = now
+
+    def local_view(self) -> Dict[SketchKey, DDSketch]:
+        """직전 창 + 현재 창 병합 (상위에서 빠진 검색어 제외)"""
+        tracked = query_sketch.local.top.entries
+        view: Dict[SketchKey, DDSketch] = {}
+        for sketches in (self.previous, self.current):
+            for key, sketch in sketches.items():
+                if key[0] == "query" and key[1] not in tracked:
+                    continue
+                if key not in view:
+                    view[key] = DDSketch(self.relative_accuracy)
+                view[key].merge(sketch)
+        return view
+
+    def view(self) -> Dict[SketchKey, DDSketch]:
+        """보고용 요약 (워커 병합 스냅샷, 없으면 이 워커의 요약)"""
+        return self.snapshot if self.snapshot is not None else self.local_view()
+
+    def summary(self, kind: str, name: str) -> Optional[dict]:
+        sketch = self.view().get((kind, name))
+        return sketch.summary() if sketch is not None else None
+
+    def endpoint_summaries(self) -> Dict[str, dict]:
+        return {
+            name: sketch.summary()
+            for (kind, name), sketch in sorted(self.view().items())
+            if kind == "endpoint" and sketch.count
+        }
+
+    async def sync(self, db: AsyncSession, now: Optional[datetime] = None) -> None:
+        """창 교체 후 자기 요약을 저장하고 전 워커 요약을 병합해 snapshot 갱신"""
+        now = now or log_partitions.now()
+        self.rotate()
+        table = LatencySketchSnapshot.__table__
+        await db.execute(delete(table).where(
+            (table.c.worker_id == self.worker_id) | (table.c.updated_at < now - self.stale_after)
+        ))
+        rows = [
+            {"worker_id": self.worker_id, "kind": kind, "name": name, "updated_at": now, "sketch": sketch.dumps()}
+            for (kind, name), sketch in self.local_view().items()
+        ]
+        if rows:
+            await db.execute(table.insert(), rows)
+        await db.commit()
+
+        merged: Dict[SketchKey, DDSketch] = {}
+        result = await db.execute(select(table.c.kind, table.c.name, table.c.sketch))
+        for kind, name, payload in result:
+            sketch = DDSketch.loads(payload)
+            # Workers configured with another accuracy cannot be merged
+            if sketch.relative_accuracy != self.relative_accuracy:
+                continue
+            if (kind, name) in merged:
+                merged[(kind, name)].merge(sketch)
+            else:
+                merged[(kind, name)] = sketch
+        self.snapshot = merged
+
+    async def run(self, session_factory: Callable[[], AsyncSession]) -> None:
+        """주기적 저장/병합 루프"""
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                async with session_factory() as db:
+                    await self.sync(db)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Latency sketch sync failed: {e}")
+
+
+# Process-wide latency sketches
+latency_sketches = LatencySketches()
+
+
+class LatencyMiddleware:
+    """등록된 /api 경로별 응답 시간을 latency_sketches 에 기록하는 ASGI 미들웨어"""
+
+    def __init__(self, app, sketches: Optional[LatencySketches] = None):
+        self.app = app
+        self.sketches = sketches or latency_sketches
+        self._paths = None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+
+        status = {}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        await self.app(scope, receive, send_wrapper)
+        # Only registered routes, so arbitrary paths cannot grow the sketch set
+        if self._paths is None:
+            self._paths = {getattr(route, "path", None) for route in scope["app"].routes}
+        if scope["path"] in self._paths and status.get("code", 500) < 400:
+            self.sketches.record_endpoint(scope["path"], (time.perf_counter() - started) * 1000)
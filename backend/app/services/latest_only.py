@@ -0,0 +1,64 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+import asyncio
+import logging
+import time
+
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class Superseded(Exception):
+    """같은 키의 더 새로운 요청으로 대체되어 취소됨"""
+
+
+class LatestOnly:
+    """키별 최신 작업만 유지 (이전 작업은 취소)
+
+    같은 키로 새 작업이 들어오면 실행 중인 이전 작업 태스크를 취소하고, 이전
+    호출자는 Superseded 를 받는다. 취소는 작업 안의 await 지점까지 전파되어 작업이 연
+    세션을 닫지만, 그것만으로는 DB 서버의 쿼리가 멈추지 않는다. 서버 쪽 중단이
+    필요한 작업은 database.kill_on_cancel 로 감싼다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._running: Dict[Hashable, Tuple[asyncio.Task, float]] = {}
+        self._superseded = set()
+        self.completed = 0
+        self.cancelled = 0
+        metrics.SUPERSEDE_INFLIGHT.labels(name=name).set_function(lambda: len(self._running))
+
+    async def run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """key 의 이전 작업을 취소하고 fn 실행"""
+        previous = self._running.get(key)
+        if previous is not None and not previous[0].done():
+            task, started = previous
+            task.cancel()
+            self._superseded.add(task)
+            self.cancelled += 1
+            metrics.SUPERSEDED_REQUESTS_TOTAL.labels(name=self.name).inc()
+            metrics.SUPERSEDED_WORK_SECONDS.labels(name=self.name).observe(time.monotonic() - started)
+
+        task = asyncio.create_task(fn())
+        self._running[key] = (task, time.monotonic())
+        try:
+            result = await task
+            self.completed += 1
+            return result
+        except asyncio.CancelledError:
+            # Our own caller being cancelled (client gone) is not a supersession
+            if task in self._superseded and not asyncio.current_task().cancelling():
+                raise Superseded() from None
+            raise
+        finally:
+            self._superseded.discard(task)
+            if self._running.get(key, (None,))[0] is task:
+                del self._running[key]
+
+    def stats(self) -> dict:
+        return {
+            "inflight": len(self._running),
+            "completed": self.completed,
+            "cancelled": self.cancelled,
+        }
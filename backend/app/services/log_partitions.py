@@ -0,0 +1,389 @@
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table, and_, delete, func, insert, inspect, literal, select, text, union_all
+from sqlalchemy.engine import Connection
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.ext.asyncio import AsyncEngine
+from typing import Callable, Dict, List, Optional, Tuple
+from datetime import date, datetime, timedelta
+import asyncio
+import logging
+import time
+
+from app.config import settings
+from app.models import SearchLog, SearchLogRollup, Timestamp
+
+logger = logging.getLogger(__name__)
+
+PERIODS = ("day", "month")
+ARCHIVE_PREFIX = "search_logs_p"
+# Serializes maintenance across pods sharing a MySQL primary
+MYSQL_LOCK_NAME = "searchpilot_log_maintenance"
+LOG_COLUMNS = ("id", "query", "result_count", "response_time_ms", "created_at")
+
+
+def period_start(moment: datetime, period: str) -> datetime:
+    """moment 가 속한 기간의 시작 시각"""
+    if period == "day":
+        return datetime(moment.year, moment.month, moment.day)
+    return datetime(moment.year, moment.month, 1)
+
+
+def next_period(start: datetime, period: str) -> datetime:
+    if period == "day":
+        return start + timedelta(days=1)
+    return datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+
+
+def period_name(start: datetime, period: str) -> str:
+    return start.strftime("%Y%m%d" if period == "day" else "%Y%m")
+
+
+def database_now(conn: Connection) -> datetime:
+    """DB 서버 시각 (created_at 기본값 func.now() 와 같은 시계)"""
+    return conn.execute(select(func.now(type_=Timestamp))).scalar()
+
+
+def _to_days(moment: datetime) -> int:
+    """MySQL TO_DAYS() 와 같은 값"""
+    return moment.toordinal() + 365
+
+
+def _from_days(days: int) -> datetime:
+    return datetime.combine(date.fromordinal(days - 365), datetime.min.time())
+
+
+def mysql_partition_ddl(boundary: datetime) -> List[str]:
+    """search_logs 를 TO_DAYS(created_at) 범위 파티션으로 전환하는 DDL
+
+    파티션 키는 모든 고유 키에 포함되어야 하므로 기본 키를 (id, created_at) 로 바꾼다.
+    boundary 이전 행은 p_history, 이후 행은 p_future 에 들어가며 기간별 파티션은
+    정리 작업이 p_future 를 나눠 만든다.
+    """
+    return [
+        "UPDATE search_logs SET created_at = '1970-01-01 00:00:00' WHERE created_at IS NULL",
+        "ALTER TABLE search_logs "
+        "MODIFY created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP, "
+        "DROP PRIMARY KEY, ADD PRIMARY KEY (id, created_at)",
+        "ALTER TABLE search_logs PARTITION BY RANGE (TO_DAYS(created_at)) ("
+        f"PARTITION p_history VALUES LESS THAN ({_to_days(boundary)}), "
+        "PARTITION p_future VALUES LESS THAN MAXVALUE)",
+    ]
+
+
+def mysql_reorganize_ddl(periods: List[Tuple[str, datetime]]) -> str:
+    """p_future 를 (이름, 상한) 기간 파티션들과 새 p_future 로 분할하는 DDL"""
+    parts = [f"PARTITION p{name} VALUES LESS THAN ({_to_days(end)})" for name, end in periods]
+    parts.append("PARTITION p_future VALUES LESS THAN MAXVALUE")
+    return f"ALTER TABLE search_logs REORGANIZE PARTITION p_future INTO ({', '.join(parts)})"
+
+
+class LogPartitions:
+    """search_logs 기간 파티션 관리 (보존 기간, 만료 집계, 파티션 선택 조회)
+
+    MySQL 은 created_at 범위 파티션을 쓰고, 정리 작업이 앞으로의 기간 파티션을 미리
+    만들며 만료된 파티션은 search_log_rollups 로 집계한 뒤 DROP PARTITION 한다.
+    파티션이 없는 엔진(SQLite)에서는 지난 기간의 행을 search_logs_pYYYYMM(DD) 기간
+    테이블로 옮겨 search_logs 에는 현재 기간만 남기고, 만료된 기간 테이블은 집계 후
+    DROP TABLE 한다. 두 경우 모두 삭제는 행 단위 DELETE 없이 끝난다.
+
+    조회는 source(since, until) 로 한다. 기간 테이블은 범위와 겹치는 것만 UNION 하고,
+    MySQL 은 created_at 조건으로 파티션 프루닝이 일어난다. 검색어별 집계는 만료된
+    기간의 집계까지 합친 query_totals() 로 한다.
+
+    기간 경계와 행의 created_at(func.now())이 같은 시계를 쓰도록 현재 시각은 DB 시계를
+    따른다(now()). 기간 테이블은 다른 워커가 만들거나 지울 수 있으므로, 기간이 바뀌면
+    needs_refresh() 가 참이 되고, 지난 기간의 행이 아직 search_logs 에 남아 있으면(옮겨지는
+    중) pending_refresh 초마다 참이 된다.
+    """
+
+    def __init__(
+        self,
+        period: str = settings.SEARCH_LOG_PARTITION_PERIOD,
+        retention_days: int = settings.SEARCH_LOG_RETENTION_DAYS,
+        ahead: int = settings.SEARCH_LOG_PARTITIONS_AHEAD,
+        interval: float = settings.SEARCH_LOG_MAINTENANCE_INTERVAL_SECONDS,
+        pending_refresh: float = settings.SEARCH_LOG_PENDING_REFRESH_SECONDS,
+    ):
+        if period not in PERIODS:
+            raise ValueError(f"period must be one of {PERIODS}, got {period!r}")
+        self.period = period
+        self.retention = timedelta(days=retention_days)
+        self.ahead = ahead
+        self.interval = interval
+        self.pending_refresh = pending_refresh
+        self.archives: Dict[datetime, Table] = {}
+        self._metadata = MetaData()
+        self.last_report: Optional[dict] = None
+        # DB clock minus local clock, measured on every refresh
+        self._clock_offset = timedelta(0)
+        # Period current at the last refresh, whether closed periods were still in the hot
+        # table then, and when (monotonic) that refresh ran
+        self._settled: Optional[datetime] = None
+        self._pending = False
+        self._refreshed_at = 0.0
+
+    def now(self) -> datetime:
+        """DB 시계 기준 현재 시각 (마지막 refresh 때 잰 차이로 보정)"""
+        return datetime.now() + self._clock_offset
+
+    def from_epoch(self, seconds: float) -> datetime:
+        """epoch 초를 DB 시계 기준 시각으로 (created_at 과 비교 가능)"""
+        return datetime.fromtimestamp(seconds) + self._clock_offset
+
+    def to_epoch(self, moment: datetime) -> float:
+        """DB 시계 기준 시각을 epoch 초로 (from_epoch 의 역)"""
+        return (moment - self._clock_offset).timestamp()
+
+    def needs_refresh(self) -> bool:
+        """기간 테이블 목록을 다시 읽어야 하는지
+
+        기간이 바뀌었으면 바로, 지난 기간 행이 아직 옮겨지는 중이면 pending_refresh 초마다
+        (다른 워커의 maintain 이 끝날 때까지 매 조회가 목록을 다시 읽지 않도록) 참이다.
+        """
+        if self._settled != period_start(self.now(), self.period):
+            return True
+        return self._pending and time.monotonic() - self._refreshed_at >= self.pending_refresh
+
+    def source(self, since: Optional[datetime] = None, until: Optional[datetime] = None):
+        """[since, until) 범위의 검색 로그 (LOG_COLUMNS 컬럼을 가진 FROM 절)"""
+        logs = SearchLog.__table__
+        if since is None and until is None and not self.archives:
+            return logs
+
+        parts = [self._bounded(logs, since, until)]
+        for start, table in sorted(self.archives.items()):
+            # Prune period tables outside the requested range
+            if (since is not None and next_period(start, self.period) <= since) or (until is not None and start >= until):
+                continue
+            parts.append(self._bounded(table, since, until))
+        selectable = parts[0] if len(parts) == 1 else union_all(*parts)
+        return selectable.subquery("search_logs_live")
+
+    def rollups(self, since: Optional[datetime] = None, until: Optional[datetime] = None):
+        """[since, until) 범위에서 시작한 기간의 집계 조회"""
+        rollups = SearchLogRollup.__table__
+        stmt = select(rollups)
+        if since is not None:
+            stmt = stmt.where(rollups.c.period_start >= since)
+        if until is not None:
+            stmt = stmt.where(rollups.c.period_start < until)
+        return stmt.subquery("search_log_rollups_range")
+
+    def query_totals(
+        self,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        match: Optional[Callable[[ColumnElement], ColumnElement]] = None,
+    ):
+        """[since, until) 의 검색어별 합계 (원본 로그 + 만료 기간 집계)
+
+        searches, total_results, total_response_time_ms, timed_searches, last_searched
+        컬럼을 가진 FROM 절. match(query 컬럼) 조건은 합치기 전 양쪽에 적용된다.
+        """
+        logs = self.source(since, until)
+        raw = select(
+            logs.c.query,
+            func.count().label("searches"),
+            func.coalesce(func.sum(logs.c.result_count), 0).label("total_results"),
+            func.coalesce(func.sum(logs.c.response_time_ms), 0.0).label("total_response_time_ms"),
+            func.count(logs.c.response_time_ms).label("timed_searches"),
+            func.max(logs.c.created_at).label("last_searched"),
+        ).group_by(logs.c.query)
+        rollups = self.rollups(since, until)
+        rolled = select(
+            rollups.c.query,
+            rollups.c.searches,
+            rollups.c.total_results,
+            rollups.c.total_response_time_ms,
+            rollups.c.timed_searches,
+            rollups.c.last_searched,
+        )
+        if match is not None:
+            raw = raw.where(match(logs.c.query))
+            rolled = rolled.where(match(rollups.c.query))
+
+        parts = union_all(raw, rolled).subquery("search_log_query_parts")
+        return select(
+            parts.c.query,
+            func.sum(parts.c.searches).label("searches"),
+            func.sum(parts.c.total_results).label("total_results"),
+            func.sum(parts.c.total_response_time_ms).label("total_response_time_ms"),
+            func.sum(parts.c.timed_searches).label("timed_searches"),
+            func.max(parts.c.last_searched).label("last_searched"),
+        ).group_by(parts.c.query).subquery("search_log_query_totals")
+
+    def _bounded(self, table: Table, since: Optional[datetime], until: Optional[datetime]):
+        stmt = select(*(table.c[name] for name in LOG_COLUMNS))
+        if since is not None:
+            stmt = stmt.where(table.c.created_at >= since)
+        if until is not None:
+            stmt = stmt.where(table.c.created_at < until)
+        return stmt
+
+    def _archive_table(self, start: datetime) -> Table:
+        name = f"{ARCHIVE_PREFIX}{period_name(start, self.period)}"
+        if name in self._metadata.tables:
+            return self._metadata.tables[name]
+        return Table(
+            name,
+            self._metadata,
+            Column("id", Integer, primary_key=True),
+            Column("query", String(255), nullable=False, index=True),
+            Column("result_count", Integer),
+            Column("response_time_ms", Float),
+            Column("created_at", Timestamp, index=True),
+        )
+
+    def refresh(self, conn: Connection) -> None:
+        """DB 에 있는 기간 테이블 목록과 DB 시계 다시 읽기"""
+        now = database_now(conn)
+        self._clock_offset = now - datetime.now()
+        current = period_start(now, self.period)
+        self._settled = current
+        self._refreshed_at = time.monotonic()
+        if conn.dialect.name == "mysql":
+            self.archives = {}
+            self._pending = False
+            return
+
+        archives = {}
+        width = 8 if self.period == "day" else 6
+        fmt = "%Y%m%d" if self.period == "day" else "%Y%m"
+        for name in inspect(conn).get_table_names():
+            suffix = name[len(ARCHIVE_PREFIX):]
+            if name.startswith(ARCHIVE_PREFIX) and len(suffix) == width and suffix.isdigit():
+                start = datetime.strptime(suffix, fmt)
+                archives[start] = self._archive_table(start)
+        self.archives = archives
+
+        # Rows of closed periods still in the hot table are about to move to a period table
+        logs = SearchLog.__table__
+        pending = conn.execute(select(logs.c.id).where(logs.c.created_at < current).limit(1)).first()
+        self._pending = pending is not None
+
+    def maintain(self, conn: Connection, now: Optional[datetime] = None) -> dict:
+        """파티션 준비/기간 분리/만료 집계를 한 번 실행하고 결과 반환"""
+        now = now or database_now(conn)
+        current = period_start(now, self.period)
+        cutoff = now - self.retention
+        report = {"created": [], "archived": [], "expired": []}
+
+        if conn.dialect.name == "mysql":
+            if not conn.execute(text("SELECT GET_LOCK(:name, 0)"), {"name": MYSQL_LOCK_NAME}).scalar():
+                return report
+            try:
+                self._maintain_mysql(conn, current, cutoff, report)
+            finally:
+                conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": MYSQL_LOCK_NAME})
+        else:
+            self._maintain_tables(conn, current, cutoff, report)
+
+        self.last_report = report
+        return report
+
+    def _maintain_tables(self, conn: Connection, current: datetime, cutoff: datetime, report: dict) -> None:
+        self.refresh(conn)
+        logs = SearchLog.__table__
+        columns = [logs.c[name] for name in LOG_COLUMNS]
+
+        # Move closed periods out of the hot table, oldest first
+        while True:
+            oldest = conn.execute(select(func.min(logs.c.created_at)).where(logs.c.created_at < current)).scalar()
+            if oldest is None:
+                break
+            start = period_start(oldest, self.period)
+            window = and_(logs.c.created_at >= start, logs.c.created_at < next_period(start, self.period))
+            table = self._archive_table(start)
+            table.create(conn, checkfirst=True)
+            conn.execute(insert(table).from_select(list(LOG_COLUMNS), select(*columns).where(window)))
+            conn.execute(delete(logs).where(window))
+            self.archives[start] = table
+            report["archived"].append(table.name)
+        self._settled = current
+        self._pending = False
+
+        for start, table in sorted(self.archives.items()):
+            if next_period(start, self.period) > cutoff:
+                break
+            self._rollup(conn, table, start, next_period(start, self.period))
+            table.drop(conn)
+            del self.archives[start]
+            self._metadata.remove(table)
+            report["expired"].append(table.name)
+
+    def _maintain_mysql(self, conn: Connection, current: datetime, cutoff: datetime, report: dict) -> None:
+        partitions = conn.execute(text(
+            "SELECT PARTITION_NAME, PARTITION_DESCRIPTION FROM information_schema.PARTITIONS "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'search_logs' AND PARTITION_NAME IS NOT NULL "
+            "ORDER BY PARTITION_ORDINAL_POSITION"
+        )).fetchall()
+        if not partitions:
+            logger.warning("search_logs is not partitioned; run schema migrations first")
+            return
+        bounds = [(name, None if desc == "MAXVALUE" else _from_days(int(desc))) for name, desc in partitions]
+
+        # Pre-create partitions for the current period and the next `ahead` ones
+        target = current
+        for _ in range(self.ahead + 1):
+            target = next_period(target, self.period)
+        # If maintenance fell behind, rows since the last run sit in p_future and are split too
+        start = max((upper for _, upper in bounds if upper is not None), default=current)
+        new = []
+        while start < target:
+            end = next_period(start, self.period)
+            new.append((period_name(start, self.period), end))
+            start = end
+        if new:
+            conn.execute(text(mysql_reorganize_ddl(new)))
+            report["created"].extend(f"p{name}" for name, _ in new)
+
+        logs = SearchLog.__table__
+        lower = None
+        for name, upper in bounds:
+            if upper is None or upper > cutoff:
+                break
+            first = lower or conn.execute(select(func.min(logs.c.created_at)).where(logs.c.created_at < upper)).scalar()
+            if first is not None:
+                start = period_start(first, self.period)
+                while start < upper:
+                    end = min(next_period(start, self.period), upper)
+                    self._rollup(conn, logs, start, end)
+                    start = end
+            conn.execute(text(f"ALTER TABLE search_logs DROP PARTITION {name}"))
+            report["expired"].append(name)
+            lower = upper
+
+    def _rollup(self, conn: Connection, table: Table, start: datetime, end: datetime) -> None:
+        """[start, end) 로그를 search_log_rollups 로 집계 (재실행해도 같은 결과)"""
+        rollups = SearchLogRollup.__table__
+        conn.execute(delete(rollups).where(rollups.c.period_start == start))
+        stmt = select(
+            literal(start, rollups.c.period_start.type),
+            table.c.query,
+            func.count(),
+            func.coalesce(func.sum(table.c.result_count), 0),
+            func.coalesce(func.sum(table.c.response_time_ms), 0.0),
+            func.count(table.c.response_time_ms),
+            func.max(table.c.created_at),
+        ).where(table.c.created_at >= start, table.c.created_at < end).group_by(table.c.query)
+        conn.execute(insert(rollups).from_select(
+            ["period_start", "query", "searches", "total_results", "total_response_time_ms", "timed_searches", "last_searched"],
+            stmt
+        ))
+
+    async def run(self, db_engine: AsyncEngine) -> None:
+        """주기적 정리 루프"""
+        while True:
+            try:
+                async with db_engine.begin() as conn:
+                    report = await conn.run_sync(self.maintain)
+                if report["archived"] or report["expired"] or report["created"]:
+                    logger.info(f"Search log maintenance: {report}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Search log maintenance failed: {e}")
+            await asyncio.sleep(self.interval)
+
+
+# Process-wide partition registry used by search_logs aggregations
+log_partitions = LogPartitions()
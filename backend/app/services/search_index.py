@@ -0,0 +1,209 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
+from typing import Optional, Sequence, Tuple
+from datetime import datetime
+import numpy as np
+import logging
+import time
+
+from app.config import settings
+from app.models import SearchItem
+from app.services.columnar import ColumnarSnapshot
+from app.services.filter_index import FilterIndex, pack
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
+# Rows fetched per round-trip while building the index
+BUILD_BATCH_SIZE = 50000
+
+# Columns held by the index, in ColumnarSnapshot.from_rows order
+INDEX_COLUMNS = (
+    SearchItem.id,
+    SearchItem.category,
+    SearchItem.price,
+    SearchItem.popularity,
+    SearchItem.created_at,
+)
+
+
+class SearchIndex:
+    """검색 인메모리 인덱스
+
+    search_items 의 컬럼형 스냅샷(ColumnarSnapshot)과 행 위치 기준의
+    필터 비트맵(FilterIndex)을 함께 보관한다. 변경 피드의 upsert 는 제자리 갱신
+    또는 덧붙이기로, 삭제는 tombstone 으로 반영하고 compact() 에서 정리한다.
+
+    행 위치가 바뀌는 변경(덧붙이기, 압축)마다 generation 이 증가하므로,
+    위치 기반 비트맵을 보관하는 쪽은 generation 으로 유효성을 확인해야 한다.
+    """
+
+    def __init__(self, price_edges: Optional[Sequence[float]] = None):
+        self.price_edges = list(price_edges if price_edges is not None else settings.price_bucket_edges)
+        self.columns = ColumnarSnapshot.empty()
+        self.filters: Optional[FilterIndex] = None
+        self.live = np.empty(0, dtype=bool)
+        self.tombstones = 0
+        # Sum of live ids: moves on every delete, so data versions can tell deletes apart
+        self.id_sum = 0
+        self.generation = 0
+        self.built_at: Optional[datetime] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.filters is not None
+
+    @property
+    def ids(self) -> np.ndarray:
+        return self.columns.ids
+
+    @property
+    def size(self) -> int:
+        return self.columns.size
+
+    @property
+    def tombstone_ratio(self) -> float:
+        return self.tombstones / self.size if self.size else 0.0
+
+    async def build(self, db: AsyncSession) -> None:
+        """DB 에서 인덱스 전체 빌드"""
+        start_time = time.time()
+
+        stmt = select(*INDEX_COLUMNS)\
+            .order_by(SearchItem.id)\
+            .execution_options(yield_per=BUILD_BATCH_SIZE)
+
+        rows = []
+        result = await db.stream(stmt)
+        async for partition in result.partitions():
+            rows.extend(partition)
+
+        self.load(ColumnarSnapshot.from_rows(rows))
+        logger.info(
+            f"Search index built: {self.size} items in {(time.time() - start_time) * 1000:.1f}ms"
+        )
+
+    def load(self, columns: ColumnarSnapshot, bitmaps: Optional[Tuple[np.ndarray, np.ndarray]] = None) -> None:
+        """컬럼 스냅샷(과 미리 만든 필터 비트맵)으로 인덱스 교체"""
+        self._replace(columns, np.ones(columns.size, dtype=bool), bitmaps)
+        self.built_at = datetime.now()
+
+    def _replace(
+        self,
+        columns: ColumnarSnapshot,
+        live: np.ndarray,
+        bitmaps: Optional[Tuple[np.ndarray, np.ndarray]] = None,
+    ) -> None:
+        self.columns = columns
+        self.filters = FilterIndex(
+            columns.category_codes,
+            columns.categories,
+            columns.prices,
+            self.price_edges,
+            bitmaps=bitmaps,
+        )
+        # Tombstoned rows keep their column values but must not be in any bitmap
+        dead = np.flatnonzero(~live)
+        if len(dead):
+            self.filters.clear_rows(dead, columns.category_codes[dead], columns.prices[dead])
+        self.live = live
+        self.tombstones = len(dead)
+        self.id_sum = int(columns.ids[live].sum())
+        self.generation += 1
+        self._export_metrics()
+
+    def apply_changes(self, rows: Sequence[Sequence], deleted_ids: Sequence[int]) -> None:
+        """변경 피드의 upsert/삭제 반영 (rows 는 INDEX_COLUMNS 순서)"""
+        if not self.ready:
+            return
+        if len(rows):
+            self._upsert(ColumnarSnapshot.from_rows(rows).latest_by_id())
+        if len(deleted_ids):
+            self._delete(np.asarray(deleted_ids, dtype=np.int64))
+        self._export_metrics()
+
+    def _upsert(self, batch: ColumnarSnapshot) -> None:
+        # Re-encode the batch categories against the index dictionary
+        mapping = np.array([self.filters.add_category(name) for name in batch.categories] + [-1], dtype=np.int32)
+        batch.category_codes = mapping[batch.category_codes]
+        batch.categories = self.columns.categories
+
+        positions, known = self.columns.positions_of(batch.ids)
+
+        # Existing rows are updated in place; only their bitmap bits move
+        rows = positions[known]
+        if len(rows):
+            columns = self.columns
+            live = self.live[rows]
+            self.filters.clear_rows(rows[live], columns.category_codes[rows[live]], columns.prices[rows[live]])
+            columns.prices[rows] = batch.prices[known]
+            columns.popularity[rows] = batch.popularity[known]
+            columns.created_at[rows] = batch.created_at[known]
+            columns.category_codes[rows] = batch.category_codes[known]
+            self.filters.set_rows(rows, columns.category_codes[rows], columns.prices[rows])
+            self.tombstones -= int((~live).sum())
+            self.id_sum += int(columns.ids[rows[~live]].sum())
+            self.live[rows] = True
+            metrics.INDEX_CHANGES_TOTAL.labels(kind="update").inc(len(rows))
+
+        # New rows change positions, so the bitmaps are rebuilt over the extended columns
+        added = batch.take(np.flatnonzero(~known))
+        if added.size:
+            dead_ids = self.columns.ids[~self.live]
+            merged = self.columns.extend(added)
+            live = np.ones(merged.size, dtype=bool)
+            live[merged.positions_of(dead_ids)[0]] = False
+            self._replace(merged, live)
+            metrics.INDEX_CHANGES_TOTAL.labels(kind="insert").inc(added.size)
+
+    def _delete(self, ids: np.ndarray) -> None:
+        positions, known = self.columns.positions_of(ids)
+        rows = positions[known]
+        rows = rows[self.live[rows]]
+        if not len(rows):
+            return
+
+        self.filters.clear_rows(rows, self.columns.category_codes[rows], self.columns.prices[rows])
+        self.live[rows] = False
+        self.tombstones += len(rows)
+        self.id_sum -= int(self.columns.ids[rows].sum())
+        metrics.INDEX_CHANGES_TOTAL.labels(kind="delete").inc(len(rows))
+
+    def compact(self) -> None:
+        """tombstone 행을 제거해 컬럼/비트맵 재구성"""
+        if not self.tombstones:
+            return
+        removed = self.tombstones
+        self._replace(self.columns.take(np.flatnonzero(self.live)), np.ones(self.size - removed, dtype=bool))
+        logger.info(f"Search index compacted: removed {removed} tombstones, {self.size} items")
+
+    def live_ids(self) -> np.ndarray:
+        """삭제되지 않은 id 배열 (오름차순)"""
+        return self.ids[self.live]
+
+    def match_bitmap(self, ids: Sequence[int]) -> Optional[np.ndarray]:
+        """매치된 id 집합을 비트맵으로 변환 (인덱스에 없는 id 가 있으면 None)"""
+        positions, known = self.columns.positions_of(ids)
+        if not known.all() or not self.live[positions].all():
+            return None
+
+        mask = np.zeros(self.size, dtype=bool)
+        mask[positions] = True
+        return pack(mask)
+
+    def clear(self) -> None:
+        self.columns = ColumnarSnapshot.empty()
+        self.filters = None
+        self.live = np.empty(0, dtype=bool)
+        self.tombstones = 0
+        self.id_sum = 0
+        self.generation += 1
+        self.built_at = None
+
+    def _export_metrics(self) -> None:
+        metrics.INDEX_ROWS.labels(state="live").set(self.size - self.tombstones)
+        metrics.INDEX_ROWS.labels(state="tombstone").set(self.tombstones)
+
+
+# Process-wide index, built at startup when SEARCH_INDEX_ENABLED is set
+search_index = SearchIndex()
@@ -1,39 +1,108 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_, and_, text, desc
-from typing import List, Tuple, Optional
+from sqlalchemy import select, func, or_, and_, text, desc, null, Select
+from sqlalchemy.engine import Result
+from sqlalchemy.exc import DBAPIError
+from typing import AsyncIterator, Callable, List, Tuple, Optional
+from app.config import settings
 from app.models import SearchItem, SearchLog
-from app.schemas import SearchQuery, PopularQueries, SearchAnalytics
+from app.schemas import SearchQuery, PopularQueries, SearchAnalytics, SearchItem as SearchItemSchema
+from app.services.facets import price_facets
+from app.services.filter_index import unpack
+from app.services.highlight import highlight
+from app.services.heavy_hitters import normalize_query, query_sketch
+from app.services.item_cache import item_cache
+from app.services.latency_sketch import latency_sketches
+from app.services.log_partitions import log_partitions
+from app.services.search_index import SearchIndex, search_index
+import numpy as np
 import time
 import logging
-import re
-from datetime import datetime
+from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Columns written by the streaming export, in output order
+EXPORT_COLUMNS = (
+    SearchItem.id,
+    SearchItem.title,
+    SearchItem.description,
+    SearchItem.category,
+    SearchItem.tags,
+    SearchItem.price,
+    SearchItem.popularity,
+    SearchItem.created_at,
+    SearchItem.updated_at,
+)
+
+
+# SQL LIKE (SQLite default, MySQL *_ci collations) ignores ASCII case
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def ascii_fold(text: str) -> str:
+    """LIKE 와 같은 기준의 대소문자 정규화 (ASCII 만 소문자로, 다른 문자는 그대로)"""
+    return text.translate(_ASCII_LOWER)
+
+
+def query_key(query: SearchQuery) -> tuple:
+    """검색 결과를 결정하는 키 (ASCII 대소문자를 접은 검색어 + 필터/정렬/페이지)
+
+    LIKE '%q%' 매칭은 ASCII 대소문자만 구분하지 않고 공백은 구분하므로, lower() 처럼
+    결과가 다른 검색어(예: "É"/"é")를 합치지 않도록 ASCII 만 접고 공백은 그대로 둔다.
+    """
+    return (
+        ascii_fold(query.q),
+        query.category,
+        query.min_price,
+        query.max_price,
+        query.sort,
+        query.order,
+        query.page,
+        query.size,
+    )
+
 
 class SearchService:
     """검색 서비스"""
     
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        index: Optional[SearchIndex] = None,
+        write_db: Optional[AsyncSession] = None,
+    ):
+        # db serves reads (replica when routed); search logs go to write_db (primary)
         self.db = db
+        self.write_db = write_db if write_db is not None else db
+        self.index = index if index is not None else search_index
+        self.items = item_cache
+        self._match_bitmaps = {}
     
-    async def search(self, query: SearchQuery) -> Tuple[List[SearchItem], int, float]:
-        """검색 실행"""
+    async def search(self, query: SearchQuery, log: bool = True) -> Tuple[List[SearchItem], int, float]:
+        """검색 실행 (log=False 면 검색 로그를 남기지 않음)"""
         start_time = time.time()
         
-        # Base query with full-text search
-        stmt = select(SearchItem)
+        # Filter, sort and page in memory when the index holds the match set
+        match = await self._match_bitmap(query.q) if query.q else None
+        if match is not None:
+            items, total = await self._search_indexed(query, match)
+        else:
+            items, total = await self._search_sql(query)
+        
+        # Calculate response time
+        response_time = (time.time() - start_time) * 1000
         
+        # Log search
+        if log:
+            await self.log_search(query.q, total, response_time)
+        
+        return items, total, response_time
+    
+    def _filtered(self, stmt, query: SearchQuery):
+        """검색어/카테고리/가격 조건 적용"""
         # Full-text search on title and description
         if query.q:
-            search_pattern = f"%{query.q}%"
-            stmt = stmt.where(
-                or_(
-                    SearchItem.title.like(search_pattern),
-                    SearchItem.description.like(search_pattern),
-                    SearchItem.tags.like(search_pattern)
-                )
-            )
+            stmt = stmt.where(self._text_match(query.q))
         
         # Apply filters
         if query.category:
@@ -45,29 +114,40 @@ class SearchService:
         if query.max_price is not None:
             stmt = stmt.where(SearchItem.price <= query.max_price)
         
-        # Count total results
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        result = await self.db.execute(count_stmt)
-        total = result.scalar()
-        
-        # Apply sorting
+        return stmt
+    
+    def _sorted(self, stmt, query: SearchQuery):
+        """정렬 조건 적용"""
         if query.sort == "date":
-            stmt = stmt.order_by(
+            return stmt.order_by(
                 SearchItem.created_at.desc() if query.order == "desc" 
                 else SearchItem.created_at.asc()
             )
         elif query.sort == "popularity":
-            stmt = stmt.order_by(
+            return stmt.order_by(
                 SearchItem.popularity.desc() if query.order == "desc"
                 else SearchItem.popularity.asc()
             )
         elif query.sort == "price":
-            stmt = stmt.order_by(
+            return stmt.order_by(
                 SearchItem.price.desc() if query.order == "desc"
                 else SearchItem.price.asc()
             )
         else:  # relevance (default)
-            stmt = stmt.order_by(SearchItem.popularity.desc())
+            return stmt.order_by(SearchItem.popularity.desc())
+    
+    async def _search_sql(self, query: SearchQuery) -> Tuple[List[SearchItem], int]:
+        """SQL 검색 (필터/정렬/페이지네이션을 DB 에서 처리)"""
+        # Base query with full-text search
+        stmt = self._filtered(select(SearchItem), query)
+        
+        # Count total results
+        count_stmt = select(func.count()).select_from(stmt.subquery())
+        result = await self.db.execute(count_stmt)
+        total = result.scalar()
+        
+        # Apply sorting
+        stmt = self._sorted(stmt, query)
         
         # Apply pagination
         offset = (query.page - 1) * query.size
@@ -77,51 +157,112 @@ class SearchService:
         result = await self.db.execute(stmt)
         items = result.scalars().all()
         
-        # Calculate response time
-        response_time = (time.time() - start_time) * 1000
+        return items, total
+    
+    async def stream_matches(self, query: SearchQuery, chunk_size: int) -> AsyncIterator[List[dict]]:
+        """검색 조건에 맞는 모든 행을 chunk_size 개씩 스트리밍 (페이지/카운트 없음)
+
+        서버 사이드 커서(stream + yield_per)로 읽으므로 매치 수와 무관하게
+        메모리에는 한 청크만 올라온다.
+        """
+        stmt = self._sorted(self._filtered(select(*EXPORT_COLUMNS), query), query)\
+            .order_by(SearchItem.id)\
+            .execution_options(yield_per=chunk_size)
         
-        # Log search
-        await self._log_search(query.q, total, response_time)
+        result = await self.db.stream(stmt)
+        async for partition in result.mappings().partitions():
+            yield [dict(row) for row in partition]
+    
+    async def _search_indexed(self, query: SearchQuery, match: np.ndarray) -> Tuple[List[SearchItemSchema], int]:
+        """인메모리 검색 (필터 비트맵 + 컬럼 top-k, 최종 페이지만 PK 로 조회)"""
+        filters = self.index.filters.filter_bitmap(query.category, query.min_price, query.max_price)
+        if filters is not None:
+            match = match & filters
         
-        return items, total, response_time
+        positions = np.flatnonzero(unpack(match, self.index.size))
+        offset = (query.page - 1) * query.size
+        page = self.index.columns.top_k(positions, query.sort, query.order, offset, query.size)
+        
+        items = await self.get_items(self.index.ids[page].tolist())
+        return items, len(positions)
+    
+    async def get_items(self, ids: List[int]) -> List[SearchItemSchema]:
+        """id 목록 순서대로 아이템 조회 (없는 id 는 제외)
+
+        캐시에 없는 id 만 WHERE id IN (...) 한 번으로 조회해 캐시에 채운다.
+        """
+        if not ids:
+            return []
+        
+        payloads, missing = self.items.get_many(dict.fromkeys(ids))
+        if missing:
+            result = await self.db.execute(select(SearchItem).where(SearchItem.id.in_(missing)))
+            fetched = {
+                item.id: SearchItemSchema.model_validate(item).model_dump()
+                for item in result.scalars().all()
+            }
+            self.items.put_many(fetched)
+            payloads.update(fetched)
+        
+        return [SearchItemSchema(**payloads[item_id]) for item_id in ids if item_id in payloads]
     
     async def autocomplete(self, partial_query: str, limit: int = 10) -> List[str]:
         """자동완성 제안"""
-        stmt = select(SearchItem.title).where(
+        return [title for title, _ in await self.autocomplete_candidates(partial_query, limit)]
+    
+    async def autocomplete_candidates(self, partial_query: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """자동완성 후보 (제목, 그 제목을 가진 가장 작은 id) - 캐시가 제목 변경을 추적하는 데 사용"""
+        stmt = select(SearchItem.title, func.min(SearchItem.id)).where(
             SearchItem.title.like(f"{partial_query}%")
-        ).distinct().limit(limit)
+        ).group_by(SearchItem.title).limit(limit)
         
         result = await self.db.execute(stmt)
-        suggestions = [row[0] for row in result.fetchall()]
-        
-        return suggestions
+        return [(row[0], row[1]) for row in result.fetchall()]
+    
+    async def _read_logs(self, build: Callable[[], Select]) -> Result:
+        """search_logs 조회 실행 (기간 테이블 목록이 낡았으면 다시 읽고, 읽다 실패하면 한 번 재시도)
+
+        build 는 log_partitions 로 문장을 만드는 함수여서, 목록을 다시 읽은 뒤에는 다른 워커가
+        만들거나 지운 기간 테이블이 반영된 문장으로 재시도한다.
+        """
+        if log_partitions.needs_refresh():
+            await (await self.db.connection()).run_sync(log_partitions.refresh)
+        try:
+            return await self.db.execute(build())
+        except DBAPIError as e:
+            logger.warning(f"search_logs read failed, refreshing period tables: {e}")
+            await self.db.rollback()
+            await (await self.db.connection()).run_sync(log_partitions.refresh)
+            return await self.db.execute(build())
+    
+    def _popular_stmt(self, limit: int) -> Select:
+        """만료 기간 집계를 포함한 검색 횟수 상위 검색어"""
+        totals = log_partitions.query_totals()
+        return select(totals).order_by(totals.c.searches.desc(), totals.c.query).limit(limit)
     
     async def get_suggestions(self, popular_limit: int = 5, recent_limit: int = 5) -> dict:
         """추천 검색어 가져오기"""
-        # Popular queries
-        popular_stmt = select(
-            SearchLog.query,
-            func.count(SearchLog.id).label('count')
-        ).group_by(
-            SearchLog.query
-        ).order_by(
-            func.count(SearchLog.id).desc()
-        ).limit(popular_limit)
-        
-        result = await self.db.execute(popular_stmt)
-        popular = [row[0] for row in result.fetchall()]
+        # Popular queries (from the merged query sketch once it is available)
+        hitters = query_sketch.top_queries(popular_limit)
+        if hitters is not None:
+            popular = [query for query, _, _ in hitters]
+        else:
+            result = await self._read_logs(lambda: self._popular_stmt(popular_limit))
+            popular = [row.query for row in result.fetchall()]
         
         # Recent queries - using subquery to avoid DISTINCT/ORDER BY conflict
-        recent_stmt = select(
-            SearchLog.query,
-            func.max(SearchLog.created_at).label('last_search')
-        ).group_by(
-            SearchLog.query
-        ).order_by(
-            func.max(SearchLog.created_at).desc()
-        ).limit(recent_limit)
+        def recent_stmt():
+            logs = log_partitions.source(since=log_partitions.now() - timedelta(days=settings.SEARCH_LOG_RECENT_DAYS))
+            return select(
+                logs.c.query,
+                func.max(logs.c.created_at).label('last_search')
+            ).group_by(
+                logs.c.query
+            ).order_by(
+                func.max(logs.c.created_at).desc()
+            ).limit(recent_limit)
         
-        result = await self.db.execute(recent_stmt)
+        result = await self._read_logs(recent_stmt)
         recent = [row[0] for row in result.fetchall()]
         
         return {
@@ -136,33 +277,37 @@ class SearchService:
         result = await self.db.execute(total_items_stmt)
         total_items = result.scalar()
         
-        # Total searches
-        total_searches_stmt = select(func.count(SearchLog.id))
-        result = await self.db.execute(total_searches_stmt)
-        total_searches = result.scalar()
+        # Total searches and average response time, including rolled-up expired logs
+        def totals_stmt():
+            logs = log_partitions.source()
+            return select(
+                func.count(logs.c.id),
+                func.coalesce(func.sum(logs.c.response_time_ms), 0.0),
+                func.count(logs.c.response_time_ms)
+            )
+        result = await self._read_logs(totals_stmt)
+        total_searches, total_time, timed = result.one()
         
-        # Average response time
-        avg_time_stmt = select(func.avg(SearchLog.response_time_ms))
-        result = await self.db.execute(avg_time_stmt)
-        avg_response_time = result.scalar() or 0
+        rollups = log_partitions.rollups()
+        rollup_stmt = select(
+            func.coalesce(func.sum(rollups.c.searches), 0),
+            func.coalesce(func.sum(rollups.c.total_response_time_ms), 0.0),
+            func.coalesce(func.sum(rollups.c.timed_searches), 0)
+        )
+        result = await self.db.execute(rollup_stmt)
+        rolled_searches, rolled_time, rolled_timed = result.one()
         
-        # Popular queries
-        popular_stmt = select(
-            SearchLog.query,
-            func.count(SearchLog.id).label('count'),
-            func.avg(SearchLog.response_time_ms).label('avg_time')
-        ).group_by(
-            SearchLog.query
-        ).order_by(
-            func.count(SearchLog.id).desc()
-        ).limit(10)
+        total_searches += rolled_searches
+        timed += rolled_timed
+        avg_response_time = (total_time + rolled_time) / timed if timed else 0
         
-        result = await self.db.execute(popular_stmt)
+        # Popular queries
+        result = await self._read_logs(lambda: self._popular_stmt(10))
         popular_queries = [
             {
-                "query": row[0],
-                "count": row[1],
-                "avg_time_ms": round(row[2], 2) if row[2] else 0
+                "query": row.query,
+                "count": row.searches,
+                "avg_time_ms": round(row.total_response_time_ms / row.timed_searches, 2) if row.timed_searches else 0
             }
             for row in result.fetchall()
         ]
@@ -171,21 +316,27 @@ class SearchService:
             "total_items": total_items,
             "total_searches": total_searches,
             "avg_response_time_ms": round(avg_response_time, 2),
-            "popular_queries": popular_queries
+            "popular_queries": popular_queries,
+            "latency": latency_sketches.endpoint_summaries()
         }
     
     async def get_facets(self, query: str) -> dict:
-        """패싯 정보 가져오기 (카테고리별 아이템 수)"""
-        search_pattern = f"%{query}%"
+        """패싯 정보 가져오기 (카테고리별 아이템 수, 가격 구간/히스토그램)"""
+        match = await self._match_bitmap(query)
+        if match is not None:
+            positions = np.flatnonzero(unpack(match, self.index.size))
+            facets = {"categories": self.index.filters.category_counts(match)}
+            facets.update(self._price_facets(self.index.columns.prices[positions]))
+            return facets
+        
+        # Same title/description/tags match as the search and the index path
+        match_condition = self._text_match(query)
         
         stmt = select(
             SearchItem.category,
             func.count(SearchItem.id).label('count')
         ).where(
-            or_(
-                SearchItem.title.like(search_pattern),
-                SearchItem.description.like(search_pattern)
-            )
+            match_condition
         ).group_by(
             SearchItem.category
         ).order_by(
@@ -193,22 +344,52 @@ class SearchService:
         )
         
         result = await self.db.execute(stmt)
-        facets = {row[0]: row[1] for row in result.fetchall() if row[0]}
+        facets = {"categories": {row[0]: row[1] for row in result.fetchall() if row[0]}}
         
-        return {"categories": facets}
+        # Numeric facets from a single pass over the matched prices
+        price_stmt = select(SearchItem.price).where(match_condition).where(SearchItem.price.isnot(None))
+        result = await self.db.execute(price_stmt)
+        prices = np.fromiter((row[0] for row in result), dtype=np.float64)
+        facets.update(self._price_facets(prices))
+        
+        return facets
     
-    def highlight_text(self, text: str, query: str) -> str:
-        """검색어 하이라이트"""
-        if not text or not query:
-            return text
+    def _price_facets(self, prices: np.ndarray) -> dict:
+        """가격 구간/히스토그램 패싯"""
+        return price_facets(prices, settings.price_bucket_edges, settings.FACET_PRICE_HISTOGRAM_BINS)
+    
+    def _text_match(self, query: str):
+        """제목/설명/태그 LIKE 조건"""
+        search_pattern = f"%{query}%"
+        return or_(
+            SearchItem.title.like(search_pattern),
+            SearchItem.description.like(search_pattern),
+            SearchItem.tags.like(search_pattern)
+        )
+    
+    async def _match_bitmap(self, query: str) -> Optional[np.ndarray]:
+        """텍스트 매치 집합 비트맵 (인덱스 미사용/불일치 시 None)"""
+        if not self.index.ready:
+            return None
+        # Bitmaps are position based; drop them once the index layout changes
+        cached = self._match_bitmaps.get(query)
+        if cached is not None and cached[0] == self.index.generation:
+            return cached[1]
         
-        # Escape special regex characters
-        escaped_query = re.escape(query)
-        pattern = re.compile(f"({escaped_query})", re.IGNORECASE)
+        result = await self.db.execute(select(SearchItem.id).where(self._text_match(query)))
+        ids = np.fromiter((row[0] for row in result), dtype=np.int64)
         
-        return pattern.sub(r"<mark>\1</mark>", text)
+        bitmap = self.index.match_bitmap(ids)
+        if bitmap is None:
+            logger.warning(f"Search index is stale for query '{query}', falling back to SQL")
+        self._match_bitmaps[query] = (self.index.generation, bitmap)
+        return bitmap
+    
+    def highlight_text(self, text: str, query: str) -> str:
+        """검색어 하이라이트"""
+        return highlight(text, query)
     
-    async def _log_search(self, query: str, result_count: int, response_time_ms: float):
+    async def log_search(self, query: str, result_count: int, response_time_ms: float):
         """검색 로그 저장"""
         try:
             log = SearchLog(
@@ -216,24 +397,52 @@ class SearchService:
                 result_count=result_count,
                 response_time_ms=response_time_ms
             )
-            self.db.add(log)
-            await self.db.commit()
+            self.write_db.add(log)
+            query_sketch.record([query])
+            latency_sketches.record_queries([(query, response_time_ms)])
+            await self.write_db.commit()
         except Exception as e:
             logger.error(f"Failed to log search: {e}")
-            await self.db.rollback()
+            await self.write_db.rollback()
+
+    async def log_revalidated(self, query: str):
+        """304 로 답한 검색 로그 저장 (결과 수/응답 시간 없이 검색 횟수만 남김)"""
+        try:
+            # null(): None would fall back to the column default of 0 results
+            self.write_db.add(SearchLog(query=query, result_count=null(), response_time_ms=None))
+            query_sketch.record([query])
+            await self.write_db.commit()
+        except Exception as e:
+            logger.error(f"Failed to log revalidated search: {e}")
+            await self.write_db.rollback()
+
+    async def log_searches(self, entries: List[Tuple[str, int, float]]):
+        """검색 로그 일괄 저장 (query, result_count, response_time_ms)"""
+        try:
+            self.write_db.add_all([
+                SearchLog(query=query, result_count=result_count, response_time_ms=response_time_ms)
+                for query, result_count, response_time_ms in entries
+            ])
+            query_sketch.record(query for query, _, _ in entries)
+            latency_sketches.record_queries((query, response_time_ms) for query, _, response_time_ms in entries)
+            await self.write_db.commit()
+        except Exception as e:
+            logger.error(f"Failed to log searches: {e}")
+            await self.write_db.rollback()
 
     async def get_related_suggestions(self, query: str, limit: int = 5) -> List[str]:
         """관련 검색어 제안 (새로운 기능 - 카나리 배포)"""
         try:
             # 유사한 검색어 찾기 (간단한 구현)
-            stmt = select(SearchLog.query, func.count(SearchLog.query).label('count'))\
-                .where(SearchLog.query != query)\
-                .where(SearchLog.query.like(f"%{query[:3]}%"))\
-                .group_by(SearchLog.query)\
-                .order_by(desc('count'))\
-                .limit(limit)
+            def related_stmt():
+                totals = log_partitions.query_totals(
+                    match=lambda column: and_(column != query, column.like(f"%{query[:3]}%"))
+                )
+                return select(totals.c.query)\
+                    .order_by(totals.c.searches.desc(), totals.c.query)\
+                    .limit(limit)
             
-            result = await self.db.execute(stmt)
+            result = await self._read_logs(related_stmt)
             suggestions = [row[0] for row in result.fetchall()]
             
             # 기본 제안어가 부족하면 일반적인 제안어 추가
@@ -249,28 +458,22 @@ class SearchService:
             return []
 
     async def get_popular_queries(self, limit: int = 10) -> List[PopularQueries]:
-        """인기 검색어 조회 (새로운 기능 - 카나리 배포)"""
+        """인기 검색어 조회 (새로운 기능 - 카나리 배포)
+
+        워커 병합 스냅샷이 충분한 검색을 보았으면 검색어 빈도 요약으로 답하고, 아니면 search_logs 를 집계한다.
+        """
+        hitters = query_sketch.top_queries(limit)
+        if hitters is not None:
+            return [
+                PopularQueries(query=query, count=round(count), last_searched=seen)
+                for query, count, seen in hitters
+            ]
         try:
-            stmt = select(
-                SearchLog.query,
-                func.count(SearchLog.query).label('count'),
-                func.max(SearchLog.created_at).label('last_searched')
-            )\
-                .group_by(SearchLog.query)\
-                .order_by(desc('count'))\
-                .limit(limit)
-            
-            result = await self.db.execute(stmt)
-            popular_queries = []
-            
-            for row in result.fetchall():
-                popular_queries.append(PopularQueries(
-                    query=row[0],
-                    count=row[1],
-                    last_searched=row[2]
-                ))
-            
-            return popular_queries
+            result = await self._read_logs(lambda: self._popular_stmt(limit))
+            return [
+                PopularQueries(query=row.query, count=row.searches, last_searched=row.last_searched)
+                for row in result.fetchall()
+            ]
         except Exception as e:
             logger.error(f"Failed to get popular queries: {e}")
             return []
@@ -278,15 +481,17 @@ class SearchService:
     async def get_search_analytics(self, query: str) -> SearchAnalytics:
         """검색 분석 정보 조회 (새로운 기능 - 카나리 배포)"""
         try:
-            # 해당 쿼리의 검색 통계 조회
-            stmt = select(
-                func.count(SearchLog.id).label('total_searches'),
-                func.avg(SearchLog.response_time_ms).label('avg_response_time'),
-                func.max(SearchLog.created_at).label('last_searched')
-            ).where(SearchLog.query == query)
+            # 해당 쿼리의 검색 통계 조회 (만료 기간 집계 포함)
+            def analytics_stmt():
+                totals = log_partitions.query_totals(match=lambda column: column == query)
+                return select(
+                    totals.c.searches,
+                    (totals.c.total_response_time_ms / func.nullif(totals.c.timed_searches, 0)).label('avg_response_time'),
+                    totals.c.last_searched
+                )
             
-            result = await self.db.execute(stmt)
-            row = result.fetchone()
+            result = await self._read_logs(analytics_stmt)
+            row = result.fetchone() or (0, None, None)
             
             # 결과 개수 조회
             count_stmt = select(func.count()).where(SearchItem.title.like(f"%{query}%"))
@@ -299,7 +504,8 @@ class SearchService:
                 response_time_ms=float(row[1] or 0),
                 timestamp=row[2] or datetime.now(),
                 user_agent=None,  # 실제 구현 시 추가
-                ip_address=None   # 실제 구현 시 추가
+                ip_address=None,  # 실제 구현 시 추가
+                latency=latency_sketches.summary("query", normalize_query(query))
             )
         except Exception as e:
             logger.error(f"Failed to get search analytics: {e}")
@@ -0,0 +1,305 @@
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from datetime import datetime
+import errno
+import fcntl
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import time
+
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"SPSHM002"
+HEADER = struct.Struct("<8sII")  # magic, slab classes, ways
+CLASS = struct.Struct("<II")  # slot size, sets
+COUNTER = struct.Struct("<Q")  # used slots, stored right after the layout
+SLOT = struct.Struct("<QHIdBB")  # key hash, key length, value length, expires (epoch, 0 = never), referenced, used
+REFERENCED = 22  # byte offsets inside SLOT
+USED = 23
+
+
+class SharedMemoryStore:
+    """워커 간 공유 바이트 캐시 (mmap 파일 위의 고정 크기 슬랩, 세트 연관 + CLOCK 교체)
+
+    크기 클래스(slab_sizes)마다 고정 크기 슬롯을 ways 개씩 묶은 세트로 나누고, 키 해시로
+    세트를 고른다. 세트가 가득 차면 세트별 CLOCK 바늘로 참조 비트가 꺼진 슬롯을
+    교체한다. 포인터나 가변 할당이 없어 파일이 곧 자료구조이고, /dev/shm 에 두면
+    같은 파드의 모든 워커가 같은 메모리를 본다. 쓰기는 flock 배타 락, 읽기는 공유
+    락으로 보호한다. 첫 워커가 파일을 만들고, 레이아웃이 설정과 다르면 새로 만든다.
+
+    파일을 만들 때 전체 크기를 미리 할당해, tmpfs 에 자리가 없으면 나중에 쓰다가
+    SIGBUS 로 죽지 않고 생성 시 OSError 가 난다. 슬롯은 키/값을 다 쓴 뒤 used 를 켜므로
+    쓰는 도중 죽은 워커가 반쯤 쓴 값을 남기지 않는다. 사용 중인 슬롯 수는 헤더의
+    카운터로 관리한다.
+    """
+
+    def __init__(self, path: str, size_bytes: int, slab_sizes: Sequence[int] = (256, 1024, 4096, 16384), ways: int = 8):
+        self.path = path
+        self.ways = ways
+        self.classes: List[Tuple[int, int, int]] = []  # (slot size, sets, region offset)
+        self._counter_at = HEADER.size + CLASS.size * len(slab_sizes)
+        offset = self._counter_at + COUNTER.size
+        per_class = size_bytes // len(slab_sizes)
+        for slot_size in sorted(slab_sizes):
+            sets = max(1, per_class // (slot_size * ways))
+            self.classes.append((slot_size, sets, offset))
+            offset += sets + sets * ways * slot_size  # CLOCK hands, then slots
+        self.size = offset
+        self._fd: Optional[int] = None
+        self._mm: Optional[mmap.mmap] = None
+        self._pid: Optional[int] = None
+        self._open()
+
+    @property
+    def capacity(self) -> int:
+        return sum(sets * self.ways for _, sets, _ in self.classes)
+
+    def _layout(self) -> bytes:
+        header = HEADER.pack(MAGIC, len(self.classes), self.ways)
+        return header + b"".join(CLASS.pack(slot_size, sets) for slot_size, sets, _ in self.classes)
+
+    def _open(self) -> None:
+        self._fd = os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600)
+        self._pid = os.getpid()
+        layout = self._layout()
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size != self.size or os.pread(self._fd, len(layout), 0) != layout:
+                # Truncating to zero first leaves every slot unused
+                os.ftruncate(self._fd, 0)
+                self._reserve()
+                os.pwrite(self._fd, layout, 0)
+            self._mm = mmap.mmap(self._fd, self.size)
+        except OSError:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+            raise
+        fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def _reserve(self) -> None:
+        """파일 크기만큼 미리 할당 (tmpfs 가 작으면 매핑 후 쓰다 SIGBUS 가 나는 대신 OSError)"""
+        try:
+            os.posix_fallocate(self._fd, 0, self.size)
+        except OSError as e:
+            if e.errno not in (errno.EOPNOTSUPP, errno.EINVAL):
+                os.ftruncate(self._fd, 0)
+                raise
+            # Filesystem cannot preallocate; fall back to a sparse file
+            os.ftruncate(self._fd, self.size)
+
+    @contextmanager
+    def _locked(self, exclusive: bool):
+        if self._pid != os.getpid():
+            # Forked after opening: the inherited descriptor would share our lock
+            self._open()
+        fcntl.flock(self._fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield self._mm
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _hash(key: bytes) -> int:
+        return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+    def _set_of(self, cls: int, key_hash: int) -> Tuple[int, int]:
+        """(CLOCK 바늘 위치, 세트 첫 슬롯 위치)"""
+        slot_size, sets, offset = self.classes[cls]
+        index = key_hash % sets
+        return offset + index, offset + sets + index * self.ways * slot_size
+
+    def _find(self, mm: mmap.mmap, key: bytes, key_hash: int) -> Optional[Tuple[int, tuple]]:
+        for cls, (slot_size, _, _) in enumerate(self.classes):
+            _, base = self._set_of(cls, key_hash)
+            for way in range(self.ways):
+                slot = base + way * slot_size
+                header = SLOT.unpack_from(mm, slot)
+                if header[5] and header[0] == key_hash and header[1] == len(key) \
+                        and mm[slot + SLOT.size:slot + SLOT.size + len(key)] == key:
+                    return slot, header
+        return None
+
+    def _read(self, mm: mmap.mmap, key: bytes, now: float) -> Optional[bytes]:
+        found = self._find(mm, key, self._hash(key))
+        if found is None:
+            return None
+        slot, (_, key_len, value_len, expires, _, _) = found
+        if expires and expires < now:
+            return None
+        # A lone byte store; racing readers can only set the same bit
+        mm[slot + REFERENCED] = 1
+        start = slot + SLOT.size + key_len
+        return bytes(mm[start:start + value_len])
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        with self._locked(exclusive=False) as mm:
+            return self._read(mm, key, time.time())
+
+    def get_many(self, keys: Sequence[bytes]) -> List[Optional[bytes]]:
+        """여러 키를 공유 락 한 번으로 조회 (키 순서대로, 없으면 None)"""
+        with self._locked(exclusive=False) as mm:
+            now = time.time()
+            return [self._read(mm, key, now) for key in keys]
+
+    def _used(self, mm: mmap.mmap, delta: int) -> None:
+        used, = COUNTER.unpack_from(mm, self._counter_at)
+        COUNTER.pack_into(mm, self._counter_at, max(0, used + delta))
+
+    def set(self, key: bytes, value: bytes, ttl: float = 0.0) -> bool:
+        """저장 (가장 큰 슬롯보다 크면 저장하지 않고 False)"""
+        needed = SLOT.size + len(key) + len(value)
+        cls = next((i for i, (slot_size, _, _) in enumerate(self.classes) if slot_size >= needed), None)
+        if cls is None:
+            return False
+        key_hash = self._hash(key)
+        slot_size = self.classes[cls][0]
+        with self._locked(exclusive=True) as mm:
+            found = self._find(mm, key, key_hash)
+            if found is not None:
+                mm[found[0] + USED] = 0
+                self._used(mm, -1)
+            hand_at, base = self._set_of(cls, key_hash)
+            slot = self._victim(mm, hand_at, base, slot_size)
+            if mm[slot + USED]:
+                mm[slot + USED] = 0
+                self._used(mm, -1)
+            # Publish the slot only once key and value are in place
+            expires = time.time() + ttl if ttl > 0 else 0.0
+            SLOT.pack_into(mm, slot, key_hash, len(key), len(value), expires, 0, 0)
+            start = slot + SLOT.size
+            mm[start:start + len(key)] = key
+            mm[start + len(key):start + len(key) + len(value)] = value
+            mm[slot + USED] = 1
+            self._used(mm, 1)
+        return True
+
+    def _victim(self, mm: mmap.mmap, hand_at: int, base: int, slot_size: int) -> int:
+        """빈 슬롯, 없으면 CLOCK: 참조 비트를 지우며 돌다가 꺼진 슬롯을 교체"""
+        for way in range(self.ways):
+            if not mm[base + way * slot_size + USED]:
+                return base + way * slot_size
+        hand = mm[hand_at] % self.ways
+        while True:
+            slot = base + hand * slot_size
+            hand = (hand + 1) % self.ways
+            if mm[slot + REFERENCED]:
+                mm[slot + REFERENCED] = 0
+                continue
+            mm[hand_at] = hand
+            return slot
+
+    def delete(self, key: bytes) -> None:
+        key_hash = self._hash(key)
+        with self._locked(exclusive=True) as mm:
+            found = self._find(mm, key, key_hash)
+            if found is not None:
+                mm[found[0] + USED] = 0
+                self._used(mm, -1)
+
+    def clear(self) -> None:
+        with self._locked(exclusive=True) as mm:
+            start = self._counter_at
+            mm[start:self.size] = bytes(self.size - start)
+
+    def __len__(self) -> int:
+        """사용 중인 슬롯 수 (만료됐지만 아직 교체되지 않은 항목 포함)"""
+        with self._locked(exclusive=False) as mm:
+            return COUNTER.unpack_from(mm, self._counter_at)[0]
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class SharedItemCache:
+    """ItemCache 와 같은 인터페이스의 워커 간 공유 아이템 캐시 (ITEM_CACHE_BACKEND=shared)
+
+    페이로드는 JSON 으로 저장하므로 datetime 은 ISO 문자열로 돌아오며, SearchItem
+    스키마가 다시 파싱한다. 적중률 통계는 워커별이다.
+    """
+
+    def __init__(self, store: SharedMemoryStore, ttl: float):
+        self.store = store
+        self.ttl = ttl
+        self.capacity = store.capacity
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    @staticmethod
+    def _key(item_id: int) -> bytes:
+        return b"item:%d" % item_id
+
+    def _decode(self, item_id: int, raw: bytes) -> Optional[dict]:
+        """페이로드 복원 (깨진 항목은 지우고 미스로 처리)"""
+        try:
+            return json.loads(raw)
+        except ValueError as e:
+            logger.warning(f"Dropping undecodable shared cache entry for item {item_id}: {e}")
+            self.store.delete(self._key(item_id))
+            return None
+
+    def get_many(self, ids: Iterable[int]) -> Tuple[Dict[int, dict], List[int]]:
+        """(캐시에 있는 id -> 페이로드, 없는 id 목록) 반환"""
+        ids = list(ids)
+        found, missing = {}, []
+        raws = self.store.get_many([self._key(item_id) for item_id in ids])
+        for item_id, raw in zip(ids, raws):
+            payload = self._decode(item_id, raw) if raw is not None else None
+            if payload is not None:
+                found[item_id] = payload
+            else:
+                missing.append(item_id)
+
+        self.hits += len(found)
+        self.misses += len(missing)
+        metrics.CACHE_REQUESTS_TOTAL.labels(cache="items", result="hit").inc(len(found))
+        metrics.CACHE_REQUESTS_TOTAL.labels(cache="items", result="miss").inc(len(missing))
+        return found, missing
+
+    def put_many(self, payloads: Dict[int, dict]) -> None:
+        for item_id, payload in payloads.items():
+            encoded = json.dumps(payload, default=_json_default, ensure_ascii=False).encode()
+            self.store.set(self._key(item_id), encoded, self.ttl)
+
+    def invalidate(self, ids: Iterable[int]) -> None:
+        for item_id in ids:
+            self.store.delete(self._key(item_id))
+
+    def apply_changes(self, rows: Sequence[Sequence], deleted_ids: Sequence[int]) -> None:
+        """변경 피드 리스너: 변경/삭제된 id 무효화 (rows 의 첫 컬럼이 id)"""
+        self.invalidate(row[0] for row in rows)
+        self.invalidate(deleted_ids)
+
+    def clear(self) -> None:
+        self.store.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self.store),
+            "capacity": self.capacity,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "backend": "shared",
+        }
@@ -0,0 +1,54 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable
+import asyncio
+import logging
+
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """동일 키 동시 요청 병합 (singleflight)
+
+    같은 키로 실행 중인 작업이 있으면 새로 실행하지 않고 그 결과를 함께 기다린다.
+    작업은 별도 태스크로 실행되므로 먼저 온 요청이 취소되어도 나머지 요청은
+    결과를 받는다. 완료되면 키를 지우므로 결과를 캐시하지는 않는다.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self.executed = 0
+        self.coalesced = 0
+        metrics.SINGLEFLIGHT_INFLIGHT.labels(name=name).set_function(lambda: len(self._inflight))
+        metrics.SINGLEFLIGHT_COALESCING_RATIO.labels(name=name).set_function(lambda: self.coalescing_ratio)
+
+    @property
+    def coalescing_ratio(self) -> float:
+        """병합된 요청 비율 (병합 / 전체)"""
+        total = self.executed + self.coalesced
+        return self.coalesced / total if total else 0.0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """key 로 fn 을 한 번만 실행하고 동시 호출자와 결과 공유"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+            self.executed += 1
+            metrics.SINGLEFLIGHT_REQUESTS_TOTAL.labels(name=self.name, role="leader").inc()
+        else:
+            self.coalesced += 1
+            metrics.SINGLEFLIGHT_REQUESTS_TOTAL.labels(name=self.name, role="follower").inc()
+
+        # shield: a cancelled caller must not cancel the shared execution
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict:
+        return {
+            "inflight": len(self._inflight),
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "coalescing_ratio": round(self.coalescing_ratio, 4),
+        }
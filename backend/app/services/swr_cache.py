@@ -0,0 +1,102 @@
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+import asyncio
+import logging
+import time
+
+from app.services.singleflight import SingleFlight
+from app import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    __slots__ = ("value", "stored_at")
+
+    def __init__(self, value: Any):
+        self.value = value
+        self.stored_at = time.monotonic()
+
+    @property
+    def age(self) -> float:
+        return time.monotonic() - self.stored_at
+
+
+class SWRCache:
+    """stale-while-revalidate TTL 캐시
+
+    ttl 이내의 값은 그대로 반환한다. ttl 이 지났지만 ttl + stale_ttl 이내면 기존 값을
+    즉시 반환하고 키당 최대 하나의 백그라운드 갱신을 시작한다. 값이 없거나 그보다
+    오래되었으면 로드를 기다린다(동시 로드는 하나로 병합).
+
+    백그라운드 갱신은 요청이 끝난 뒤에도 실행되므로 loader 는 요청 세션이 아니라
+    자체 세션을 열어야 한다.
+    """
+
+    def __init__(self, name: str, ttl: float, stale_ttl: float):
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: Dict[Hashable, _Entry] = {}
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        self._loads = SingleFlight(f"{name}-cache")
+
+    async def get(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Tuple[Any, float]:
+        """(값, 값의 나이(초)) 반환"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = entry.age
+            if age < self.ttl:
+                metrics.CACHE_REQUESTS_TOTAL.labels(cache=self.name, result="hit").inc()
+                return entry.value, age
+            if age < self.ttl + self.stale_ttl:
+                metrics.CACHE_REQUESTS_TOTAL.labels(cache=self.name, result="stale").inc()
+                self._revalidate(key, loader)
+                return entry.value, age
+
+        metrics.CACHE_REQUESTS_TOTAL.labels(cache=self.name, result="miss").inc()
+        value = await self._loads.do(key, lambda: self._load(key, loader))
+        return value, 0.0
+
+    async def _load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        value = await loader()
+        self._entries[key] = _Entry(value)
+        return value
+
+    def _revalidate(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> None:
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            try:
+                await self._load(key, loader)
+            except Exception as e:
+                # Keep serving the stale value; the next stale read retries
+                logger.error(f"Cache refresh failed for {self.name}:{key}: {e}")
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(refresh())
+
+    def age(self, key: Hashable) -> Optional[float]:
+        entry = self._entries.get(key)
+        return entry.age if entry is not None else None
+
+    def clear(self) -> None:
+        for task in self._refreshing.values():
+            task.cancel()
+        self._refreshing.clear()
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "ttl_seconds": self.ttl,
+            "stale_ttl_seconds": self.stale_ttl,
+            "keys": {
+                str(key): {
+                    "age_seconds": round(entry.age, 3),
+                    "fresh": entry.age < self.ttl,
+                    "refreshing": key in self._refreshing,
+                }
+                for key, entry in self._entries.items()
+            },
+        }
@@ -0,0 +1,199 @@
+from sqlalchemy import select, func, text
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+from typing import List, Optional
+from datetime import datetime, timedelta
+import asyncio
+import logging
+import time
+
+from app.config import settings
+from app.database import db_router, init_db
+from app.schemas import SearchQuery
+from app.services.change_feed import change_feed
+from app.services.cpu_executor import cpu_executor
+from app.services.heavy_hitters import query_sketch
+from app.services.latency_sketch import latency_sketches
+from app.services.log_partitions import log_partitions
+from app.services.index_snapshot import load_or_build_index, snapshot_loop
+from app.services.item_cache import item_cache
+from app.services.autocomplete_cache import autocomplete_cache
+from app.services.search_index import search_index
+from app.services.search_service import SearchService
+
+logger = logging.getLogger(__name__)
+
+
+class StartupState:
+    """시작 파이프라인 진행 상태 (/ready 가 참조)"""
+
+    def __init__(self):
+        self.phase = "starting"
+        self.ready = False
+        self.started_at = datetime.now()
+        self.ready_at: Optional[datetime] = None
+        self.error: Optional[str] = None
+        self.details = {}
+
+    def advance(self, phase: str) -> None:
+        self.phase = phase
+        logger.info(f"Startup phase: {phase}")
+
+    def mark_ready(self) -> None:
+        self.phase = "ready"
+        self.ready = True
+        self.ready_at = datetime.now()
+        self.error = None
+        logger.info(f"Application ready after {(self.ready_at - self.started_at).total_seconds():.1f}s")
+
+    def reset(self) -> None:
+        self.__init__()
+
+
+startup_state = StartupState()
+
+# Long-running tasks started by the pipeline, cancelled on shutdown
+_background_tasks: List[asyncio.Task] = []
+
+
+async def warm_pool(db_engine: AsyncEngine, connections: int) -> int:
+    """풀 연결을 미리 열어 두고 반환 (첫 요청의 연결 수립 지연 제거)"""
+    async def _open():
+        conn = await db_engine.connect()
+        await conn.execute(text("SELECT 1"))
+        return conn
+
+    opened = await asyncio.gather(*(_open() for _ in range(connections)), return_exceptions=True)
+    warmed = 0
+    for conn in opened:
+        if isinstance(conn, Exception):
+            logger.warning(f"Pool warmup connection failed: {conn}")
+            continue
+        await conn.close()
+        warmed += 1
+    return warmed
+
+
+async def replay_top_queries(session_factory: async_sessionmaker, limit: int) -> int:
+    """최근 search_logs 상위 검색어를 로그 없이 재실행해 캐시 예열"""
+    async with session_factory() as db:
+        logs = log_partitions.source(since=log_partitions.now() - timedelta(days=settings.SEARCH_LOG_RECENT_DAYS))
+        stmt = select(logs.c.query)\
+            .group_by(logs.c.query)\
+            .order_by(func.count(logs.c.id).desc())\
+            .limit(limit)
+        result = await db.execute(stmt)
+        queries = [row[0] for row in result.fetchall()]
+
+        replayed = 0
+        for query in queries:
+            try:
+                service = SearchService(db)
+                await service.search(SearchQuery(q=query), log=False)
+                await service.get_facets(query)
+                replayed += 1
+            except Exception as e:
+                logger.warning(f"Warmup query '{query}' failed: {e}")
+                await db.rollback()
+        return replayed
+
+
+async def _start_index() -> None:
+    await load_or_build_index(
+        search_index,
+        change_feed,
+        db_router.read_session,
+        settings.SEARCH_INDEX_SNAPSHOT_PATH
+    )
+    change_feed.start(db_router.read_session)
+    if settings.SEARCH_INDEX_SNAPSHOT_PATH:
+        _background_tasks.append(asyncio.create_task(snapshot_loop(
+            search_index,
+            change_feed,
+            settings.SEARCH_INDEX_SNAPSHOT_PATH,
+            settings.SEARCH_INDEX_SNAPSHOT_INTERVAL_SECONDS
+        )))
+
+
+async def run_startup(state: StartupState = startup_state) -> None:
+    """시작 파이프라인: 스키마 확인 -> 풀/인덱스 준비 -> 상위 쿼리 재실행 -> ready
+
+    스키마 단계가 실패하면(DB 미기동 등) 재시도한다. 이후 단계의 실패는
+    기록만 하고 계속 진행한다(인덱스가 없으면 SQL 경로로 서빙).
+    """
+    start_time = time.time()
+
+    while True:
+        try:
+            state.advance("schema")
+            await init_db()
+            break
+        except Exception as e:
+            state.error = f"schema: {e}"
+            logger.error(f"Schema initialization failed, retrying: {e}")
+            await asyncio.sleep(settings.STARTUP_RETRY_INTERVAL_SECONDS)
+
+    state.advance("pool")
+    state.details["pool_connections"] = await warm_pool(db_router.primary, settings.STARTUP_POOL_WARM_CONNECTIONS)
+    if db_router.replica is not None:
+        state.details["replica_pool_connections"] = await warm_pool(db_router.replica, settings.STARTUP_POOL_WARM_CONNECTIONS)
+
+    # Registered before either path starts the feed, so the caches see every change
+    change_feed.add_listener(item_cache)
+    change_feed.add_listener(autocomplete_cache)
+
+    if settings.SEARCH_INDEX_ENABLED:
+        state.advance("index")
+        try:
+            await _start_index()
+            state.details["index_items"] = search_index.size
+        except Exception as e:
+            state.error = f"index: {e}"
+            logger.error(f"Search index build failed, serving from SQL: {e}")
+
+    # The change feed also drives the data version behind HTTP ETags
+    if not change_feed.running:
+        try:
+            if change_feed.data_version is None:
+                async with db_router.read_session() as db:
+                    await change_feed.initialize(db)
+            change_feed.start(db_router.read_session)
+        except Exception as e:
+            logger.error(f"Change feed start failed, ETags disabled: {e}")
+
+    # Period tables must be known before search_logs aggregations run
+    try:
+        async with db_router.primary.connect() as conn:
+            await conn.run_sync(log_partitions.refresh)
+        _background_tasks.append(asyncio.create_task(log_partitions.run(db_router.primary)))
+    except Exception as e:
+        logger.error(f"Search log partition discovery failed: {e}")
+    _background_tasks.append(asyncio.create_task(query_sketch.run(db_router.write_session)))
+    _background_tasks.append(asyncio.create_task(latency_sketches.run(db_router.write_session)))
+
+    if settings.STARTUP_REPLAY_QUERIES > 0:
+        state.advance("warmup")
+        try:
+            state.details["replayed_queries"] = await replay_top_queries(
+                db_router.read_session,
+                settings.STARTUP_REPLAY_QUERIES
+            )
+        except Exception as e:
+            logger.error(f"Query replay failed: {e}")
+
+    state.details["startup_seconds"] = round(time.time() - start_time, 2)
+    state.mark_ready()
+
+
+def start_pipeline() -> None:
+    """시작 파이프라인을 백그라운드로 실행 (서버는 즉시 liveness 에 응답)"""
+    _background_tasks.append(asyncio.create_task(run_startup()))
+
+
+async def shutdown() -> None:
+    """파이프라인/백그라운드 작업 정리"""
+    for task in _background_tasks:
+        task.cancel()
+    await asyncio.gather(*_background_tasks, return_exceptions=True)
+    _background_tasks.clear()
+    await change_feed.stop()
+    cpu_executor.shutdown()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+CPU 오프로드 벤치마크
+하이라이트가 큰 배치 검색과 가벼운 요청이 섞인 부하에서 이벤트 루프 지연을
+오프로드 없이(모두 루프에서 실행) / 있을 때(CpuExecutor 기본 임계값) 비교합니다.
+
+사용법: python scripts/bench_cpu_offload.py [--seconds 5] [--heavy-pages 50]
+"""
+
+import argparse
+import asyncio
+import random
+import string
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.services.cpu_executor import CpuExecutor
+
+
+def make_pages(pages: int, size: int, rng: random.Random):
+    """배치 검색 하나 분량의 (검색어, 제목 목록)"""
+    alphabet = string.ascii_lowercase + " "
+    return [
+        (rng.choice(string.ascii_lowercase), ["".join(rng.choices(alphabet, k=255)) for _ in range(size)])
+        for _ in range(pages)
+    ]
+
+
+async def probe(lags: list, stop: asyncio.Event, interval: float = 0.001):
+    """interval 마다 깨어나 늦어진 시간(루프 지연) 기록"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, loop.time() - expected) * 1000)
+
+
+async def light_client(latencies: list, stop: asyncio.Event, executor: CpuExecutor, rng: random.Random):
+    """자동완성 같은 작은 요청: 한 페이지 하이라이트 (항상 루프에서 실행되는 크기)"""
+    page = make_pages(1, 10, rng)
+    while not stop.is_set():
+        # Latency counts from when the request would have arrived, including time queued behind the loop
+        arrived = time.perf_counter() + 0.005
+        await asyncio.sleep(0.005)
+        await executor.highlight(page)
+        latencies.append((time.perf_counter() - arrived) * 1000)
+
+
+async def heavy_client(done: list, stop: asyncio.Event, executor: CpuExecutor, pages: list):
+    while not stop.is_set():
+        await executor.highlight(pages)
+        done.append(1)
+        await asyncio.sleep(0)
+
+
+async def run(label: str, executor: CpuExecutor, seconds: float, heavy_clients: int, pages: list):
+    rng = random.Random(7)
+    stop = asyncio.Event()
+    lags, latencies, done = [], [], []
+    tasks = [asyncio.create_task(probe(lags, stop))]
+    tasks += [asyncio.create_task(light_client(latencies, stop, executor, rng)) for _ in range(20)]
+    tasks += [asyncio.create_task(heavy_client(done, stop, executor, pages)) for _ in range(heavy_clients)]
+    # Let the process pool start before measuring
+    await executor.highlight(pages)
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*tasks)
+
+    lag = np.array(lags)
+    light = np.array(latencies)
+    print(
+        f"{label:<10} loop lag p50={np.percentile(lag, 50):6.2f}ms p99={np.percentile(lag, 99):7.2f}ms "
+        f"max={lag.max():7.2f}ms | light p99={np.percentile(light, 99):7.2f}ms "
+        f"| heavy batches/s={len(done) / seconds:6.1f}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--heavy-clients", type=int, default=2)
+    parser.add_argument("--heavy-pages", type=int, default=50, help="queries per heavy batch (100 titles each)")
+    args = parser.parse_args()
+
+    pages = make_pages(args.heavy_pages, 100, random.Random(42))
+    inline = CpuExecutor(processes=0, threads=1, thread_min_cost=sys.maxsize, process_min_cost=sys.maxsize)
+    offload = CpuExecutor(processes=max(1, settings.CPU_OFFLOAD_PROCESSES))
+    try:
+        await run("inline", inline, args.seconds, args.heavy_clients, pages)
+        await run("offload", offload, args.seconds, args.heavy_clients, pages)
+    finally:
+        offload.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,7 +7,11 @@ from httpx import AsyncClient
 from faker import Faker
 
 from app.main import app
-from app.database import get_db
+from app.database import get_db, get_read_db, get_analytics_db, get_read_sessions, get_analytics_sessions
+from app.api.search import aggregate_cache
+from app.services.item_cache import item_cache
+from app.services.autocomplete_cache import autocomplete_cache
+from app.rate_limit import rate_limiter
 from app.models import Base, SearchItem
 from app.config import settings
 
@@ -38,6 +42,9 @@ def event_loop():
 @pytest.fixture(scope="function")
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """Create test database session"""
+    # Ids restart with every fresh schema, so cached payloads must not leak between tests
+    item_cache.clear()
+    autocomplete_cache.clear()
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
@@ -55,6 +62,12 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_analytics_db] = override_get_db
+    app.dependency_overrides[get_read_sessions] = lambda: TestSessionLocal
+    app.dependency_overrides[get_analytics_sessions] = lambda: TestSessionLocal
+    aggregate_cache.clear()
+    rate_limiter.reset()
     
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
@@ -0,0 +1,71 @@
+"""
+통합 테스트: 입장 제어 미들웨어
+"""
+import asyncio
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from app.admission import AdmissionClass, AdmissionController, AdmissionControlMiddleware
+
+
+@pytest.fixture
+def overloaded_app():
+    """집계 엔드포인트 동시 실행 1, 대기 예산 20ms 인 앱"""
+    release = asyncio.Event()
+    app = FastAPI()
+
+    @app.get("/api/search/stats")
+    async def stats():
+        await release.wait()
+        return {"ok": True}
+
+    @app.get("/api/autocomplete")
+    async def autocomplete():
+        return {"suggestions": []}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    controller = AdmissionController(
+        {
+            "critical": AdmissionClass("critical", 0, 8, 20.0),
+            "background": AdmissionClass("background", 2, 1, 20.0),
+        },
+        {"/api/autocomplete": "critical", "/api/search/stats": "background", "/health": None},
+        global_limit=4,
+    )
+    app.add_middleware(AdmissionControlMiddleware, controller=controller)
+    return app, release
+
+
+class TestAdmissionMiddleware:
+    """입장 제어 미들웨어 테스트"""
+
+    @pytest.mark.integration
+    async def test_sheds_background_but_admits_autocomplete(self, overloaded_app):
+        """집계 요청이 밀려도 autocomplete 는 통과, 초과 집계 요청은 503 + Retry-After"""
+        app, release = overloaded_app
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            running = asyncio.create_task(ac.get("/api/search/stats"))
+            await asyncio.sleep(0.01)
+
+            shed = await ac.get("/api/search/stats")
+            assert shed.status_code == 503
+            assert shed.headers["retry-after"] == "1"
+            assert shed.json()["priority_class"] == "background"
+
+            fast = await ac.get("/api/autocomplete")
+            assert fast.status_code == 200
+
+            assert (await ac.get("/health")).status_code == 200
+
+            release.set()
+            assert (await running).status_code == 200
+
+    @pytest.mark.integration
+    async def test_main_app_admits_normal_traffic(self, client):
+        """기본 설정에서는 일반 요청이 그대로 처리됨"""
+        response = await client.get("/api/autocomplete", params={"q": "ab"})
+        assert response.status_code == 200
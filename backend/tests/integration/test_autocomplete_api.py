@@ -59,3 +59,88 @@ async def test_autocomplete_various_queries(client: AsyncClient, sample_items, q
     data = response.json()
     assert len(data["suggestions"]) <= limit
 
+
+
+@pytest.mark.integration
+async def test_autocomplete_superseded_by_same_session(client: AsyncClient, sample_items, monkeypatch):
+    """같은 세션의 새 키 입력이 오면 처리 중인 이전 요청은 취소되고 409"""
+    import asyncio
+    from app.services.search_service import SearchService
+
+    original = SearchService.autocomplete_candidates
+    cancelled = []
+
+    async def slow_for_short_prefix(self, partial_query, limit=10):
+        if len(partial_query) == 1:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(partial_query)
+                raise
+        return await original(self, partial_query, limit)
+
+    monkeypatch.setattr(SearchService, "autocomplete_candidates", slow_for_short_prefix)
+    headers = {"X-Session-Id": "typing-1"}
+
+    older = asyncio.create_task(client.get("/api/autocomplete", params={"q": "t"}, headers=headers))
+    await asyncio.sleep(0.05)
+    newer = await client.get("/api/autocomplete", params={"q": "te"}, headers=headers)
+
+    assert newer.status_code == 200
+    assert (await older).status_code == 409
+    assert cancelled == ["t"]
+
+    stats = (await client.get("/api/search/cache-stats")).json()["autocomplete_sessions"]
+    assert stats["cancelled"] >= 1
+    assert stats["inflight"] == 0
+
+
+@pytest.mark.integration
+async def test_autocomplete_refines_cached_prefix(client: AsyncClient, sample_items, monkeypatch):
+    """짧은 접두어의 완전한 후보 목록으로 긴 접두어에 응답 (DB 조회 없음)"""
+    from app.services.search_service import SearchService
+
+    original = SearchService.autocomplete_candidates
+    calls = []
+
+    async def counting(self, partial_query, limit=10):
+        calls.append(partial_query)
+        return await original(self, partial_query, limit)
+
+    monkeypatch.setattr(SearchService, "autocomplete_candidates", counting)
+    title = sample_items[0].title
+
+    first = await client.get("/api/autocomplete", params={"q": title[:1], "limit": 20})
+    second = await client.get("/api/autocomplete", params={"q": title[:3], "limit": 20})
+
+    assert first.status_code == second.status_code == 200
+    assert title in second.json()["suggestions"]
+    assert calls == [title[:1]]
+
+
+@pytest.mark.integration
+async def test_autocomplete_cache_follows_title_changes(client: AsyncClient, db_session, sample_items):
+    """변경 피드로 전달된 제목 변경이 캐시된 접두어에 반영"""
+    from sqlalchemy import update
+    from app.models import SearchItem
+    from app.services.autocomplete_cache import autocomplete_cache
+    from app.services.change_feed import ChangeFeed
+    from app.services.search_index import SearchIndex
+
+    feed = ChangeFeed(SearchIndex())
+    feed.add_listener(autocomplete_cache)
+    await feed.initialize(db_session)
+
+    target_id, title = sample_items[0].id, sample_items[0].title
+    others = {item.title for item in sample_items[1:]}
+    before = await client.get("/api/autocomplete", params={"q": title[:2], "limit": 20})
+    assert title in before.json()["suggestions"]
+
+    await db_session.execute(update(SearchItem).where(SearchItem.id == target_id).values(title="zz renamed"))
+    await db_session.commit()
+    await feed.poll_once(db_session)
+
+    after = await client.get("/api/autocomplete", params={"q": title[:2], "limit": 20})
+    renamed = await client.get("/api/autocomplete", params={"q": "zz", "limit": 20})
+    assert (title in after.json()["suggestions"]) == (title in others)
+    assert "zz renamed" in renamed.json()["suggestions"]
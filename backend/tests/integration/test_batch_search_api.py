@@ -0,0 +1,102 @@
+"""
+통합 테스트: 배치 검색 API
+"""
+import asyncio
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.config import settings
+from app.models import SearchLog
+from app.services.cpu_executor import cpu_executor
+from app.services.highlight import highlight
+from app.services.search_service import SearchService
+
+
+class TestBatchSearchAPI:
+    """배치 검색 API 테스트"""
+
+    @pytest.mark.integration
+    async def test_results_in_request_order(self, client: AsyncClient, sample_items):
+        """결과는 요청 순서를 유지하고 단건 검색과 일치"""
+        queries = [{"q": "a"}, {"q": "e", "size": 5}, {"q": "a", "category": "도서"}]
+        response = await client.post("/api/search/batch", json={"queries": queries})
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert [result["query"] for result in results] == ["a", "e", "a"]
+
+        single = (await client.get("/api/search?q=e&size=5")).json()
+        assert results[1]["total"] == single["total"]
+        assert [item["id"] for item in results[1]["items"]] == [item["id"] for item in single["items"]]
+        assert all(item["category"] == "도서" for item in results[2]["items"])
+
+    @pytest.mark.integration
+    async def test_identical_queries_run_once(self, client: AsyncClient, db_session, sample_items):
+        """동일 쿼리는 한 번만 실행하되 로그는 쿼리마다 기록"""
+        queries = [{"q": "a"}, {"q": "A"}, {"q": "a"}, {"q": "b"}]
+        data = (await client.post("/api/search/batch", json={"queries": queries})).json()
+        assert data["unique_queries"] == 2
+        assert data["results"][0]["total"] == data["results"][1]["total"] == data["results"][2]["total"]
+
+        logged = await db_session.scalar(select(func.count(SearchLog.id)))
+        assert logged == 4
+
+    @pytest.mark.integration
+    async def test_query_error_does_not_fail_batch(self, client: AsyncClient, sample_items, monkeypatch):
+        """개별 쿼리 실패는 해당 결과의 error 에 고정된 사유로만 표시"""
+        original = SearchService.search
+
+        async def flaky_search(self, query, log=True):
+            if query.q == "boom":
+                raise RuntimeError("SELECT secret FROM search_items WHERE id = 1")
+            if query.q == "slow":
+                raise asyncio.TimeoutError()
+            return await original(self, query, log)
+
+        monkeypatch.setattr(SearchService, "search", flaky_search)
+        queries = [{"q": "a"}, {"q": "boom"}, {"q": "slow"}]
+        data = (await client.post("/api/search/batch", json={"queries": queries})).json()
+        assert data["results"][0]["error"] is None
+        # Exception text (SQL, parameters) stays in the server log
+        assert data["results"][1]["error"] == "internal error"
+        assert data["results"][1]["items"] == []
+        assert data["results"][2]["error"] == "timeout"
+
+    @pytest.mark.integration
+    async def test_concurrency_is_bounded(self, client: AsyncClient, sample_items, monkeypatch):
+        """동시 실행 수는 BATCH_SEARCH_CONCURRENCY 이하"""
+        monkeypatch.setattr(settings, "BATCH_SEARCH_CONCURRENCY", 2)
+        original = SearchService.search
+        active, peak = 0, 0
+
+        async def tracked_search(self, query, log=True):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            try:
+                return await original(self, query, log)
+            finally:
+                active -= 1
+
+        monkeypatch.setattr(SearchService, "search", tracked_search)
+        queries = [{"q": letter} for letter in "abcdef"]
+        response = await client.post("/api/search/batch", json={"queries": queries})
+        assert response.status_code == 200
+        assert peak == 2
+
+    @pytest.mark.integration
+    async def test_rejects_empty_batch(self, client: AsyncClient):
+        """빈 배치는 422"""
+        response = await client.post("/api/search/batch", json={"queries": []})
+        assert response.status_code == 422
+
+    @pytest.mark.integration
+    async def test_highlights_off_event_loop(self, client: AsyncClient, sample_items, monkeypatch):
+        """스레드로 보낸 하이라이트도 쿼리별 결과에 그대로 반영"""
+        monkeypatch.setattr(cpu_executor, "thread_min_cost", 0)
+        queries = [{"q": "a"}, {"q": "boom-no-match"}, {"q": "e"}]
+        data = (await client.post("/api/search/batch", json={"queries": queries})).json()
+        for query, result in zip(queries, data["results"]):
+            for item in result["items"]:
+                assert item["highlight"] == highlight(item["title"], query["q"])
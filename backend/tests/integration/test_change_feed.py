@@ -0,0 +1,159 @@
+"""
+통합 테스트: 변경 피드 기반 인덱스 증분 갱신
+"""
+import pytest
+from sqlalchemy import delete, update
+
+from app.models import SearchItem
+from app.services.change_feed import ChangeFeed
+from app.services.search_index import SearchIndex
+
+
+@pytest.fixture
+async def feed(db_session, sample_items):
+    index = SearchIndex()
+    feed = ChangeFeed(index, batch_size=7)
+    await feed.initialize(db_session)
+    await index.build(db_session)
+    return feed
+
+
+class TestChangeFeed:
+    """ChangeFeed 테스트"""
+
+    @pytest.mark.integration
+    async def test_initialize_sets_watermark(self, feed, sample_items):
+        """워터마크 초기화 테스트"""
+        assert feed.watermark is not None
+        assert feed.watermark[1] in {item.id for item in sample_items}
+
+    @pytest.mark.integration
+    async def test_poll_applies_updates(self, feed, db_session, sample_items):
+        """갱신 반영 테스트"""
+        target = sample_items[0]
+        await db_session.execute(
+            update(SearchItem).where(SearchItem.id == target.id).values(category="신규카테고리")
+        )
+        await db_session.commit()
+
+        assert await feed.poll_once(db_session) > 0
+        match = feed.index.match_bitmap([target.id])
+        assert feed.index.filters.category_counts(match) == {"신규카테고리": 1}
+
+    @pytest.mark.integration
+    async def test_poll_applies_inserts(self, feed, db_session, sample_items):
+        """추가 반영 테스트 (여러 배치)"""
+        for i in range(10):
+            db_session.add(SearchItem(title=f"feed item {i}", category="도서", price=100.0))
+        await db_session.commit()
+
+        await feed.poll_once(db_session)
+        assert feed.index.size == len(sample_items) + 10
+
+    @pytest.mark.integration
+    async def test_idle_poll_delivers_nothing(self, feed, db_session, sample_items):
+        """변경이 없으면 lookback 구간을 다시 읽어도 리스너에 아무것도 전달하지 않음"""
+        delivered = []
+
+        class Recorder:
+            def apply_changes(self, rows, deleted_ids):
+                delivered.append(len(rows))
+
+        feed.add_listener(Recorder())
+        assert await feed.poll_once(db_session) == 0
+        assert await feed.poll_once(db_session) == 0
+        assert delivered == []
+
+        # A second write within the same updated_at second is still delivered once
+        target = sample_items[1]
+        for price in (1.0, 2.0):
+            await db_session.execute(update(SearchItem).where(SearchItem.id == target.id).values(price=price))
+            await db_session.commit()
+            assert await feed.poll_once(db_session) == 1
+        assert await feed.poll_once(db_session) == 0
+        assert delivered == [1, 1]
+
+    @pytest.mark.integration
+    async def test_data_version_tracks_changes(self, feed, db_session, sample_items):
+        """데이터 버전은 추가/삭제 시 변경, 변경 없으면 유지"""
+        version = feed.data_version
+        await feed.poll_once(db_session)
+        assert feed.data_version == version
+
+        await db_session.execute(delete(SearchItem).where(SearchItem.id == sample_items[0].id))
+        await db_session.commit()
+        await feed.reconcile(db_session)
+        assert feed.data_version != version
+
+    @pytest.mark.integration
+    async def test_data_version_tells_deleted_rows_apart(self, feed, db_session, sample_items):
+        """같은 수의 행이 삭제돼도 삭제된 행이 다르면 데이터 버전이 다름"""
+        other = ChangeFeed(SearchIndex())
+        await other.initialize(db_session)
+        await other.index.build(db_session)
+        assert other.data_version == feed.data_version
+
+        feed.index.apply_changes([], [sample_items[0].id])
+        other.index.apply_changes([], [sample_items[1].id])
+        assert other.data_version != feed.data_version
+
+    @pytest.mark.integration
+    async def test_data_version_without_index(self, db_session, sample_items):
+        """인덱스 없이도 워터마크/행 수로 데이터 버전 계산"""
+        feed = ChangeFeed(SearchIndex())
+        assert feed.data_version is None
+        await feed.initialize(db_session)
+        version = feed.data_version
+        assert feed.row_count == len(sample_items)
+
+        db_session.add(SearchItem(title="versioned", category="도서", price=1.0))
+        await db_session.commit()
+        await feed.poll_once(db_session)
+        assert feed.row_count == len(sample_items) + 1
+        assert feed.data_version != version
+
+    @pytest.mark.integration
+    async def test_reconcile_detects_deletes(self, feed, db_session, sample_items):
+        """삭제 감지 테스트"""
+        deleted = [item.id for item in sample_items[:3]]
+        await db_session.execute(delete(SearchItem).where(SearchItem.id.in_(deleted)))
+        await db_session.commit()
+
+        assert await feed.reconcile(db_session) == 3
+        assert feed.index.tombstones == 3
+        assert feed.index.match_bitmap(deleted[:1]) is None
+
+    @pytest.mark.integration
+    async def test_freshness_lag(self, feed, db_session):
+        """freshness lag 측정 테스트"""
+        await feed.poll_once(db_session)
+        assert 0 <= feed.freshness_lag < 5
+
+
+class TestIndexSnapshotStartup:
+    """스냅샷 기반 시작 테스트"""
+
+    @pytest.mark.integration
+    async def test_load_or_build_index(self, db_session, sample_items, tmp_path):
+        """첫 시작은 DB 빌드 후 스냅샷 저장, 이후 시작은 스냅샷 적재"""
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        from app.services.index_snapshot import load_or_build_index
+
+        session_factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+        path = str(tmp_path / "index.snap")
+
+        first = SearchIndex()
+        first_feed = ChangeFeed(first)
+        assert await load_or_build_index(first, first_feed, session_factory, path) == "database"
+
+        second = SearchIndex()
+        second_feed = ChangeFeed(second)
+        assert await load_or_build_index(second, second_feed, session_factory, path) == "snapshot"
+        assert second.ids.tolist() == first.ids.tolist()
+        assert second_feed.watermark == first_feed.watermark
+
+        # The resumed feed catches up with rows written after the snapshot
+        db_session.add(SearchItem(title="after snapshot", category="도서", price=1.0))
+        await db_session.commit()
+        await second_feed.poll_once(db_session)
+        assert second.size == len(sample_items) + 1
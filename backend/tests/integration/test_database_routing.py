@@ -0,0 +1,73 @@
+"""
+통합 테스트: primary/replica 세션 라우팅 (SQLite 파일 두 개로 대체)
+"""
+import pytest
+from sqlalchemy import func, select
+
+from app.database import DatabaseRouter, create_engine
+from app.models import Base, SearchItem, SearchLog
+from app.schemas import SearchQuery
+from app.services.search_service import SearchService
+from app.services.search_index import SearchIndex
+
+
+@pytest.fixture
+async def router(tmp_path):
+    primary = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}", 10, 20)
+    replica = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}", 10, 20)
+    analytics = create_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}", 2, 1)
+    router = DatabaseRouter(primary, replica=replica, analytics=analytics)
+    for engine in (primary, replica):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    # Only the replica holds the item, so results prove where reads went
+    async with router.replica.begin() as conn:
+        await conn.execute(SearchItem.__table__.insert().values(title="replica laptop", category="전자제품"))
+    yield router
+    await router.dispose()
+
+
+async def _count(session, model) -> int:
+    async with session as db:
+        return await db.scalar(select(func.count(model.id)))
+
+
+class TestDatabaseRouter:
+    """DatabaseRouter 테스트"""
+
+    @pytest.mark.integration
+    async def test_search_reads_replica_and_logs_to_primary(self, router):
+        """검색은 replica 에서 읽고 로그는 primary 에 기록"""
+        async with router.read_session() as db, router.write_session() as write_db:
+            service = SearchService(db, index=SearchIndex(), write_db=write_db)
+            items, total, _ = await service.search(SearchQuery(q="laptop"))
+        assert total == 1
+        assert items[0].title == "replica laptop"
+
+        assert await _count(router.write_session(), SearchLog) == 1
+        assert await _count(router.read_session(), SearchLog) == 0
+
+    @pytest.mark.integration
+    async def test_analytics_uses_dedicated_engine(self, router):
+        """분석 세션은 전용 엔진 사용"""
+        async with router.analytics_session() as db:
+            assert db.bind is router.engines["analytics"]
+            stats = await SearchService(db).get_stats()
+        assert stats["total_items"] == 1
+
+    @pytest.mark.integration
+    async def test_reads_fall_back_to_primary(self, router):
+        """replica 장애 표시 시 읽기를 primary 로 전환, 복구 시 원복"""
+        router.mark_replica(False)
+        assert await _count(router.read_session(), SearchItem) == 0
+
+        router.mark_replica(True)
+        assert await _count(router.read_session(), SearchItem) == 1
+
+    @pytest.mark.integration
+    async def test_without_replica_reads_use_primary(self, router):
+        """replica 미설정 시 primary 로 읽기"""
+        single = DatabaseRouter(router.primary)
+        assert single.read_session().bind is router.primary
+        assert single.analytics_session().bind is router.primary
@@ -0,0 +1,53 @@
+"""
+통합 테스트: 검색 결과 스트리밍 내보내기
+"""
+import csv
+import io
+import json
+import pytest
+from httpx import AsyncClient
+
+from app.config import settings
+
+
+class TestExportAPI:
+    """내보내기 API 테스트"""
+
+    @pytest.mark.integration
+    async def test_export_ndjson_matches_search_total(self, client: AsyncClient, sample_items, monkeypatch):
+        """NDJSON 행 수가 검색 total 과 같음 (여러 청크)"""
+        monkeypatch.setattr(settings, "EXPORT_CHUNK_SIZE", 7)
+        total = (await client.get("/api/search?q=a")).json()["total"]
+
+        response = await client.get("/api/search/export?q=a")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert len(rows) == total
+        assert len({row["id"] for row in rows}) == total
+        assert set(rows[0]) >= {"id", "title", "category", "price", "created_at"}
+
+    @pytest.mark.integration
+    async def test_export_csv_with_filters(self, client: AsyncClient, sample_items):
+        """CSV 내보내기 (헤더 + 필터/정렬 적용)"""
+        response = await client.get("/api/search/export?q=a&category=도서&sort=price&order=asc&format=csv")
+        assert response.status_code == 200
+        assert "attachment" in response.headers["content-disposition"]
+
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert all(row["category"] == "도서" for row in rows)
+        prices = [float(row["price"]) for row in rows if row["price"]]
+        assert prices == sorted(prices)
+
+    @pytest.mark.integration
+    async def test_export_csv_empty_result_has_header(self, client: AsyncClient, sample_items):
+        """결과가 없어도 CSV 헤더 출력"""
+        response = await client.get("/api/search/export?q=zzzzzzzzzz&format=csv")
+        assert response.text.splitlines() == ["id,title,description,category,tags,price,popularity,created_at,updated_at"]
+
+    @pytest.mark.integration
+    async def test_export_rejects_unknown_format(self, client: AsyncClient):
+        """지원하지 않는 형식은 422"""
+        response = await client.get("/api/search/export?q=a&format=xml")
+        assert response.status_code == 422
@@ -48,6 +48,21 @@ class TestHealthAPI:
         data = response.json()
         assert "total_items" in data
         assert "total_searches" in data
+    
+    @pytest.mark.integration
+    async def test_stats_served_from_cache(self, client: AsyncClient, sample_items):
+        """집계 캐시 테스트 (Age 헤더, cache-stats 키별 나이)"""
+        first = await client.get("/api/search/stats")
+        await client.get("/api/search?q=test")
+        second = await client.get("/api/search/stats")
+        assert second.json()["total_searches"] == first.json()["total_searches"]
+        assert "age" in second.headers
+        
+        response = await client.get("/api/search/cache-stats")
+        assert response.status_code == 200
+        keys = response.json()["aggregates"]["keys"]
+        assert keys["stats"]["fresh"] is True
+        assert "search_coalescing" in response.json()
 
 
 # 반복 헬스체크 테스트 (총 100개)
@@ -0,0 +1,126 @@
+"""
+통합 테스트: 워커별 검색어 요약 병합과 인기 검색어 API
+"""
+import pytest
+from datetime import datetime, timedelta
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.models import QuerySketchSnapshot, SearchLog
+from app.services.heavy_hitters import BASE_WORKER, SharedQuerySketch
+from app.services.log_partitions import log_partitions
+
+
+@pytest.fixture
+async def fresh_sketch(db_session, monkeypatch):
+    """전역 요약을 테스트 전용 인스턴스로 교체 (DB 시계를 먼저 읽어 started_at 을 맞춤)"""
+    async with db_session.bind.connect() as conn:
+        await conn.run_sync(log_partitions.refresh)
+    sketch = SharedQuerySketch(k=10, width=256, depth=4, half_life=0.0, stale_after=60.0, min_observations=3)
+    monkeypatch.setattr("app.services.search_service.query_sketch", sketch)
+    monkeypatch.setattr("app.api.search.query_sketch", sketch)
+    return sketch
+
+
+class TestSharedQuerySketch:
+    """워커 간 병합 테스트"""
+
+    @pytest.mark.integration
+    async def test_workers_merge_into_shared_snapshot(self, db_session):
+        """두 워커의 요약이 하나의 스냅샷으로 합쳐지고, 멈춘 워커는 기준 행으로 합쳐짐"""
+        now = datetime(2026, 10, 19, 12, 0)
+        first = SharedQuerySketch(k=10, width=256, depth=4, stale_after=60.0, min_observations=0)
+        second = SharedQuerySketch(k=10, width=256, depth=4, stale_after=60.0, min_observations=0)
+        first.worker_id, second.worker_id = "pod-a:1", "pod-b:1"
+        first.record(["노트북"] * 3 + ["마우스"])
+        second.record(["노트북", "키보드", "키보드"])
+
+        await first.sync(db_session, now)
+        await second.sync(db_session, now)
+        assert second.merged_workers == 2
+        assert [(q, c) for q, c, _ in second.top_queries(3)] == [("노트북", 4.0), ("키보드", 2.0), ("마우스", 1.0)]
+
+        await second.sync(db_session, now + timedelta(seconds=120))
+        assert second.merged_workers == 1
+        assert [(q, c) for q, c, _ in second.top_queries(3)] == [("노트북", 4.0), ("키보드", 2.0), ("마우스", 1.0)]
+        rows = await db_session.execute(select(QuerySketchSnapshot.worker_id).order_by(QuerySketchSnapshot.worker_id))
+        assert [row[0] for row in rows] == [BASE_WORKER, "pod-b:1"]
+
+    @pytest.mark.integration
+    async def test_base_is_seeded_from_search_logs_once(self, db_session):
+        """기준 행은 시작 전 search_logs 합계로 한 번만 만들어지고, 워커 수만큼 중복되지 않음"""
+        async with db_session.bind.connect() as conn:
+            await conn.run_sync(log_partitions.refresh)
+        now = log_partitions.now()
+        db_session.add_all([
+            SearchLog(query=query, result_count=1, created_at=now - timedelta(minutes=minutes))
+            for query, minutes in [("iphone 15", 3), ("iPhone 15", 5), ("iPhone 15", 6), ("iphone 15", 4), ("mouse", 1)]
+        ])
+        await db_session.commit()
+
+        workers = [SharedQuerySketch(k=10, width=256, depth=4, min_observations=0) for _ in range(2)]
+        for index, worker in enumerate(workers):
+            worker.worker_id = f"pod-{index}:1"
+            worker.record(["mouse"])
+            await worker.sync(db_session)
+
+        top = workers[1].top_queries(2)
+        # Display form is the most recent spelling, as the search_logs fallback would show it
+        assert [(q, c) for q, c, _ in top] == [("iphone 15", 4.0), ("mouse", 3.0)]
+        assert abs(top[0][2] - (now - timedelta(minutes=3))) < timedelta(seconds=1)
+        rows = await db_session.execute(select(func.count()).select_from(QuerySketchSnapshot))
+        assert rows.scalar() == 3
+
+
+class TestPopularFromSketch:
+    """인기 검색어 API 의 요약 사용 테스트"""
+
+    @pytest.mark.integration
+    async def test_popular_falls_back_to_sql_without_snapshot(self, client: AsyncClient, fresh_sketch):
+        """스냅샷 전에는 search_logs 집계로 응답"""
+        await client.get("/api/search", params={"q": "노트북"})
+        response = await client.get("/api/search/popular")
+        assert response.status_code == 200
+        assert [entry["query"] for entry in response.json()] == ["노트북"]
+        assert fresh_sketch.stats()["snapshot_ready"] is False
+
+    @pytest.mark.integration
+    async def test_popular_served_from_snapshot(self, client: AsyncClient, db_session, fresh_sketch):
+        """스냅샷이 있으면 요약의 상위 검색어로 응답"""
+        for query in ("Laptop", "laptop", "mouse"):
+            await client.get("/api/search", params={"q": query})
+        await fresh_sketch.sync(db_session)
+
+        response = await client.get("/api/search/popular", params={"limit": 2})
+        assert response.status_code == 200
+        assert [(entry["query"], entry["count"]) for entry in response.json()] == [("laptop", 2), ("mouse", 1)]
+
+        suggestions = await client.get("/api/suggestions")
+        assert suggestions.json()["popular"][:2] == ["laptop", "mouse"]
+
+    @pytest.mark.integration
+    async def test_popular_falls_back_to_sql_until_enough_observations(self, client: AsyncClient, db_session, fresh_sketch):
+        """스냅샷이 본 검색이 최소 관측 수보다 적으면 search_logs 집계로 응답"""
+        for query in ("노트북", "노트북"):
+            await client.get("/api/search", params={"q": query})
+        await fresh_sketch.sync(db_session)
+        assert fresh_sketch.snapshot is not None
+        assert fresh_sketch.top_queries(10) is None
+        assert fresh_sketch.stats()["snapshot_ready"] is False
+
+        response = await client.get("/api/search/popular")
+        assert [(entry["query"], entry["count"]) for entry in response.json()] == [("노트북", 2)]
+
+    @pytest.mark.integration
+    async def test_snapshot_timestamps_use_the_log_clock(self, client: AsyncClient, db_session, fresh_sketch):
+        """스냅샷의 마지막 검색 시각은 search_logs.created_at 과 같은 시계"""
+        async with db_session.bind.connect() as conn:
+            await conn.run_sync(log_partitions.refresh)
+        for query in ("laptop", "laptop", "laptop"):
+            await client.get("/api/search", params={"q": query})
+        from_sql = (await client.get("/api/search/popular")).json()[0]["last_searched"]
+        await fresh_sketch.sync(db_session)
+        from_sketch = (await client.get("/api/search/popular")).json()[0]["last_searched"]
+
+        gap = datetime.fromisoformat(from_sketch) - datetime.fromisoformat(from_sql)
+        assert abs(gap) < timedelta(seconds=5)
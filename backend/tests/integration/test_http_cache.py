@@ -0,0 +1,102 @@
+"""
+통합 테스트: ETag / Cache-Control 조건부 요청
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.config import settings
+from app.models import SearchItem, SearchLog
+from app.services.change_feed import change_feed
+
+
+@pytest.fixture
+async def data_version(db_session, sample_items):
+    """전역 변경 피드를 테스트 DB 로 초기화 (ETag 활성화)"""
+    await change_feed.initialize(db_session)
+    yield change_feed
+    change_feed.watermark = None
+    change_feed.row_count = None
+    change_feed.last_caught_up = None
+
+
+class TestHttpCache:
+    """조건부 캐싱 테스트"""
+
+    @pytest.mark.integration
+    async def test_no_etag_without_data_version(self, client: AsyncClient, sample_items):
+        """데이터 버전을 모르면 ETag 없이 Cache-Control 만 설정"""
+        response = await client.get("/api/search?q=a")
+        assert "etag" not in response.headers
+        assert response.headers["cache-control"].startswith("public, max-age=")
+
+    @pytest.mark.integration
+    async def test_search_returns_304_for_matching_etag(self, client: AsyncClient, data_version):
+        """일치하는 If-None-Match 는 304"""
+        response = await client.get("/api/search?q=a")
+        etag = response.headers["etag"]
+
+        cached = await client.get("/api/search?q=a", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+        assert cached.content == b""
+
+    @pytest.mark.integration
+    async def test_revalidated_search_is_logged(self, client: AsyncClient, db_session, data_version):
+        """304 응답도 검색 횟수로 기록 (결과 수/응답 시간 없이)"""
+        etag = (await client.get("/api/search?q=a")).headers["etag"]
+        cached = await client.get("/api/search?q=a", headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+
+        result = await db_session.execute(
+            select(SearchLog.result_count, SearchLog.response_time_ms).where(SearchLog.query == "a").order_by(SearchLog.id)
+        )
+        rows = result.all()
+        assert len(rows) == 2
+        assert rows[1] == (None, None)
+
+    @pytest.mark.integration
+    async def test_search_etag_rolls_over_for_suggestions(self, client: AsyncClient, data_version, monkeypatch):
+        """관련 검색어(search_logs)가 담긴 검색 ETag 는 데이터가 그대로여도 주기마다 바뀜"""
+        now = 1_000_000.0
+        monkeypatch.setattr("app.api.search.time.time", lambda: now)
+        etag = (await client.get("/api/search?q=a")).headers["etag"]
+        assert (await client.get("/api/search?q=a")).headers["etag"] == etag
+
+        now += settings.SEARCH_SUGGESTIONS_ETAG_SECONDS
+        response = await client.get("/api/search?q=a", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.integration
+    async def test_etag_normalizes_query_case(self, client: AsyncClient, data_version):
+        """대소문자만 다른 검색어는 같은 ETag"""
+        lower = await client.get("/api/search?q=abc")
+        upper = await client.get("/api/search?q=ABC")
+        other = await client.get("/api/search?q=abd")
+        assert lower.headers["etag"] == upper.headers["etag"]
+        assert lower.headers["etag"] != other.headers["etag"]
+
+        # LIKE only folds ASCII, so non-ASCII case variants stay distinct
+        accented = await client.get("/api/search?q=é")
+        accented_upper = await client.get("/api/search?q=É")
+        assert accented.headers["etag"] != accented_upper.headers["etag"]
+
+    @pytest.mark.integration
+    async def test_etag_changes_with_data(self, client: AsyncClient, db_session, data_version):
+        """search_items 변경 후 ETag 갱신"""
+        etag = (await client.get("/api/autocomplete?q=a")).headers["etag"]
+
+        db_session.add(SearchItem(title="a new item", category="도서", price=100.0))
+        await db_session.commit()
+        await data_version.poll_once(db_session)
+
+        response = await client.get("/api/autocomplete?q=a", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    @pytest.mark.integration
+    async def test_aggregates_set_max_age(self, client: AsyncClient, sample_items):
+        """집계 엔드포인트는 남은 TTL 만큼 max-age"""
+        response = await client.get("/api/suggestions")
+        assert response.headers["cache-control"].startswith("public, max-age=")
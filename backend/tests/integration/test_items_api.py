@@ -0,0 +1,47 @@
+"""
+통합 테스트: 아이템 일괄 조회 API
+"""
+import pytest
+from httpx import AsyncClient
+
+from app.services.item_cache import item_cache
+
+
+class TestItemsAPI:
+    """아이템 일괄 조회 API 테스트"""
+
+    @pytest.mark.integration
+    async def test_get_items_in_request_order(self, client: AsyncClient, sample_items):
+        """요청 순서대로 반환, 없는 id 는 missing"""
+        ids = [sample_items[5].id, sample_items[0].id, 999999, sample_items[5].id]
+        response = await client.get(f"/api/items?ids={','.join(map(str, ids))}")
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["id"] for item in data["items"]] == [sample_items[5].id, sample_items[0].id]
+        assert data["items"][0]["title"] == sample_items[5].title
+        assert data["missing"] == [999999]
+
+    @pytest.mark.integration
+    async def test_post_items(self, client: AsyncClient, sample_items):
+        """POST 본문으로 조회"""
+        ids = [item.id for item in sample_items[:3]]
+        response = await client.post("/api/items", json={"ids": ids})
+        assert response.status_code == 200
+        assert [item["id"] for item in response.json()["items"]] == ids
+
+    @pytest.mark.integration
+    async def test_repeat_lookup_served_from_cache(self, client: AsyncClient, sample_items):
+        """두 번째 조회는 캐시 적중"""
+        ids = ",".join(str(item.id) for item in sample_items[:4])
+        await client.get(f"/api/items?ids={ids}")
+        hits = item_cache.hits
+        await client.get(f"/api/items?ids={ids}")
+        assert item_cache.hits == hits + 4
+
+    @pytest.mark.integration
+    async def test_invalid_ids(self, client: AsyncClient):
+        """잘못된 id 목록은 422"""
+        assert (await client.get("/api/items?ids=1,abc")).status_code == 422
+        assert (await client.get("/api/items?ids=,")).status_code == 422
+        too_many = ",".join(str(i) for i in range(101))
+        assert (await client.get(f"/api/items?ids={too_many}")).status_code == 422
@@ -0,0 +1,93 @@
+"""
+통합 테스트: 응답 시간 분위수 보고와 워커 간 병합
+"""
+import pytest
+from datetime import datetime, timedelta
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.models import LatencySketchSnapshot, QuerySketchSnapshot
+from app.services.heavy_hitters import SharedQuerySketch
+from app.services.log_partitions import log_partitions
+from app.services.latency_sketch import LatencySketches
+
+
+@pytest.fixture
+def fresh_sketches(monkeypatch):
+    """전역 지연/빈도 요약을 테스트 전용 인스턴스로 교체"""
+    queries = SharedQuerySketch(k=10, width=256, depth=4)
+    latency = LatencySketches(window=3600)
+    monkeypatch.setattr("app.services.search_service.query_sketch", queries)
+    monkeypatch.setattr("app.services.latency_sketch.query_sketch", queries)
+    monkeypatch.setattr("app.services.search_service.latency_sketches", latency)
+    return latency
+
+
+class TestLatencyReporting:
+    """지연 분위수 보고 테스트"""
+
+    @pytest.mark.integration
+    async def test_stats_and_analytics_report_percentiles(self, client: AsyncClient, sample_items, fresh_sketches):
+        """엔드포인트/검색어별 p50/p95/p99 보고"""
+        for value in range(1, 101):
+            fresh_sketches.record_endpoint("/api/search", float(value))
+        for _ in range(3):
+            await client.get("/api/search", params={"q": "노트북"})
+
+        stats = (await client.get("/api/search/stats")).json()
+        latency = stats["latency"]["/api/search"]
+        assert latency["count"] == 100
+        assert latency["p50_ms"] == pytest.approx(50, rel=0.02)
+        assert latency["p99_ms"] == pytest.approx(99, rel=0.02)
+
+        analytics = (await client.get("/api/search/analytics", params={"query": "노트북"})).json()
+        assert analytics["latency"]["count"] == 3
+        assert analytics["latency"]["p50_ms"] <= analytics["latency"]["p99_ms"]
+
+    @pytest.mark.integration
+    async def test_workers_merge_sketches(self, db_session):
+        """워커별로 저장된 요약이 병합되어 보고됨"""
+        now = datetime(2026, 10, 19, 12, 0)
+        first, second = LatencySketches(window=3600), LatencySketches(window=3600)
+        first.worker_id, second.worker_id = "pod-a:1", "pod-b:1"
+        for value in range(1, 51):
+            first.record_endpoint("/api/search", float(value))
+        for value in range(51, 101):
+            second.record_endpoint("/api/search", float(value))
+
+        await first.sync(db_session, now)
+        await second.sync(db_session, now)
+        merged = second.endpoint_summaries()["/api/search"]
+        assert merged["count"] == 100
+        assert merged["p50_ms"] == pytest.approx(50, rel=0.02)
+        assert merged["p99_ms"] == pytest.approx(99, rel=0.02)
+
+    @pytest.mark.integration
+    async def test_snapshot_tables_share_the_db_clock(self, db_session):
+        """지연/빈도 요약 행은 같은 DB 시계로 기록"""
+        async with db_session.bind.connect() as conn:
+            await conn.run_sync(log_partitions.refresh)
+        latency = LatencySketches(window=3600)
+        latency.record_endpoint("/api/search", 10.0)
+        await latency.sync(db_session)
+        await SharedQuerySketch(k=10, width=256, depth=4).sync(db_session)
+
+        latency_at = await db_session.scalar(select(LatencySketchSnapshot.updated_at))
+        query_at = await db_session.scalar(select(func.max(QuerySketchSnapshot.updated_at)))
+        assert abs(latency_at - query_at) < timedelta(seconds=5)
+        assert abs(latency_at - log_partitions.now()) < timedelta(seconds=5)
+
+
+class TestLatencyMiddleware:
+    """엔드포인트 지연 기록 미들웨어 테스트"""
+
+    @pytest.mark.integration
+    async def test_records_registered_routes_only(self, client: AsyncClient, monkeypatch):
+        """등록된 /api 경로의 성공 응답만 기록"""
+        from app.services import latency_sketch
+
+        sketches = LatencySketches(window=3600)
+        monkeypatch.setattr(latency_sketch.latency_sketches, "current", sketches.current)
+        await client.get("/api/search/cache-stats")
+        await client.get("/api/does-not-exist")
+        assert list(sketches.current) == [("endpoint", "/api/search/cache-stats")]
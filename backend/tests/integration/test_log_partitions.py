@@ -0,0 +1,177 @@
+"""
+통합 테스트: search_logs 기간 테이블 분리, 만료 집계, 통계 반영 (SQLite)
+"""
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import func, inspect, select
+
+from app.models import SearchLog, SearchLogRollup
+from app.services.log_partitions import database_now, log_partitions
+from app.services.search_service import SearchService
+
+NOW = datetime(2026, 10, 19, 12, 0)
+
+
+@pytest.fixture
+async def partitions(db_session, monkeypatch):
+    """월 단위, 보존 60일로 설정한 전역 파티션 관리자 (종료 시 기간 테이블 삭제)"""
+    monkeypatch.setattr(log_partitions, "period", "month")
+    monkeypatch.setattr(log_partitions, "retention", NOW - datetime(2026, 8, 20, 12, 0))
+    monkeypatch.setattr(log_partitions, "_settled", None)
+    monkeypatch.setattr(log_partitions, "_pending", False)
+    monkeypatch.setattr(log_partitions, "_clock_offset", timedelta(0))
+    log_partitions.archives = {}
+    yield log_partitions
+    async with db_session.bind.begin() as conn:
+        for table in list(log_partitions.archives.values()):
+            await conn.run_sync(table.drop)
+    log_partitions.archives = {}
+
+
+async def add_logs(db_session, rows):
+    db_session.add_all([
+        SearchLog(query=query, result_count=count, response_time_ms=ms, created_at=created_at)
+        for query, count, ms, created_at in rows
+    ])
+    await db_session.commit()
+
+
+async def maintain(db_session):
+    async with db_session.bind.begin() as conn:
+        return await conn.run_sync(log_partitions.maintain, NOW)
+
+
+class TestLogPartitions:
+    """기간 테이블 분리/만료 테스트"""
+
+    @pytest.mark.integration
+    async def test_closed_periods_move_to_period_tables(self, db_session, partitions):
+        """지난 기간 행은 기간 테이블로 이동, 조회는 모든 기간을 포함"""
+        await add_logs(db_session, [
+            ("노트북", 10, 20.0, datetime(2026, 9, 3)),
+            ("노트북", 12, 40.0, datetime(2026, 10, 2)),
+            ("의자", 3, 10.0, datetime(2026, 10, 18)),
+        ])
+
+        report = await maintain(db_session)
+        assert report["archived"] == ["search_logs_p202609"]
+        assert report["expired"] == []
+
+        hot = await db_session.execute(select(func.count(SearchLog.id)))
+        assert hot.scalar() == 2
+
+        logs = partitions.source()
+        total = await db_session.execute(select(func.count()).select_from(logs))
+        assert total.scalar() == 3
+
+        october = partitions.source(since=datetime(2026, 10, 1))
+        result = await db_session.execute(select(october.c.query))
+        assert sorted(row[0] for row in result) == ["노트북", "의자"]
+
+        # Rerunning finds nothing left to move
+        assert (await maintain(db_session))["archived"] == []
+
+    @pytest.mark.integration
+    async def test_expired_periods_roll_up_and_drop(self, db_session, partitions):
+        """보존 기간이 지난 기간은 집계 후 테이블 삭제, 통계 합계는 유지"""
+        await add_logs(db_session, [
+            ("노트북", 10, 20.0, datetime(2026, 7, 3)),
+            ("노트북", 6, None, datetime(2026, 7, 9)),
+            ("가방", 1, 30.0, datetime(2026, 7, 20)),
+            ("노트북", 12, 40.0, datetime(2026, 10, 2)),
+        ])
+        stats_before = await SearchService(db_session).get_stats()
+
+        report = await maintain(db_session)
+        assert report["archived"] == ["search_logs_p202607"]
+        assert report["expired"] == ["search_logs_p202607"]
+        async with db_session.bind.connect() as conn:
+            tables = await conn.run_sync(lambda sync: inspect(sync).get_table_names())
+        assert "search_logs_p202607" not in tables
+
+        result = await db_session.execute(
+            select(SearchLogRollup).where(SearchLogRollup.query == "노트북")
+        )
+        rollup = result.scalar_one()
+        assert rollup.period_start == datetime(2026, 7, 1)
+        assert (rollup.searches, rollup.total_results, rollup.timed_searches) == (2, 16, 1)
+        assert rollup.total_response_time_ms == 20.0
+
+        stats_after = await SearchService(db_session).get_stats()
+        assert stats_after["total_searches"] == stats_before["total_searches"] == 4
+        assert stats_after["avg_response_time_ms"] == stats_before["avg_response_time_ms"] == 30.0
+
+    @pytest.mark.integration
+    async def test_refresh_discovers_period_tables(self, db_session, partitions):
+        """다른 워커가 만든 기간 테이블도 refresh 로 인식"""
+        await add_logs(db_session, [("노트북", 1, 5.0, datetime(2026, 9, 30))])
+        await maintain(db_session)
+
+        archived = dict(partitions.archives)
+        partitions.archives = {}
+        async with db_session.bind.connect() as conn:
+            await conn.run_sync(partitions.refresh)
+        assert list(partitions.archives) == list(archived) == [datetime(2026, 9, 1)]
+
+    @pytest.mark.integration
+    async def test_query_reads_include_rollups(self, db_session, partitions):
+        """인기/관련 검색어와 검색어 분석은 만료 기간 집계를 합쳐 계산"""
+        await add_logs(db_session, [
+            ("노트북", 10, 20.0, datetime(2026, 7, 3)),
+            ("노트북", 6, None, datetime(2026, 7, 9)),
+            ("노트북 가방", 1, 30.0, datetime(2026, 7, 20)),
+            ("의자", 3, 10.0, datetime(2026, 10, 2)),
+            ("노트북", 12, 40.0, datetime(2026, 10, 2)),
+        ])
+        await maintain(db_session)
+        service = SearchService(db_session)
+
+        popular = await service.get_popular_queries(10)
+        assert [(row.query, row.count) for row in popular] == [("노트북", 3), ("노트북 가방", 1), ("의자", 1)]
+        assert popular[0].last_searched == datetime(2026, 10, 2)
+
+        analytics = await service.get_search_analytics("노트북")
+        assert analytics.response_time_ms == 30.0
+        assert analytics.timestamp == datetime(2026, 10, 2)
+
+        assert (await service.get_related_suggestions("노트북"))[0] == "노트북 가방"
+        stats = await service.get_stats()
+        assert stats["popular_queries"][0] == {"query": "노트북", "count": 3, "avg_time_ms": 30.0}
+
+    @pytest.mark.integration
+    async def test_read_recovers_from_table_dropped_elsewhere(self, db_session, partitions):
+        """다른 워커가 지운 기간 테이블을 읽다 실패하면 목록을 다시 읽고 재시도"""
+        await add_logs(db_session, [
+            ("노트북", 1, 5.0, datetime(2026, 9, 30)),
+            ("의자", 1, 5.0, datetime(2026, 10, 2)),
+        ])
+        await maintain(db_session)
+        async with db_session.bind.connect() as conn:
+            await conn.run_sync(partitions.refresh)
+        assert not partitions.needs_refresh()
+
+        async with db_session.bind.begin() as conn:
+            await conn.run_sync(partitions.archives[datetime(2026, 9, 1)].drop)
+        popular = await SearchService(db_session).get_popular_queries(10)
+        assert [row.query for row in popular] == ["의자"]
+        assert partitions.archives == {}
+
+    @pytest.mark.integration
+    async def test_refresh_tracks_pending_rows_and_db_clock(self, db_session, partitions):
+        """지난 기간 행이 남아 있으면 pending_refresh 초마다 다시 읽을 대상, 현재 시각은 DB 시계 기준"""
+        await add_logs(db_session, [("노트북", 1, 5.0, datetime(2020, 1, 5))])
+        async with db_session.bind.connect() as conn:
+            await conn.run_sync(partitions.refresh)
+            db_now = await conn.run_sync(database_now)
+        assert abs(partitions.now() - db_now) < timedelta(seconds=5)
+
+        # Reads right after the refresh do not re-list the period tables
+        assert not partitions.needs_refresh()
+        partitions._refreshed_at -= partitions.pending_refresh
+        assert partitions.needs_refresh()
+
+        # Once maintenance has moved the rows, nothing is pending
+        async with db_session.bind.begin() as conn:
+            await conn.run_sync(partitions.maintain)
+        partitions._refreshed_at -= partitions.pending_refresh
+        assert not partitions.needs_refresh()
@@ -0,0 +1,247 @@
+"""
+통합 테스트: SearchService SQL 실행 계획 회귀
+
+각 시나리오가 내보내는 SELECT 를 모두 캡처해 SQLite 는 EXPLAIN QUERY PLAN, MySQL 은
+EXPLAIN FORMAT=JSON 으로 계획을 뽑고 query_plans.json 의 기대값과 비교한다.
+풀 스캔/filesort 가 새로 생기거나 쓰던 인덱스를 놓치면 실패한다.
+
+- MySQL: TEST_MYSQL_URL=mysql+aiomysql://... 이 있으면 같은 시나리오를 MySQL 에서도 실행
+  (행 추정치는 ROWS_TOLERANCE 배까지 허용). query_plans.json 에는 아직 MySQL 기대값이
+  없어 기대값이 없는 MySQL 시나리오는 skip 된다. MySQL 에 대고 UPDATE_QUERY_PLANS=1 로
+  한 번 기록해 커밋하면 그때부터 비교한다. SQLite 기대값이 없으면 실패한다.
+- 기대값 갱신: UPDATE_QUERY_PLANS=1 pytest tests/integration/test_query_plans.py (-n 없이),
+  바뀐 계획은 diff 로 리뷰
+"""
+import json
+import os
+import re
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models import Base, SearchItem, SearchLog
+from app.schemas import SearchQuery
+from app.services.heavy_hitters import query_sketch
+from app.services.item_cache import item_cache
+from app.services.log_partitions import log_partitions
+from app.services.search_index import SearchIndex
+from app.services.search_service import SearchService
+
+EXPECTATIONS_PATH = Path(__file__).with_name("query_plans.json")
+UPDATE = os.getenv("UPDATE_QUERY_PLANS") == "1"
+MYSQL_URL = os.getenv("TEST_MYSQL_URL", "")
+ROWS_TOLERANCE = 2.0
+
+WORDS = ["노트북", "키보드", "마우스", "모니터", "스마트폰"]
+CATEGORIES = ["전자제품", "의류", "도서", "식품"]
+
+
+async def _consume(stream) -> None:
+    async for _ in stream:
+        pass
+
+
+# Scenario name -> SearchService call; every SQL-backed read path should be listed here
+SCENARIOS = {
+    "search_text": lambda s: s.search(SearchQuery(q="노트북"), log=False),
+    "search_category": lambda s: s.search(SearchQuery(q="노트북", category="전자제품"), log=False),
+    "search_category_price": lambda s: s.search(
+        SearchQuery(q="노트북", category="전자제품", min_price=5000, max_price=200000, sort="price"), log=False
+    ),
+    "search_price_asc": lambda s: s.search(SearchQuery(q="키보드", min_price=5000, sort="price", order="asc"), log=False),
+    "search_date": lambda s: s.search(SearchQuery(q="마우스", sort="date"), log=False),
+    "search_deep_page": lambda s: s.search(SearchQuery(q="모니터", page=5, size=20), log=False),
+    "stream_matches": lambda s: _consume(s.stream_matches(SearchQuery(q="노트북", category="도서"), 50)),
+    "get_items": lambda s: s.get_items([3, 1, 2]),
+    "autocomplete": lambda s: s.autocomplete("노트", 10),
+    "get_suggestions": lambda s: s.get_suggestions(),
+    "get_stats": lambda s: s.get_stats(),
+    "get_facets": lambda s: s.get_facets("노트북"),
+    "get_related_suggestions": lambda s: s.get_related_suggestions("노트북"),
+    "get_popular_queries": lambda s: s.get_popular_queries(10),
+    "get_search_analytics": lambda s: s.get_search_analytics("노트북"),
+}
+
+
+class StatementCapture:
+    """엔진이 실행하는 SELECT 문과 파라미터 기록"""
+
+    def __init__(self, engine):
+        self.engine = engine.sync_engine
+        self.statements = []
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.statements.append((statement, parameters))
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._record)
+
+
+async def sqlite_plan(db: AsyncSession, statement: str, parameters) -> list:
+    """EXPLAIN QUERY PLAN 단계 (트리 깊이만큼 들여쓴 문자열)"""
+    conn = await db.connection()
+    rows = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)).fetchall()
+    depth, steps = {0: -1}, []
+    for node, parent, _, detail in rows:
+        depth[node] = depth.get(parent, -1) + 1
+        # Older SQLite prints "SCAN TABLE x"
+        steps.append("  " * depth[node] + re.sub(r"^(SCAN|SEARCH) TABLE ", r"\1 ", detail))
+    return steps
+
+
+def _mysql_steps(node, steps: list) -> None:
+    if isinstance(node, dict):
+        if "table_name" in node and "access_type" in node:
+            steps.append({
+                "table": node["table_name"],
+                "access": node["access_type"],
+                "key": node.get("key"),
+                "rows": node.get("rows_examined_per_scan"),
+            })
+        for flag in ("using_filesort", "using_temporary_table"):
+            if node.get(flag):
+                steps.append({flag: True})
+        for value in node.values():
+            _mysql_steps(value, steps)
+    elif isinstance(node, list):
+        for value in node:
+            _mysql_steps(value, steps)
+
+
+async def mysql_plan(db: AsyncSession, statement: str, parameters) -> list:
+    """EXPLAIN FORMAT=JSON 의 테이블별 접근 방식/키/행 추정치와 filesort/임시 테이블 표시"""
+    conn = await db.connection()
+    raw = (await conn.exec_driver_sql(f"EXPLAIN FORMAT=JSON {statement}", parameters)).scalar()
+    steps = []
+    _mysql_steps(json.loads(raw), steps)
+    return steps
+
+
+def plans_match(dialect: str, expected: list, actual: list) -> bool:
+    if dialect == "sqlite" or len(expected) != len(actual):
+        return expected == actual
+    for want, got in zip(expected, actual):
+        if set(want) != set(got) or any(want[k] != got[k] for k in want if k != "rows"):
+            return False
+        if "rows" in want and (got["rows"] or 0) > max(want["rows"] or 0, 1) * ROWS_TOLERANCE:
+            return False
+    return True
+
+
+def _recreate_indexes(conn) -> None:
+    """인덱스를 이름 순으로 다시 생성
+
+    create_all 은 인덱스를 집합 순서(해시 시드에 따라 다름)로 만들고, 통계가 없는
+    SQLite 는 비용이 같은 인덱스 중 생성 순서로 고르므로 순서를 고정해야 계획이 재현된다.
+    """
+    for table in Base.metadata.sorted_tables:
+        indexes = sorted(table.indexes, key=lambda index: index.name)
+        for index in indexes:
+            index.drop(conn)
+        for index in indexes:
+            index.create(conn)
+
+
+async def seed(db: AsyncSession) -> None:
+    """계획이 재현되도록 고정 데이터 적재"""
+    base = datetime(2026, 1, 1)
+    db.add_all([
+        SearchItem(
+            title=f"{WORDS[i % len(WORDS)]} {i}",
+            description=f"{WORDS[(i * 3) % len(WORDS)]} 상세 설명 {i}",
+            category=CATEGORIES[i % len(CATEGORIES)],
+            tags=f"{WORDS[(i * 7) % len(WORDS)]},태그{i % 10}",
+            price=float(1000 + (i * 997) % 500000),
+            popularity=(i * 37) % 1000,
+            created_at=base + timedelta(hours=i),
+            updated_at=base + timedelta(hours=i),
+        )
+        for i in range(1, 201)
+    ])
+    db.add_all([
+        SearchLog(
+            query=WORDS[i % len(WORDS)] if i % 4 else f"{WORDS[i % len(WORDS)]} {i % 7}",
+            result_count=i % 50,
+            response_time_ms=float(i % 90),
+            created_at=base + timedelta(minutes=i),
+        )
+        for i in range(300)
+    ])
+    await db.commit()
+
+
+@pytest.fixture
+async def plan_session(request, db_session, monkeypatch):
+    """(방언, 시드된 세션, 엔진) - 인덱스/인기 검색어 요약 없이 SQL 경로만 타게 함"""
+    monkeypatch.setattr(query_sketch, "snapshot", None)
+    # Period-table discovery is not part of the plans under test
+    monkeypatch.setattr(log_partitions, "needs_refresh", lambda: False)
+    item_cache.clear()
+    if request.param == "sqlite":
+        await (await db_session.connection()).run_sync(_recreate_indexes)
+        await seed(db_session)
+        yield "sqlite", db_session, db_session.bind
+        return
+
+    if not MYSQL_URL:
+        pytest.skip("TEST_MYSQL_URL is not set")
+    engine = create_async_engine(MYSQL_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        await seed(db)
+        yield "mysql", db, engine
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+
+
+class TestQueryPlans:
+    """SearchService 메서드별 실행 계획 회귀 테스트"""
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("plan_session", ["sqlite", "mysql"], indirect=True)
+    @pytest.mark.parametrize("scenario", sorted(SCENARIOS))
+    async def test_plan_matches_expectation(self, plan_session, scenario):
+        """캡처한 모든 SELECT 의 계획이 기대값과 일치"""
+        dialect, db, engine = plan_session
+        service = SearchService(db, index=SearchIndex())
+        with StatementCapture(engine) as capture:
+            await SCENARIOS[scenario](service)
+        assert capture.statements, f"{scenario} issued no SELECT"
+
+        explain = sqlite_plan if dialect == "sqlite" else mysql_plan
+        actual = [
+            {"statement": " ".join(statement.split()), "plan": await explain(db, statement, parameters)}
+            for statement, parameters in capture.statements
+        ]
+
+        expectations = json.loads(EXPECTATIONS_PATH.read_text()) if EXPECTATIONS_PATH.exists() else {}
+        if UPDATE:
+            expectations.setdefault(dialect, {})[scenario] = actual
+            EXPECTATIONS_PATH.write_text(json.dumps(expectations, ensure_ascii=False, indent=2, sort_keys=True) + "\n")
+            return
+
+        expected = expectations.get(dialect, {}).get(scenario)
+        if expected is None and dialect == "mysql":
+            pytest.skip(f"No mysql plan recorded for {scenario}; record with UPDATE_QUERY_PLANS=1")
+        assert expected is not None, f"No {dialect} plan recorded for {scenario}; run with UPDATE_QUERY_PLANS=1"
+        assert len(actual) == len(expected), (
+            f"{scenario} issued {len(actual)} SELECTs, expected {len(expected)}:\n"
+            + "\n".join(entry["statement"] for entry in actual)
+        )
+        for want, got in zip(expected, actual):
+            assert plans_match(dialect, want["plan"], got["plan"]), (
+                f"Plan changed for {scenario}\n{got['statement']}\n"
+                f"expected: {json.dumps(want['plan'], ensure_ascii=False, indent=2)}\n"
+                f"actual:   {json.dumps(got['plan'], ensure_ascii=False, indent=2)}"
+            )
@@ -0,0 +1,32 @@
+"""
+통합 테스트: 속도 제한 미들웨어
+"""
+import pytest
+from httpx import AsyncClient
+
+from app.rate_limit import Budget, rate_limiter
+
+
+class TestRateLimitMiddleware:
+    """속도 제한 미들웨어 테스트"""
+
+    @pytest.mark.integration
+    async def test_exceeding_budget_returns_429(self, client: AsyncClient, monkeypatch):
+        """예산을 넘긴 클라이언트는 429 + Retry-After, 다른 예산은 영향 없음"""
+        monkeypatch.setitem(rate_limiter.budgets, "/api/search/popular", Budget("test-popular", 0.5, 2))
+
+        assert (await client.get("/api/search/popular")).status_code == 200
+        assert (await client.get("/api/search/popular")).status_code == 200
+        response = await client.get("/api/search/popular")
+        assert response.status_code == 429
+        assert response.headers["retry-after"] == "2"
+        assert response.json()["budget"] == "test-popular"
+
+        assert (await client.get("/api/autocomplete", params={"q": "ab"})).status_code == 200
+        assert (await client.get("/health")).status_code == 200
+
+    @pytest.mark.integration
+    async def test_limiter_is_reset_between_tests(self, client: AsyncClient, monkeypatch):
+        """테스트마다 버킷이 초기화됨"""
+        monkeypatch.setitem(rate_limiter.budgets, "/api/search/popular", Budget("test-popular", 0.5, 2))
+        assert (await client.get("/api/search/popular")).status_code == 200
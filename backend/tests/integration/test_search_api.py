@@ -2,6 +2,7 @@
 통합 테스트: 검색 API 엔드포인트
 총 200개의 테스트 케이스
 """
+import asyncio
 import pytest
 from httpx import AsyncClient
 
@@ -79,6 +80,51 @@ class TestSearchAPI:
         data = response.json()
         assert "response_time_ms" in data
         assert data["response_time_ms"] >= 0
+    
+    @pytest.mark.integration
+    async def test_search_price_facets(self, client: AsyncClient, sample_items):
+        """가격 구간/히스토그램 패싯 테스트"""
+        response = await client.get("/api/search?q=a")
+        assert response.status_code == 200
+        facets = response.json()["facets"]
+        matched = sum(facets["categories"].values())
+        assert sum(facet["count"] for facet in facets["price_ranges"]) == matched
+        assert sum(bin_["count"] for bin_ in facets["price_histogram"]) == matched
+    
+    @pytest.mark.integration
+    async def test_search_concurrent_identical_requests(self, client: AsyncClient, db_session, sample_items):
+        """동시 동일 검색 병합 테스트 (결과 공유, 요청별 로그 유지)"""
+        from sqlalchemy import func, select
+        from app.api.search import search_flight
+        from app.database import get_db, get_read_sessions
+        from app.main import app
+        from app.models import SearchLog
+        from tests.conftest import TestSessionLocal
+        
+        # Concurrent requests need their own sessions, as in production
+        async def session_per_request():
+            async with TestSessionLocal() as session:
+                yield session
+        
+        # Each shared execution opens its own read session instead of borrowing the leader's
+        opened = []
+        
+        def read_session():
+            opened.append(TestSessionLocal())
+            return opened[-1]
+        
+        app.dependency_overrides[get_db] = session_per_request
+        app.dependency_overrides[get_read_sessions] = lambda: read_session
+        
+        before, executed = search_flight.coalesced, search_flight.executed
+        responses = await asyncio.gather(*(client.get("/api/search?q=a") for _ in range(5)))
+        assert all(response.status_code == 200 for response in responses)
+        assert len({response.json()["total"] for response in responses}) == 1
+        assert search_flight.coalesced > before
+        assert len(opened) == search_flight.executed - executed
+        
+        logged = await db_session.scalar(select(func.count(SearchLog.id)).where(SearchLog.query == "a"))
+        assert logged == 5
 
 
 # 다양한 검색 쿼리 테스트 (총 200개)
@@ -0,0 +1,104 @@
+"""
+통합 테스트: 인메모리 검색 인덱스 경로
+"""
+import pytest
+from httpx import AsyncClient
+
+from app.services.search_index import search_index
+
+
+@pytest.fixture
+async def index_reset():
+    """테스트 후 전역 검색 인덱스 초기화"""
+    yield search_index
+    search_index.clear()
+
+
+async def fetch(client: AsyncClient, params: dict) -> dict:
+    response = await client.get("/api/search", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+class TestSearchIndexPath:
+    """인덱스 사용 시 SQL 경로와 동일한 결과 검증"""
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("params", [
+        {"q": "a"},
+        {"q": "e", "category": "전자제품"},
+        {"q": "e", "min_price": 100000, "max_price": 500000},
+        {"q": "a", "category": "도서", "min_price": 50000},
+        {"q": "없는검색어"},
+        {"q": "e", "sort": "price", "order": "asc", "page": 2, "size": 10},
+        {"q": "e", "sort": "price", "order": "desc", "min_price": 10000},
+        {"q": "a", "sort": "popularity", "order": "asc", "size": 5, "page": 3},
+        {"q": "a", "sort": "date", "page": 2, "size": 7},
+    ])
+    async def test_results_match_sql(self, client: AsyncClient, db_session, sample_items, index_reset, params):
+        """인덱스 경로와 SQL 경로의 결과 일치 테스트"""
+        expected = await fetch(client, params)
+
+        await index_reset.build(db_session)
+        actual = await fetch(client, params)
+
+        assert actual["total"] == expected["total"]
+        # Rows tied on the sort key may come back in any order from SQL
+        sort_field = {"price": "price", "date": "created_at"}.get(params.get("sort"), "popularity")
+        assert [item[sort_field] for item in actual["items"]] == [item[sort_field] for item in expected["items"]]
+        # Both paths count the same title/description/tags match set as the search
+        assert actual["facets"]["categories"] == expected["facets"]["categories"]
+        assert actual["facets"]["price_ranges"] == expected["facets"]["price_ranges"]
+
+    @pytest.mark.integration
+    async def test_index_build(self, db_session, sample_items, index_reset):
+        """인덱스 빌드 테스트"""
+        await index_reset.build(db_session)
+        assert index_reset.ready
+        assert index_reset.size == len(sample_items)
+
+    @pytest.mark.integration
+    async def test_stale_index_falls_back(self, client: AsyncClient, db_session, sample_items, index_reset):
+        """인덱스에 없는 아이템이 매치되면 SQL 경로로 폴백"""
+        from app.models import SearchItem
+
+        await index_reset.build(db_session)
+        db_session.add(SearchItem(title="zzqq 신규 상품", category="도서", price=1000))
+        await db_session.commit()
+
+        data = await fetch(client, {"q": "zzqq"})
+        assert data["total"] == 1
+
+    @pytest.mark.integration
+    async def test_indexed_search_skips_sql_paging(self, db_session, sample_items, index_reset, monkeypatch):
+        """인덱스 경로는 SQL 정렬/페이지네이션을 사용하지 않음"""
+        from app.schemas import SearchQuery
+        from app.services.search_service import SearchService
+
+        await index_reset.build(db_session)
+        service = SearchService(db_session)
+
+        async def fail(query):
+            raise AssertionError("SQL search path used")
+
+        monkeypatch.setattr(service, "_search_sql", fail)
+        items, total, _ = await service.search(SearchQuery(q="a", sort="price", order="asc", size=5))
+        prices = [item.price for item in items]
+        assert prices == sorted(prices)
+        assert total >= len(items)
+
+    @pytest.mark.integration
+    async def test_indexed_page_hydrates_from_item_cache(self, db_session, sample_items, index_reset):
+        """인덱스 경로의 최종 페이지는 아이템 캐시를 채우고 재사용"""
+        from app.schemas import SearchQuery
+        from app.services.item_cache import item_cache
+        from app.services.search_service import SearchService
+
+        await index_reset.build(db_session)
+        service = SearchService(db_session)
+        items, _, _ = await service.search(SearchQuery(q="a", size=5), log=False)
+        hits = item_cache.hits
+
+        again, _, _ = await service.search(SearchQuery(q="a", size=5), log=False)
+        assert [item.id for item in again] == [item.id for item in items]
+        assert item_cache.hits == hits + len(items)
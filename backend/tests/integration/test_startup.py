@@ -0,0 +1,132 @@
+"""
+통합 테스트: 스키마 버전 확인, 시작 예열, readiness
+"""
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, inspect, select, text, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app import startup
+from app.config import settings
+from app.database import DatabaseRouter
+from app.migrations import SCHEMA_VERSION, recorded_version, upgrade
+from app.models import SchemaVersion, SearchLog
+from app.services.change_feed import ChangeFeed
+from app.services.autocomplete_cache import autocomplete_cache
+from app.services.item_cache import item_cache
+from app.services.search_index import SearchIndex
+from app.startup import StartupState, replay_top_queries, startup_state, warm_pool
+
+
+@pytest.fixture
+def ready_state():
+    """전역 startup_state 를 테스트 동안 초기화하고 복원"""
+    saved = dict(vars(startup_state))
+    startup_state.reset()
+    yield startup_state
+    vars(startup_state).update(saved)
+
+
+class TestSchemaUpgrade:
+    """스키마 버전 기반 DDL 생략 테스트"""
+
+    @pytest.mark.integration
+    async def test_fresh_database_records_version(self, db_session):
+        """신규 DB 는 업그레이드 후 버전 기록"""
+        async with db_session.bind.begin() as conn:
+            assert await conn.run_sync(upgrade) is True
+            assert await conn.run_sync(recorded_version) == SCHEMA_VERSION
+
+    @pytest.mark.integration
+    async def test_current_version_skips_ddl(self, db_session):
+        """같은 버전이면 DDL 생략"""
+        async with db_session.bind.begin() as conn:
+            await conn.run_sync(upgrade)
+        async with db_session.bind.begin() as conn:
+            assert await conn.run_sync(upgrade) is False
+
+    @pytest.mark.integration
+    async def test_older_version_applies_migrations(self, db_session):
+        """이전 버전 DB 에 누락된 인덱스 생성"""
+        async with db_session.bind.begin() as conn:
+            await conn.run_sync(upgrade)
+            await conn.execute(update(SchemaVersion).values(version=1))
+            await conn.execute(text("DROP INDEX idx_updated_at_id"))
+
+        async with db_session.bind.begin() as conn:
+            assert await conn.run_sync(upgrade) is True
+            indexes = await conn.run_sync(lambda sync: inspect(sync).get_indexes("search_items"))
+            assert "idx_updated_at_id" in {index["name"] for index in indexes}
+            assert await conn.run_sync(recorded_version) == SCHEMA_VERSION
+
+
+class TestWarmup:
+    """시작 예열 테스트"""
+
+    @pytest.mark.integration
+    async def test_warm_pool(self, db_session):
+        """풀 연결 예열"""
+        assert await warm_pool(db_session.bind, 3) == 3
+
+    @pytest.mark.integration
+    async def test_replay_does_not_log(self, db_session, sample_items):
+        """상위 검색어 재실행은 검색 로그를 남기지 않음"""
+        for query in ["노트북"] * 3 + ["책"] * 2 + ["의자"]:
+            db_session.add(SearchLog(query=query, result_count=1, response_time_ms=1.0))
+        await db_session.commit()
+
+        factory = async_sessionmaker(db_session.bind, expire_on_commit=False)
+        assert await replay_top_queries(factory, 2) == 2
+
+        count = await db_session.scalar(select(func.count(SearchLog.id)))
+        assert count == 6
+
+
+@pytest.fixture
+async def pipeline(db_session, sample_items, monkeypatch):
+    """테스트 DB 와 새 인덱스/변경 피드로 시작 파이프라인 실행 준비 (끝나면 정리)"""
+    async def init_db():
+        pass
+
+    feed = ChangeFeed(SearchIndex())
+    monkeypatch.setattr(startup, "db_router", DatabaseRouter(db_session.bind))
+    monkeypatch.setattr(startup, "init_db", init_db)
+    monkeypatch.setattr(startup, "search_index", feed.index)
+    monkeypatch.setattr(startup, "change_feed", feed)
+    monkeypatch.setattr(settings, "SEARCH_INDEX_SNAPSHOT_PATH", "")
+    monkeypatch.setattr(settings, "STARTUP_REPLAY_QUERIES", 0)
+    yield feed
+    await startup.shutdown()
+
+
+class TestStartupPipeline:
+    """시작 파이프라인 테스트"""
+
+    @pytest.mark.integration
+    async def test_index_path_registers_cache_listeners(self, pipeline, monkeypatch):
+        """인덱스가 켜져 변경 피드를 인덱스 단계에서 시작해도 캐시가 리스너로 등록됨"""
+        monkeypatch.setattr(settings, "SEARCH_INDEX_ENABLED", True)
+        state = StartupState()
+        await startup.run_startup(state)
+        assert state.ready
+        assert pipeline.running
+        assert pipeline.index.ready
+        assert item_cache in pipeline.listeners
+        assert autocomplete_cache in pipeline.listeners
+
+
+class TestReadiness:
+    """/ready 엔드포인트 테스트"""
+
+    @pytest.mark.integration
+    async def test_not_ready_until_pipeline_completes(self, client: AsyncClient, ready_state):
+        """시작 파이프라인 완료 전 503, 이후 200"""
+        ready_state.advance("index")
+        response = await client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["phase"] == "index"
+
+        ready_state.mark_ready()
+        response = await client.get("/ready")
+        assert response.status_code == 200
+        assert response.json()["ready"] is True
@@ -0,0 +1,126 @@
+"""
+단위 테스트: 우선순위 기반 입장 제어
+"""
+import asyncio
+import pytest
+
+from app.admission import AdmissionClass, AdmissionController, PriorityGate, Rejected, default_controller
+
+
+def make_controller(global_limit=1, budget_ms=50.0):
+    classes = {
+        "critical": AdmissionClass("critical", 0, 4, budget_ms),
+        "background": AdmissionClass("background", 2, 1, budget_ms),
+    }
+    routes = {"/api/autocomplete": "critical", "/api/search/stats": "background"}
+    return AdmissionController(classes, routes, global_limit)
+
+
+class TestPriorityGate:
+    """PriorityGate 테스트"""
+
+    @pytest.mark.unit
+    async def test_waiters_are_served_by_priority(self):
+        """슬롯이 반환되면 우선순위가 높은 대기자가 먼저 들어감"""
+        gate = PriorityGate(1)
+        assert await gate.acquire(0, 1.0)
+        order = []
+
+        async def wait(priority, name):
+            assert await gate.acquire(priority, 1.0)
+            order.append(name)
+            gate.release()
+
+        low = asyncio.create_task(wait(2, "low"))
+        await asyncio.sleep(0)
+        high = asyncio.create_task(wait(0, "high"))
+        await asyncio.sleep(0)
+        assert gate.waiting == 2
+
+        gate.release()
+        await asyncio.gather(low, high)
+        assert order == ["high", "low"]
+        assert gate.active == 0
+
+    @pytest.mark.unit
+    async def test_timeout_leaves_gate_consistent(self):
+        """대기 시간 초과 시 False, 슬롯 수는 그대로"""
+        gate = PriorityGate(1)
+        assert await gate.acquire(0, 1.0)
+        assert not await gate.acquire(0, 0.01)
+        assert gate.waiting == 0
+
+        gate.release()
+        assert gate.active == 0
+        assert await gate.acquire(0, 0.01)
+
+
+class TestAdmissionController:
+    """AdmissionController 테스트"""
+
+    @pytest.mark.unit
+    def test_classify(self):
+        """경로별 클래스, 미등록 /api 경로는 standard, 그 외는 제외"""
+        controller = default_controller()
+        assert controller.classify("/api/autocomplete").name == "critical"
+        assert controller.classify("/api/search/stats").name == "background"
+        assert controller.classify("/api/unknown").name == "standard"
+        assert controller.classify("/api/search/cache-stats") is None
+        assert controller.classify("/health") is None
+        assert controller.classify("/metrics") is None
+
+    @pytest.mark.unit
+    async def test_sheds_after_queue_budget(self):
+        """대기 예산을 넘기면 Rejected"""
+        controller = make_controller()
+        background = controller.classes["background"]
+        await controller.admit(background)
+
+        with pytest.raises(Rejected) as exc:
+            await controller.admit(background)
+        assert exc.value.reason == "queue_timeout"
+
+        controller.release(background)
+        await controller.admit(background)
+        controller.release(background)
+
+    @pytest.mark.unit
+    async def test_sheds_immediately_when_queue_full(self):
+        """클래스 대기열이 가득 차면 기다리지 않고 거절"""
+        controller = make_controller(global_limit=10, budget_ms=1000.0)
+        background = controller.classes["background"]
+        background.max_queue = 1
+        await controller.admit(background)
+        waiter = asyncio.create_task(controller.admit(background))
+        await asyncio.sleep(0)
+
+        with pytest.raises(Rejected) as exc:
+            await controller.admit(background)
+        assert exc.value.reason == "queue_full"
+
+        controller.release(background)
+        await waiter
+        controller.release(background)
+
+    @pytest.mark.unit
+    async def test_critical_jumps_shared_queue(self):
+        """전역 슬롯이 부족하면 critical 이 먼저 입장"""
+        controller = make_controller(global_limit=1, budget_ms=1000.0)
+        critical = controller.classes["critical"]
+        background = controller.classes["background"]
+        await controller.admit(critical)
+        order = []
+
+        async def run(admission_class):
+            await controller.admit(admission_class)
+            order.append(admission_class.name)
+            controller.release(admission_class)
+
+        tasks = [asyncio.create_task(run(background))]
+        await asyncio.sleep(0)
+        tasks.append(asyncio.create_task(run(critical)))
+        await asyncio.sleep(0)
+
+        controller.release(critical)
+        await asyncio.gather(*tasks)
+        assert order == ["critical", "background"]
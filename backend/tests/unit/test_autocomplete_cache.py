@@ -0,0 +1,154 @@
+"""
+단위 테스트: 자동완성 접두어 후보 캐시
+"""
+from collections import namedtuple
+
+import pytest
+
+from app.services.autocomplete_cache import AutocompleteCache
+
+TITLES = ["노트북 가방", "노트북 거치대", "노트 필기", "노란 우산", "Notebook Pro"]
+
+# Change feed row (FEED_COLUMNS order)
+FeedRow = namedtuple("FeedRow", "id category price popularity created_at updated_at title")
+
+
+def feed_row(row_id, title):
+    return FeedRow(row_id, "도서", 1000.0, 0, None, None, title)
+
+
+def make_loader(titles):
+    """titles[i] 의 id 는 i + 1 인 후보 조회 함수"""
+    calls = []
+
+    def loader_for(prefix):
+        async def loader(limit):
+            calls.append((prefix, limit))
+            matches = [(t, i + 1) for i, t in enumerate(titles) if t.lower().startswith(prefix.lower())]
+            return matches[:limit]
+        return loader
+
+    return calls, loader_for
+
+
+class TestAutocompleteCache:
+    """AutocompleteCache 테스트"""
+
+    @pytest.mark.unit
+    async def test_longer_prefix_refined_from_complete_list(self):
+        """완전한 후보 목록이 있으면 더 긴 접두어는 DB 조회 없이 응답"""
+        cache = AutocompleteCache(capacity=10, ttl=60, candidate_limit=10)
+        calls, loader_for = make_loader(TITLES)
+
+        assert await cache.get("노", 10, loader_for("노")) == ["노트북 가방", "노트북 거치대", "노트 필기", "노란 우산"]
+        assert await cache.get("노트", 10, loader_for("노트")) == ["노트북 가방", "노트북 거치대", "노트 필기"]
+        assert await cache.get("노트북", 1, loader_for("노트북")) == ["노트북 가방"]
+        assert calls == [("노", 10)]
+        assert cache.stats()["refined"] == 2
+
+    @pytest.mark.unit
+    async def test_truncated_list_is_not_refined(self):
+        """후보가 한도에 걸려 잘렸으면 긴 접두어는 다시 조회"""
+        cache = AutocompleteCache(capacity=10, ttl=60, candidate_limit=2)
+        calls, loader_for = make_loader(TITLES)
+
+        await cache.get("노", 2, loader_for("노"))
+        # Same prefix with a limit the truncated list can satisfy is a hit
+        assert await cache.get("노", 1, loader_for("노")) == ["노트북 가방"]
+        await cache.get("노트", 2, loader_for("노트"))
+        assert calls == [("노", 2), ("노트", 2)]
+
+    @pytest.mark.unit
+    async def test_ascii_case_folding_matches_like(self):
+        """LIKE 처럼 ASCII 대소문자 구분 없이 매칭"""
+        cache = AutocompleteCache(capacity=10, ttl=60, candidate_limit=10)
+        calls, loader_for = make_loader(TITLES)
+
+        await cache.get("N", 10, loader_for("N"))
+        assert await cache.get("noteB", 10, loader_for("noteB")) == ["Notebook Pro"]
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    async def test_wildcards_bypass_cache(self):
+        """LIKE 와일드카드가 포함된 입력은 캐시하지 않음"""
+        cache = AutocompleteCache(capacity=10, ttl=60, candidate_limit=10)
+        calls, loader_for = make_loader(TITLES)
+
+        await cache.get("노%", 5, loader_for("노%"))
+        assert calls == [("노%", 5)]
+        assert len(cache) == 0
+
+    @pytest.mark.unit
+    async def test_unchanged_titles_keep_entries(self):
+        """제목이 그대로인 변경(가격 등)은 아무것도 비우지 않음"""
+        cache = AutocompleteCache(capacity=10, ttl=60, candidate_limit=10)
+        calls, loader_for = make_loader(TITLES)
+
+        await cache.get("노", 10, loader_for("노"))
+        cache.apply_changes([], [])
+        cache.apply_changes([feed_row(1, "노트북 가방"), feed_row(5, "Notebook Pro")], [])
+        assert len(cache) == 1
+        await cache.get("노", 10, loader_for("노"))
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    async def test_title_change_clears_only_affected_prefixes(self):
+        """바뀐 제목의 옛/새 접두어만 비움"""
+        cache = AutocompleteCache(capacity=10, ttl=60, candidate_limit=10)
+        _, loader_for = make_loader(TITLES)
+        for prefix in ("노", "노트", "노란", "N"):
+            await cache.get(prefix, 10, loader_for(prefix))
+
+        # "노란 우산" (id 4) is renamed: prefixes listing the old title go
+        cache.apply_changes([feed_row(4, "우산")], [])
+        assert set(cache._entries) == {"노트", "n"}
+
+        # A new title starting with a cached complete prefix invalidates it
+        cache.apply_changes([feed_row(6, "노트 패드")], [])
+        assert set(cache._entries) == {"n"}
+
+    @pytest.mark.unit
+    async def test_new_title_keeps_truncated_lists(self):
+        """잘린 목록은 새 제목이 빠져 있어도 유효하므로 유지"""
+        cache = AutocompleteCache(capacity=10, ttl=60, candidate_limit=2)
+        _, loader_for = make_loader(TITLES)
+
+        await cache.get("노", 2, loader_for("노"))
+        cache.apply_changes([feed_row(6, "노트 패드")], [])
+        assert len(cache) == 1
+
+    @pytest.mark.unit
+    async def test_delete_clears_prefixes_of_its_title(self):
+        """대표 id 가 삭제되면 그 제목이 든 접두어만 비움"""
+        cache = AutocompleteCache(capacity=10, ttl=60, candidate_limit=10)
+        _, loader_for = make_loader(TITLES)
+        for prefix in ("노", "N"):
+            await cache.get(prefix, 10, loader_for(prefix))
+
+        cache.apply_changes([], [99])
+        assert len(cache) == 2
+        cache.apply_changes([], [5])
+        assert set(cache._entries) == {"노"}
+        assert cache.stats()["invalidated"] == 1
+
+    @pytest.mark.unit
+    async def test_ttl_expires_entries(self):
+        """ttl 경과 시 다시 조회"""
+        expired = AutocompleteCache(capacity=10, ttl=0, candidate_limit=10)
+        calls, loader_for = make_loader(TITLES)
+        await expired.get("노", 10, loader_for("노"))
+        await expired.get("노트", 10, loader_for("노트"))
+        assert calls == [("노", 10), ("노트", 10)]
+        # The expired "노" entry no longer tracks "노란 우산"
+        assert set(expired._by_id) == {1, 2, 3}
+
+    @pytest.mark.unit
+    async def test_lru_capacity(self):
+        """capacity 를 넘으면 오래된 접두어부터 제거"""
+        cache = AutocompleteCache(capacity=2, ttl=60, candidate_limit=10)
+        _, loader_for = make_loader(TITLES)
+        for prefix in ("N", "노란", "노트"):
+            await cache.get(prefix, 5, loader_for(prefix))
+        assert set(cache._entries) == {"노란", "노트"}
+        # Evicted prefixes no longer track their ids
+        assert set(cache._by_id) == {1, 2, 3, 4}
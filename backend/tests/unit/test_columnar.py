@@ -0,0 +1,99 @@
+"""
+단위 테스트: 컬럼형 스냅샷 정렬/top-k 검증
+"""
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from app.services.columnar import ColumnarSnapshot, NULL_TIMESTAMP, to_timestamp
+
+
+BASE_TIME = datetime(2024, 1, 1)
+
+ROWS = [
+    # id, category, price, popularity, created_at
+    (1, "도서", 15000.0, 10, BASE_TIME),
+    (2, "의류", None, 50, BASE_TIME + timedelta(days=3)),
+    (3, None, 3000.0, 50, BASE_TIME + timedelta(days=1)),
+    (5, "도서", 90000.0, 0, None),
+    (8, "전자제품", 1200.0, 7, BASE_TIME + timedelta(days=2)),
+]
+
+
+@pytest.fixture
+def snapshot():
+    return ColumnarSnapshot.from_rows(ROWS)
+
+
+def page_ids(snapshot, sort, order, offset=0, limit=10, positions=None):
+    if positions is None:
+        positions = np.arange(snapshot.size)
+    return snapshot.ids[snapshot.top_k(positions, sort, order, offset, limit)].tolist()
+
+
+class TestColumnarSnapshot:
+    """ColumnarSnapshot 테스트"""
+
+    @pytest.mark.unit
+    def test_dictionary_encoded_category(self, snapshot):
+        """카테고리 사전 인코딩 테스트"""
+        assert snapshot.categories == ["도서", "의류", "전자제품"]
+        assert snapshot.category_codes.tolist() == [0, 1, -1, 0, 2]
+
+    @pytest.mark.unit
+    def test_null_columns(self, snapshot):
+        """NULL 가격/날짜 인코딩 테스트"""
+        assert np.isnan(snapshot.prices[1])
+        assert snapshot.created_at[3] == NULL_TIMESTAMP
+
+    @pytest.mark.unit
+    def test_positions_of(self, snapshot):
+        """id -> 행 위치 변환 테스트"""
+        positions, known = snapshot.positions_of([8, 4, 1])
+        assert known.tolist() == [True, False, True]
+        assert positions[known].tolist() == [4, 0]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("sort,order,expected", [
+        ("price", "asc", [2, 8, 3, 1, 5]),
+        ("price", "desc", [5, 1, 3, 8, 2]),
+        ("popularity", "desc", [2, 3, 1, 8, 5]),
+        ("popularity", "asc", [5, 8, 1, 2, 3]),
+        ("date", "desc", [2, 8, 3, 1, 5]),
+        ("date", "asc", [5, 1, 3, 8, 2]),
+        ("relevance", "asc", [2, 3, 1, 8, 5]),
+    ])
+    def test_sort_order(self, snapshot, sort, order, expected):
+        """정렬 기준별 순서 테스트 (NULL 은 가장 작은 값)"""
+        assert page_ids(snapshot, sort, order) == expected
+
+    @pytest.mark.unit
+    def test_top_k_pages_are_consistent(self, snapshot):
+        """페이지 단위 top-k 가 전체 정렬과 일치하는지 테스트"""
+        full = page_ids(snapshot, "popularity", "desc")
+        pages = [page_ids(snapshot, "popularity", "desc", offset, 2) for offset in (0, 2, 4)]
+        assert sum(pages, []) == full
+
+    @pytest.mark.unit
+    def test_top_k_candidates(self, snapshot):
+        """후보 행 집합 내 top-k 테스트"""
+        assert page_ids(snapshot, "price", "asc", positions=np.array([0, 3, 4])) == [8, 1, 5]
+
+    @pytest.mark.unit
+    def test_top_k_out_of_range(self, snapshot):
+        """범위 밖 offset 테스트"""
+        assert page_ids(snapshot, "price", "asc", offset=10) == []
+
+    @pytest.mark.unit
+    def test_top_k_large_candidate_set(self):
+        """대량 후보에서 argpartition 결과가 전체 정렬과 일치하는지 테스트"""
+        rng = np.random.default_rng(0)
+        rows = [(i, None, None, int(rng.integers(0, 50)), None) for i in range(1, 2001)]
+        snapshot = ColumnarSnapshot.from_rows(rows)
+        expected = sorted(rows, key=lambda row: (-row[3], row[0]))
+        assert page_ids(snapshot, "popularity", "desc", 100, 20) == [row[0] for row in expected[100:120]]
+
+    @pytest.mark.unit
+    def test_to_timestamp(self):
+        """epoch 마이크로초 변환 테스트"""
+        assert to_timestamp(datetime(1970, 1, 1, 0, 0, 1)) == 1_000_000
+        assert to_timestamp(None) == NULL_TIMESTAMP
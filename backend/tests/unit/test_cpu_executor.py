@@ -0,0 +1,82 @@
+"""
+단위 테스트: CPU 작업 오프로드 실행기
+"""
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.services.cpu_executor import CpuExecutor
+from app.services.highlight import compile_query, highlight, highlight_cost, highlight_pages
+
+
+def _thread_name(_):
+    return threading.current_thread().name
+
+
+class _BrokenPool:
+    def submit(self, fn, *args):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        pass
+
+
+class TestHighlight:
+    """하이라이트 함수 테스트"""
+
+    @pytest.mark.unit
+    def test_pages_match_single_highlight(self):
+        """페이지 단위 결과는 제목별 highlight 와 같음"""
+        pages = [("test", ["Test one", None, "none"]), ("(x)", ["a (x) b"])]
+        assert highlight_pages(pages) == [
+            ["<mark>Test</mark> one", None, "none"],
+            ["a <mark>(x)</mark> b"],
+        ]
+        assert highlight_cost(pages) == len("Test one") + len("none") + len("a (x) b")
+
+    @pytest.mark.unit
+    def test_patterns_are_compiled_once(self):
+        """같은 검색어의 패턴은 재사용"""
+        assert compile_query("노트북") is compile_query("노트북")
+        assert highlight("", "q") == "" and highlight("text", "") == "text"
+
+
+class TestCpuExecutor:
+    """CpuExecutor 테스트"""
+
+    @pytest.mark.unit
+    def test_mode_by_cost(self):
+        """비용에 따라 루프/스레드/프로세스 선택, 프로세스 0 이면 스레드까지만"""
+        executor = CpuExecutor(processes=1, threads=1, thread_min_cost=10, process_min_cost=100)
+        assert [executor.mode_for(cost) for cost in (0, 9, 10, 99, 100)] == \
+            ["inline", "inline", "thread", "thread", "process"]
+        assert CpuExecutor(processes=0, thread_min_cost=10, process_min_cost=100).mode_for(10 ** 6) == "thread"
+
+    @pytest.mark.unit
+    async def test_inline_and_thread(self):
+        """작은 입력은 루프 스레드에서, 중간 입력은 오프로드 스레드에서 실행"""
+        executor = CpuExecutor(processes=0, threads=1, thread_min_cost=10, process_min_cost=100)
+        assert await executor.run("test", _thread_name, None, cost=1) == threading.current_thread().name
+        assert (await executor.run("test", _thread_name, None, cost=50)).startswith("cpu-offload")
+
+    @pytest.mark.unit
+    async def test_process_pool(self):
+        """큰 입력은 별도 프로세스에서 실행되고 결과는 동일"""
+        executor = CpuExecutor(processes=1, threads=1, thread_min_cost=10, process_min_cost=100)
+        try:
+            pid = await executor.run("test", os.getpid, cost=1000)
+            assert pid != os.getpid()
+            pages = [("a", ["abc", "bca"] * 100)]
+            assert await executor.highlight(pages) == highlight_pages(pages)
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.unit
+    async def test_broken_pool_falls_back_to_thread(self):
+        """프로세스 풀이 깨지면 스레드에서 실행하고 다음 호출에 풀을 새로 만듦"""
+        executor = CpuExecutor(processes=1, threads=1, thread_min_cost=10, process_min_cost=100)
+        executor._processes = _BrokenPool()
+        assert (await executor.run("test", _thread_name, None, cost=1000)).startswith("cpu-offload")
+        assert executor._processes is None
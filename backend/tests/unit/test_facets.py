@@ -0,0 +1,69 @@
+"""
+단위 테스트: 가격 패싯 계산 검증
+"""
+import pytest
+import numpy as np
+from app.services.facets import price_range_facets, price_histogram, price_facets
+
+
+PRICES = np.array([500, 1000, 4999, 5000, 12000, np.nan, 999999], dtype=np.float64)
+
+
+class TestPriceRangeFacets:
+    """고정 가격 구간 패싯 테스트"""
+
+    @pytest.mark.unit
+    def test_bucket_counts(self):
+        """구간별 카운트 테스트 (하한 포함, 상한 미포함)"""
+        facets = price_range_facets(PRICES, [1000, 5000, 10000])
+        assert [facet["count"] for facet in facets] == [1, 2, 1, 2]
+
+    @pytest.mark.unit
+    def test_bucket_keys(self):
+        """구간 키/경계 테스트"""
+        facets = price_range_facets(PRICES, [1000, 5000])
+        assert [facet["key"] for facet in facets] == ["*-1000", "1000-5000", "5000-*"]
+        assert facets[0]["from"] is None
+        assert facets[-1]["to"] is None
+
+    @pytest.mark.unit
+    def test_empty_prices(self):
+        """빈 입력 테스트"""
+        facets = price_range_facets(np.array([]), [1000])
+        assert [facet["count"] for facet in facets] == [0, 0]
+
+
+class TestPriceHistogram:
+    """분위수 히스토그램 테스트"""
+
+    @pytest.mark.unit
+    def test_quantile_bins_are_balanced(self):
+        """분위수 구간에 아이템이 고르게 분배되는지 테스트"""
+        prices = np.exp(np.linspace(0, 12, 1000))
+        histogram = price_histogram(prices, 4)
+        assert len(histogram) == 4
+        assert sum(bin_["count"] for bin_ in histogram) == 1000
+        assert all(240 <= bin_["count"] <= 260 for bin_ in histogram)
+
+    @pytest.mark.unit
+    def test_single_value(self):
+        """단일 값 테스트"""
+        assert price_histogram(np.array([100.0, 100.0]), 5) == [{"from": 100.0, "to": 100.0, "count": 2}]
+
+    @pytest.mark.unit
+    def test_ignores_nan(self):
+        """NaN 제외 테스트"""
+        histogram = price_histogram(PRICES, 3)
+        assert sum(bin_["count"] for bin_ in histogram) == 6
+
+    @pytest.mark.unit
+    def test_empty(self):
+        """빈 입력 테스트"""
+        assert price_histogram(np.array([]), 5) == []
+
+
+@pytest.mark.unit
+def test_price_facets_keys():
+    """가격 패싯 응답 키 테스트"""
+    facets = price_facets(PRICES, [1000], 2)
+    assert set(facets) == {"price_ranges", "price_histogram"}
@@ -0,0 +1,85 @@
+"""
+단위 테스트: 비트맵 필터 인덱스 검증
+"""
+import pytest
+import numpy as np
+from app.services.filter_index import FilterIndex, pack, unpack, popcount
+
+
+CATEGORIES = ["도서", "의류", "전자제품"]
+CODES = np.array([2, 0, 1, 2, -1, 0, 2], dtype=np.int32)
+PRICES = np.array([500, 1000, 4999, 5000, 12000, np.nan, 999999], dtype=np.float64)
+
+
+@pytest.fixture
+def filter_index():
+    return FilterIndex(CODES, CATEGORIES, PRICES, [1000, 5000, 10000])
+
+
+def positions(bitmap, size=len(CODES)):
+    return list(np.flatnonzero(unpack(bitmap, size)))
+
+
+class TestBitmap:
+    """압축 비트맵 유틸리티 테스트"""
+
+    @pytest.mark.unit
+    def test_pack_roundtrip(self):
+        """pack/unpack 왕복 테스트"""
+        mask = np.array([True, False, True] * 7)
+        assert (unpack(pack(mask), len(mask)) == mask).all()
+
+    @pytest.mark.unit
+    def test_popcount(self):
+        """popcount 테스트"""
+        mask = np.zeros(1000, dtype=bool)
+        mask[::3] = True
+        assert popcount(pack(mask)) == mask.sum()
+
+
+class TestFilterIndex:
+    """FilterIndex 테스트"""
+
+    @pytest.mark.unit
+    def test_category_bitmap(self, filter_index):
+        """카테고리 비트맵 테스트"""
+        assert positions(filter_index.category_bitmap("전자제품")) == [0, 3, 6]
+        assert positions(filter_index.category_bitmap("없음")) == []
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("min_price,max_price", [
+        (None, None),
+        (1000, None),
+        (None, 5000),
+        (999, 5000),
+        (1000, 4999),
+        (4999.5, 12000),
+        (100000, None),
+        (20000, 10000),
+    ])
+    def test_price_bitmap_matches_exact_filter(self, filter_index, min_price, max_price):
+        """가격 범위 비트맵이 SQL 조건과 동일한지 테스트"""
+        expected = ~np.isnan(PRICES)
+        if min_price is not None:
+            expected &= PRICES >= min_price
+        if max_price is not None:
+            expected &= PRICES <= max_price
+        bitmap = filter_index.price_bitmap(min_price, max_price)
+        assert positions(bitmap) == list(np.flatnonzero(expected))
+
+    @pytest.mark.unit
+    def test_filter_bitmap_combined(self, filter_index):
+        """카테고리 + 가격 결합 필터 테스트"""
+        bitmap = filter_index.filter_bitmap("전자제품", min_price=1000)
+        assert positions(bitmap) == [3, 6]
+
+    @pytest.mark.unit
+    def test_filter_bitmap_no_filters(self, filter_index):
+        """필터 없음 테스트"""
+        assert filter_index.filter_bitmap() is None
+
+    @pytest.mark.unit
+    def test_category_counts(self, filter_index):
+        """매치 집합 기준 카테고리 패싯 테스트"""
+        match = pack(np.array([True, True, False, True, True, False, False]))
+        assert filter_index.category_counts(match) == {"전자제품": 2, "도서": 1}
@@ -0,0 +1,159 @@
+"""
+단위 테스트: 백그라운드 헬스 모니터
+"""
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.database import DatabaseRouter
+from app.health import HealthMonitor, HealthState, pool_usage
+from app.loop_monitor import LoopMonitor
+from app.services.change_feed import ChangeFeed
+from app.services.search_index import SearchIndex
+from tests.conftest import test_engine
+
+
+@pytest.fixture
+def monitor():
+    return HealthMonitor(DatabaseRouter(test_engine), ChangeFeed(SearchIndex()), interval=60.0)
+
+
+class TestHealthState:
+    """HealthState 상태 판정 테스트"""
+
+    @pytest.mark.unit
+    def test_healthy(self):
+        """모든 지표 정상"""
+        assert HealthState("healthy", {}, 1.0, None).status == "healthy"
+
+    @pytest.mark.unit
+    def test_database_down_degrades(self):
+        """DB 실패 시 degraded"""
+        assert HealthState("unhealthy", {}, 1.0, None).status == "degraded"
+
+    @pytest.mark.unit
+    def test_pool_saturation_degrades(self):
+        """풀 포화 시 degraded"""
+        pool = {"size": 10, "capacity": 10, "checked_out": 10, "overflow": 0, "saturation": 1.0}
+        assert HealthState("healthy", {"primary": pool}, 1.0, None).status == "degraded"
+
+    @pytest.mark.unit
+    def test_replica_down_degrades(self):
+        """replica 실패 시 degraded"""
+        assert HealthState("healthy", {}, 1.0, None, replica="unhealthy").status == "degraded"
+
+    @pytest.mark.unit
+    def test_event_loop_lag_degrades(self):
+        """이벤트 루프 지연 시 degraded"""
+        assert HealthState("healthy", {}, 10_000.0, None).status == "degraded"
+
+    @pytest.mark.unit
+    def test_stale_index_degrades(self):
+        """인덱스 갱신 지연 시 degraded"""
+        assert HealthState("healthy", {}, 1.0, 3600.0).status == "degraded"
+
+
+class TestHealthMonitor:
+    """HealthMonitor 테스트"""
+
+    @pytest.mark.unit
+    async def test_probe_database(self, monitor):
+        """DB 프로브 결과 캐시"""
+        state = await monitor.probe()
+        assert state.database == "healthy"
+        assert monitor.state is state
+
+    @pytest.mark.unit
+    async def test_current_serves_cached_state(self, monitor):
+        """캐시가 신선하면 재프로브하지 않음"""
+        first = await monitor.probe()
+        assert await monitor.current() is first
+
+    @pytest.mark.unit
+    async def test_current_marks_stale_state_degraded(self, monitor):
+        """프로브가 멈추면 다시 프로브하지 않고 이전 상태를 degraded 로 표시"""
+        state = await monitor.probe()
+        state.checked_monotonic -= monitor.interval * 4
+        current = await monitor.current()
+        assert current is not state
+        assert current.stale and current.status == "degraded"
+        assert monitor.state is state and state.status == "healthy"
+
+    @pytest.mark.unit
+    async def test_current_before_first_probe(self, monitor):
+        """첫 프로브 전에는 degraded"""
+        state = await monitor.current()
+        assert state.database == "unknown"
+        assert state.status == "degraded"
+        assert monitor.state is None
+
+    @pytest.mark.unit
+    async def test_connect_timeout(self, monitor, monkeypatch):
+        """연결 자체가 멈춰도 timeout 안에 unhealthy"""
+        async def hang(db_engine):
+            await asyncio.sleep(60)
+
+        monkeypatch.setattr(monitor, "_select_one", hang)
+        monitor.timeout = 0.05
+        assert await monitor._probe_database(test_engine, "primary") == "unhealthy"
+
+    @pytest.mark.unit
+    async def test_loop_lag_comes_from_loop_monitor(self):
+        """이벤트 루프 지연은 LoopMonitor 의 최대 지연을 사용"""
+        loop = LoopMonitor(interval=60.0)
+        loop._peak_lag = 0.75
+        monitor = HealthMonitor(DatabaseRouter(test_engine), ChangeFeed(SearchIndex()), monitor=loop)
+        state = await monitor.probe()
+        assert state.event_loop_lag_ms == 750.0
+        assert loop.take_peak_lag() == 0.0
+
+    @pytest.mark.unit
+    async def test_unreachable_database(self):
+        """연결 실패 시 unhealthy"""
+        engine = create_async_engine("sqlite+aiosqlite:////nonexistent/dir/health.db")
+        state = await HealthMonitor(DatabaseRouter(engine), ChangeFeed(SearchIndex())).probe()
+        assert state.database == "unhealthy"
+        assert state.status == "degraded"
+
+    @pytest.mark.unit
+    async def test_replica_failure_routes_reads_to_primary(self):
+        """replica 장애 시 읽기를 primary 로 전환"""
+        replica = create_async_engine("sqlite+aiosqlite:////nonexistent/dir/replica.db")
+        router = DatabaseRouter(test_engine, replica=replica)
+        state = await HealthMonitor(router, ChangeFeed(SearchIndex())).probe()
+        assert state.replica == "unhealthy"
+        assert router.replica_healthy is False
+        assert router.read_session().bind is test_engine
+
+    @pytest.mark.unit
+    async def test_start_stop(self, monitor):
+        """백그라운드 프로브 시작/중지"""
+        monitor.start()
+        assert monitor.running
+        await monitor.stop()
+        assert not monitor.running
+
+
+class TestPoolUsage:
+    """pool_usage 테스트"""
+
+    @pytest.mark.unit
+    def test_queue_pool(self):
+        """QueuePool 사용량"""
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=4,
+            max_overflow=2,
+        )
+        usage = pool_usage(engine)
+        assert usage["capacity"] == 6
+        assert usage["checked_out"] == 0
+        assert usage["saturation"] == 0.0
+
+    @pytest.mark.unit
+    def test_unbounded_pool(self):
+        """크기 제한 없는 풀은 None"""
+        assert pool_usage(test_engine) is None
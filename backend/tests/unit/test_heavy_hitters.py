@@ -0,0 +1,110 @@
+"""
+단위 테스트: Count-Min Sketch, SpaceSaving, 검색어 빈도 요약
+"""
+import pytest
+
+from app.services.heavy_hitters import CountMinSketch, QuerySketch, SpaceSaving, normalize_query
+
+
+class TestCountMinSketch:
+    """CountMinSketch 테스트"""
+
+    @pytest.mark.unit
+    def test_estimates_never_undercount(self):
+        """추정치는 실제 빈도 이상"""
+        cms = CountMinSketch(width=64, depth=4)
+        truth = {f"q{i}": i + 1 for i in range(200)}
+        for key, count in truth.items():
+            cms.add(key, count)
+        assert all(cms.estimate(key) >= count for key, count in truth.items())
+
+    @pytest.mark.unit
+    def test_merge_sums_counts(self):
+        """병합은 카운터 합, 모양이 다르면 거부"""
+        a, b = CountMinSketch(128, 3), CountMinSketch(128, 3)
+        a.add("노트북", 3)
+        b.add("노트북", 4)
+        a.merge(b)
+        assert a.estimate("노트북") == 7
+        with pytest.raises(ValueError):
+            a.merge(CountMinSketch(64, 3))
+
+
+class TestSpaceSaving:
+    """SpaceSaving 테스트"""
+
+    @pytest.mark.unit
+    def test_keeps_heavy_hitters(self):
+        """빈도가 높은 키는 꽉 찬 상태에서도 유지"""
+        summary = SpaceSaving(capacity=3)
+        for _ in range(50):
+            summary.add("노트북")
+        for i in range(100):
+            summary.add(f"rare{i}")
+        assert "노트북" in summary.entries
+        count, error, _, _ = summary.entries["노트북"]
+        assert count - error <= 50 <= count
+
+    @pytest.mark.unit
+    def test_merge_keeps_top_capacity(self):
+        """병합 후 상위 capacity 개만 유지"""
+        a, b = SpaceSaving(2), SpaceSaving(2)
+        a.add("a", 10, seen=1.0)
+        a.add("b", 5)
+        b.add("a", 2, seen=3.0)
+        b.add("c", 8)
+        a.merge(b)
+        assert set(a.entries) == {"a", "c"}
+        assert a.entries["a"][0] == 12
+        assert a.entries["a"][2] == 3.0
+
+
+class TestQuerySketch:
+    """QuerySketch 테스트"""
+
+    @pytest.mark.unit
+    def test_normalizes_queries(self):
+        """대소문자/공백이 달라도 같은 검색어로 집계, 표기는 가장 최근 원래 표기"""
+        assert normalize_query("  Gaming   Laptop ") == "gaming laptop"
+        sketch = QuerySketch(k=10, width=256, depth=4)
+        for query in ("Laptop", "laptop ", " LAPTOP", "mouse"):
+            sketch.record(query, at=100.0)
+        assert sketch.heavy_hitters(1) == [(" LAPTOP", 3.0, 100.0)]
+        sketch.record("Laptop", at=50.0)
+        assert sketch.heavy_hitters(1)[0][0] == " LAPTOP"
+        assert "laptop" in sketch.top.entries
+        assert sketch.observations == 5.0
+
+    @pytest.mark.unit
+    def test_decay_halves_counts(self):
+        """half_life 경과 시 빈도 절반"""
+        sketch = QuerySketch(k=10, width=256, depth=4, half_life=60.0)
+        sketch.decayed_at = 1000.0
+        sketch.record("laptop", 8)
+        sketch.decay(now=1060.0)
+        assert sketch.heavy_hitters(1)[0][1] == pytest.approx(4.0)
+        assert sketch.observations == pytest.approx(4.0)
+
+    @pytest.mark.unit
+    def test_round_trip_serialization(self):
+        """직렬화 후 복원해도 같은 상위 검색어"""
+        sketch = QuerySketch(k=10, width=256, depth=4)
+        for query in ["a"] * 5 + ["b"] * 3:
+            sketch.record(query, at=1.0)
+        counts, top = sketch.dumps()
+        restored = QuerySketch.loads(counts, top, k=10, width=256, depth=4)
+        assert restored.heavy_hitters(2) == sketch.heavy_hitters(2)
+
+    @pytest.mark.unit
+    def test_merge_keeps_latest_display(self):
+        """병합하면 더 최근에 검색된 쪽 표기를 유지, 예전 형식 항목은 키를 표기로"""
+        old = QuerySketch(k=10, width=256, depth=4)
+        new = QuerySketch(k=10, width=256, depth=4)
+        old.record("iphone 15", at=10.0)
+        new.record("iPhone 15", at=20.0)
+        old.merge(new)
+        assert old.heavy_hitters(1) == [("iPhone 15", 2.0, 20.0)]
+
+        counts, _ = old.dumps()
+        legacy = QuerySketch.loads(counts, '{"iphone 15": [2.0, 0.0, 20.0]}', k=10, width=256, depth=4)
+        assert legacy.heavy_hitters(1) == [("iphone 15", 2.0, 20.0)]
@@ -0,0 +1,127 @@
+"""
+단위 테스트: 인덱스 스냅샷 파일 형식 검증
+"""
+import pytest
+import struct
+import numpy as np
+from datetime import datetime
+from app.services.change_feed import ChangeFeed
+from app.services.columnar import ColumnarSnapshot
+from app.services.index_snapshot import (
+    SnapshotError,
+    collect_snapshot,
+    write_snapshot,
+    read_snapshot,
+    load_snapshot,
+)
+from app.services.search_index import SearchIndex
+
+
+NOW = datetime(2024, 1, 1)
+WATERMARK = (datetime(2024, 1, 2, 3, 4, 5), 42)
+
+ROWS = [
+    (1, "도서", 3000.0, 10, NOW),
+    (2, "의류", None, 20, None),
+    (4, "도서", 70000.0, 30, NOW),
+]
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex(price_edges=[1000, 10000])
+    index.load(ColumnarSnapshot.from_rows(ROWS))
+    return index
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, index):
+    path = str(tmp_path / "index.snap")
+    write_snapshot(path, *collect_snapshot(index, WATERMARK))
+    return path
+
+
+class TestIndexSnapshot:
+    """스냅샷 쓰기/읽기 테스트"""
+
+    @pytest.mark.unit
+    def test_roundtrip_columns(self, snapshot_path, index):
+        """컬럼 왕복 테스트"""
+        manifest, columns, _ = read_snapshot(snapshot_path)
+        assert manifest["size"] == 3
+        assert columns.categories == index.columns.categories
+        for name in ("ids", "prices", "popularity", "created_at", "category_codes"):
+            np.testing.assert_array_equal(getattr(columns, name), getattr(index.columns, name))
+
+    @pytest.mark.unit
+    def test_arrays_are_zero_copy_views(self, snapshot_path):
+        """mmap 기반 zero-copy 뷰 테스트"""
+        _, columns, bitmaps = read_snapshot(snapshot_path)
+        assert not columns.ids.flags.owndata
+        assert not bitmaps[0].flags.owndata
+        assert columns.ids.ctypes.data % 64 == 0
+
+    @pytest.mark.unit
+    def test_views_are_copy_on_write(self, snapshot_path):
+        """뷰 수정이 파일에 반영되지 않는지 테스트"""
+        _, columns, _ = read_snapshot(snapshot_path)
+        columns.popularity[0] = 999
+        _, reread, _ = read_snapshot(snapshot_path)
+        assert reread.popularity[0] == 10
+
+    @pytest.mark.unit
+    def test_load_restores_filters_and_watermark(self, snapshot_path):
+        """인덱스 적재 및 워터마크 복원 테스트"""
+        index = SearchIndex(price_edges=[1000, 10000])
+        feed = ChangeFeed(index)
+        load_snapshot(snapshot_path, index, feed)
+
+        assert feed.watermark == WATERMARK
+        assert index.filters.category_counts(index.match_bitmap([1, 2, 4])) == {"도서": 2, "의류": 1}
+        bitmap = index.filters.filter_bitmap(min_price=1000, max_price=10000)
+        assert np.unpackbits(bitmap, count=3).tolist() == [1, 0, 0]
+
+    @pytest.mark.unit
+    def test_load_rebuilds_bitmaps_for_other_buckets(self, snapshot_path):
+        """가격 구간 설정이 다르면 비트맵 재구성 테스트"""
+        index = SearchIndex(price_edges=[50000])
+        load_snapshot(snapshot_path, index, ChangeFeed(index))
+        bitmap = index.filters.filter_bitmap(min_price=50000)
+        assert np.unpackbits(bitmap, count=3).tolist() == [0, 0, 1]
+
+    @pytest.mark.unit
+    def test_snapshot_excludes_tombstones(self, tmp_path, index):
+        """tombstone 행 제외 테스트"""
+        index.apply_changes([], [2])
+        generation = index.generation
+        path = str(tmp_path / "compacted.snap")
+        write_snapshot(path, *collect_snapshot(index, None))
+        manifest, columns, _ = read_snapshot(path)
+        assert columns.ids.tolist() == [1, 4]
+        assert manifest["watermark"] is None
+        # The serving index is left as it was
+        assert index.tombstones == 1
+        assert index.generation == generation
+
+    @pytest.mark.unit
+    def test_rejects_foreign_file(self, tmp_path):
+        """잘못된 파일 거부 테스트"""
+        path = tmp_path / "garbage.snap"
+        path.write_bytes(b"not a snapshot at all")
+        with pytest.raises(SnapshotError):
+            read_snapshot(str(path))
+
+    @pytest.mark.unit
+    def test_rejects_other_format_version(self, snapshot_path):
+        """다른 포맷 버전 거부 테스트"""
+        with open(snapshot_path, "r+b") as f:
+            f.seek(8)
+            f.write(struct.pack("<I", 999))
+        with pytest.raises(SnapshotError):
+            read_snapshot(snapshot_path)
+
+    @pytest.mark.unit
+    def test_missing_file(self, tmp_path):
+        """파일 없음 테스트"""
+        with pytest.raises(SnapshotError):
+            read_snapshot(str(tmp_path / "missing.snap"))
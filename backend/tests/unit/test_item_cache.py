@@ -0,0 +1,52 @@
+"""
+단위 테스트: id 별 아이템 LRU 캐시
+"""
+import pytest
+
+from app.services.item_cache import ItemCache
+
+
+def payload(item_id):
+    return {"id": item_id, "title": f"item {item_id}"}
+
+
+class TestItemCache:
+    """ItemCache 테스트"""
+
+    @pytest.mark.unit
+    def test_get_many_splits_hits_and_misses(self):
+        """적중/미적중 분리"""
+        cache = ItemCache(capacity=10, ttl=60)
+        cache.put_many({1: payload(1), 2: payload(2)})
+        found, missing = cache.get_many([1, 3, 2])
+        assert set(found) == {1, 2}
+        assert missing == [3]
+        assert cache.stats()["hits"] == 2
+
+    @pytest.mark.unit
+    def test_evicts_least_recently_used(self):
+        """용량 초과 시 가장 오래 사용하지 않은 항목 제거"""
+        cache = ItemCache(capacity=2, ttl=60)
+        cache.put_many({1: payload(1), 2: payload(2)})
+        cache.get_many([1])
+        cache.put_many({3: payload(3)})
+        found, missing = cache.get_many([1, 2, 3])
+        assert set(found) == {1, 3}
+        assert missing == [2]
+
+    @pytest.mark.unit
+    def test_expired_entries_are_misses(self):
+        """ttl 이 지난 항목은 미적중"""
+        cache = ItemCache(capacity=10, ttl=0)
+        cache.put_many({1: payload(1)})
+        assert cache.get_many([1])[1] == [1]
+
+    @pytest.mark.unit
+    def test_change_feed_invalidates(self):
+        """변경 피드의 변경/삭제 id 무효화"""
+        cache = ItemCache(capacity=10, ttl=60)
+        cache.put_many({1: payload(1), 2: payload(2), 3: payload(3)})
+        cache.apply_changes([(1, "도서", 100.0, 0, None)], [3])
+        found, missing = cache.get_many([1, 2, 3])
+        assert set(found) == {2}
+        assert missing == [1, 3]
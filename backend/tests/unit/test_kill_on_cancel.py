@@ -0,0 +1,103 @@
+"""
+단위 테스트: 취소된 쿼리의 서버 쪽 중단 (kill_on_cancel)
+"""
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.database import kill_on_cancel
+
+
+class FakeResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        return self.value
+
+
+class FakeConnection:
+    """exec_driver_sql 호출을 기록하는 MySQL 흉내 연결"""
+
+    def __init__(self, executed: list, connection_id: int = 0):
+        self.executed = executed
+        self.connection_id = connection_id
+        self.dialect = SimpleNamespace(name="mysql")
+        self.engine = self
+
+    async def exec_driver_sql(self, statement):
+        self.executed.append(statement)
+        return FakeResult(self.connection_id)
+
+    def connect(self):
+        return self
+
+    async def __aenter__(self):
+        return FakeConnection(self.executed)
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    def __init__(self, conn):
+        self.conn = conn
+
+    async def connection(self):
+        return self.conn
+
+
+class TestKillOnCancel:
+    """kill_on_cancel 테스트"""
+
+    @pytest.mark.unit
+    async def test_mysql_kills_the_running_query_on_cancel(self):
+        """MySQL: 취소되면 별도 연결로 자기 연결의 KILL QUERY"""
+        executed = []
+        db = FakeSession(FakeConnection(executed, connection_id=42))
+        started = asyncio.Event()
+
+        async def lookup():
+            async with kill_on_cancel(db):
+                started.set()
+                await asyncio.sleep(10)
+
+        task = asyncio.create_task(lookup())
+        await started.wait()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert executed == ["SELECT CONNECTION_ID()", "KILL QUERY 42"]
+
+    @pytest.mark.unit
+    async def test_mysql_completed_block_sends_no_kill(self):
+        """끝까지 실행된 블록은 KILL 을 보내지 않음"""
+        executed = []
+        async with kill_on_cancel(FakeSession(FakeConnection(executed, connection_id=7))):
+            pass
+        assert executed == ["SELECT CONNECTION_ID()"]
+
+    @pytest.mark.unit
+    async def test_sqlite_only_abandons_the_wait(self):
+        """SQLite: 서버 쪽 중단 없이 대기만 취소되고 세션은 다시 쓸 수 있음"""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        try:
+            async with AsyncSession(engine) as db:
+                started = asyncio.Event()
+
+                async def lookup():
+                    async with kill_on_cancel(db):
+                        started.set()
+                        await asyncio.sleep(10)
+
+                task = asyncio.create_task(lookup())
+                await started.wait()
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                assert (await db.execute(text("SELECT 1"))).scalar() == 1
+        finally:
+            await engine.dispose()
@@ -0,0 +1,88 @@
+"""
+단위 테스트: DDSketch 분위수 요약과 엔드포인트/검색어별 지연 요약
+"""
+import random
+import pytest
+
+from app.services.heavy_hitters import QuerySketch
+from app.services.latency_sketch import DDSketch, LatencySketches
+
+
+def exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestDDSketch:
+    """DDSketch 테스트"""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("q", [0.5, 0.95, 0.99])
+    def test_relative_accuracy(self, q):
+        """분위수 추정치는 상대 오차 1% 이내"""
+        rng = random.Random(7)
+        values = [rng.lognormvariate(3, 1) for _ in range(5000)]
+        sketch = DDSketch(0.01)
+        for value in values:
+            sketch.add(value)
+        assert sketch.quantile(q) == pytest.approx(exact_quantile(values, q), rel=0.0201)
+
+    @pytest.mark.unit
+    def test_merge_equals_single_sketch(self):
+        """나눠 기록 후 병합한 결과는 한 번에 기록한 결과와 같음"""
+        values = [float(v) for v in range(1, 1001)]
+        whole, left, right = DDSketch(), DDSketch(), DDSketch()
+        for value in values:
+            whole.add(value)
+            (left if value % 2 else right).add(value)
+        left.merge(right)
+        assert left.summary() == whole.summary()
+        with pytest.raises(ValueError):
+            left.merge(DDSketch(0.05))
+
+    @pytest.mark.unit
+    def test_bins_are_bounded(self):
+        """버킷 수는 max_bins 이하, 꼬리 분위수는 유지"""
+        sketch = DDSketch(0.01, max_bins=64)
+        for value in range(1, 10001):
+            sketch.add(float(value))
+        assert len(sketch.bins) <= 64
+        assert sketch.quantile(0.99) == pytest.approx(9900, rel=0.02)
+
+    @pytest.mark.unit
+    def test_round_trip_and_empty(self):
+        """직렬화 왕복, 빈 요약은 None"""
+        sketch = DDSketch()
+        assert sketch.summary() is None
+        for value in (0.0, 5.0, 50.0, 500.0):
+            sketch.add(value)
+        assert DDSketch.loads(sketch.dumps()).summary() == sketch.summary()
+
+
+class TestLatencySketches:
+    """LatencySketches 테스트"""
+
+    @pytest.mark.unit
+    def test_only_top_queries_are_tracked(self, monkeypatch):
+        """빈도 상위 검색어만 검색어별 요약을 유지"""
+        top = QuerySketch(k=1, width=64, depth=2)
+        top.record("노트북", 5)
+        monkeypatch.setattr("app.services.latency_sketch.query_sketch.local", top)
+
+        sketches = LatencySketches(window=3600)
+        sketches.record_queries([("노트북", 12.0), (" 노트북", 14.0), ("마우스", 3.0), ("노트북", None)])
+        assert sketches.summary("query", "노트북")["count"] == 2
+        assert sketches.summary("query", "마우스") is None
+
+    @pytest.mark.unit
+    def test_rotation_keeps_previous_window(self):
+        """창 교체 후에도 직전 창은 보고에 포함, 두 번 교체되면 제외"""
+        sketches = LatencySketches(window=60)
+        sketches.rotated_at = 0.0
+        sketches.record_endpoint("/api/search", 10.0)
+        sketches.rotate(now=60.0)
+        sketches.record_endpoint("/api/search", 20.0)
+        assert sketches.endpoint_summaries()["/api/search"]["count"] == 2
+        sketches.rotate(now=120.0)
+        sketches.rotate(now=180.0)
+        assert sketches.endpoint_summaries() == {}
@@ -0,0 +1,68 @@
+"""
+단위 테스트: 키별 최신 작업 유지 (이전 작업 취소)
+"""
+import asyncio
+import pytest
+
+from app.services.latest_only import LatestOnly, Superseded
+
+
+class TestLatestOnly:
+    """LatestOnly 테스트"""
+
+    @pytest.mark.unit
+    async def test_newer_call_cancels_older(self):
+        """같은 키의 새 호출은 이전 작업을 취소하고 이전 호출자는 Superseded"""
+        latest = LatestOnly("test-supersede")
+        started, aborted = asyncio.Event(), asyncio.Event()
+
+        async def slow():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                aborted.set()
+                raise
+
+        async def fast():
+            return "new"
+
+        older = asyncio.create_task(latest.run("s1", slow))
+        await started.wait()
+        assert await latest.run("s1", fast) == "new"
+
+        with pytest.raises(Superseded):
+            await older
+        assert aborted.is_set()
+        assert latest.stats() == {"inflight": 0, "completed": 1, "cancelled": 1}
+
+    @pytest.mark.unit
+    async def test_distinct_keys_do_not_interfere(self):
+        """키가 다르면 서로 취소하지 않음"""
+        latest = LatestOnly("test-keys")
+
+        async def work(value):
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(latest.run("a", lambda: work(1)), latest.run("b", lambda: work(2)))
+        assert results == [1, 2]
+        assert latest.cancelled == 0
+
+    @pytest.mark.unit
+    async def test_caller_cancellation_is_not_supersession(self):
+        """호출자 자신이 취소되면 CancelledError 그대로 전파, 작업도 취소됨"""
+        latest = LatestOnly("test-caller")
+        started = asyncio.Event()
+
+        async def slow():
+            started.set()
+            await asyncio.sleep(10)
+
+        caller = asyncio.create_task(latest.run("s1", slow))
+        await started.wait()
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert latest.stats()["inflight"] == 0
+        assert latest.cancelled == 0
@@ -0,0 +1,91 @@
+"""
+단위 테스트: search_logs 기간 계산, MySQL 파티션 DDL, 파티션 선택 조회
+"""
+import pytest
+from datetime import datetime
+from sqlalchemy import select
+
+from app.services.log_partitions import (
+    LogPartitions,
+    _from_days,
+    _to_days,
+    mysql_partition_ddl,
+    mysql_reorganize_ddl,
+    next_period,
+    period_name,
+    period_start,
+)
+
+
+class TestPeriods:
+    """기간 계산 테스트"""
+
+    @pytest.mark.unit
+    def test_month_periods(self):
+        """월 단위 시작/다음 기간 (연말 넘김 포함)"""
+        moment = datetime(2026, 12, 15, 13, 30)
+        assert period_start(moment, "month") == datetime(2026, 12, 1)
+        assert next_period(datetime(2026, 12, 1), "month") == datetime(2027, 1, 1)
+        assert period_name(datetime(2026, 12, 1), "month") == "202612"
+
+    @pytest.mark.unit
+    def test_day_periods(self):
+        """일 단위 시작/다음 기간"""
+        moment = datetime(2026, 2, 28, 23, 59)
+        assert period_start(moment, "day") == datetime(2026, 2, 28)
+        assert next_period(datetime(2026, 2, 28), "day") == datetime(2026, 3, 1)
+        assert period_name(datetime(2026, 2, 28), "day") == "20260228"
+
+    @pytest.mark.unit
+    def test_invalid_period(self):
+        """지원하지 않는 기간 단위는 거부"""
+        with pytest.raises(ValueError):
+            LogPartitions(period="week")
+
+
+class TestMySQLDDL:
+    """MySQL 파티션 DDL 테스트"""
+
+    @pytest.mark.unit
+    def test_partition_ddl_uses_to_days(self):
+        """TO_DAYS 값은 MySQL 과 같게 계산 (TO_DAYS('2000-01-01') = 730485)"""
+        assert _to_days(datetime(2000, 1, 1)) == 730485
+        assert _from_days(730485) == datetime(2000, 1, 1)
+        statements = mysql_partition_ddl(datetime(2026, 10, 1))
+        assert "ADD PRIMARY KEY (id, created_at)" in statements[1]
+        assert "PARTITION p_history VALUES LESS THAN (740255)" in statements[2]
+        assert statements[2].endswith("PARTITION p_future VALUES LESS THAN MAXVALUE)")
+
+    @pytest.mark.unit
+    def test_reorganize_ddl(self):
+        """p_future 를 기간 파티션과 새 p_future 로 분할"""
+        ddl = mysql_reorganize_ddl([("202610", datetime(2026, 11, 1)), ("202611", datetime(2026, 12, 1))])
+        assert ddl.startswith("ALTER TABLE search_logs REORGANIZE PARTITION p_future INTO (")
+        assert "PARTITION p202610 VALUES LESS THAN (740286)" in ddl
+        assert ddl.endswith("PARTITION p_future VALUES LESS THAN MAXVALUE)")
+
+
+class TestSource:
+    """파티션 선택 조회 테스트"""
+
+    @pytest.mark.unit
+    def test_without_archives_reads_hot_table(self):
+        """기간 테이블이 없으면 search_logs 를 그대로 사용"""
+        partitions = LogPartitions(period="month")
+        assert partitions.source().name == "search_logs"
+
+    @pytest.mark.unit
+    def test_prunes_archives_outside_range(self):
+        """범위와 겹치는 기간 테이블만 UNION"""
+        partitions = LogPartitions(period="month")
+        for month in (7, 8, 9):
+            start = datetime(2026, month, 1)
+            partitions.archives[start] = partitions._archive_table(start)
+
+        sql = str(select(partitions.source(since=datetime(2026, 8, 15)).c.query).compile())
+        assert "search_logs_p202607" not in sql
+        assert "search_logs_p202608" in sql
+        assert "search_logs_p202609" in sql
+
+        sql = str(select(partitions.source().c.query).compile())
+        assert all(f"search_logs_p20260{month}" in sql for month in (7, 8, 9))
@@ -0,0 +1,101 @@
+"""
+단위 테스트: 이벤트 루프 지연 모니터 / 블로킹 호출 탐지
+"""
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from prometheus_client import REGISTRY
+
+from app.loop_monitor import LoopMonitor, LoopMonitorMiddleware
+
+
+def _blocking_call(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+def _lag_sum() -> float:
+    return REGISTRY.get_sample_value("searchpilot_event_loop_scheduling_lag_seconds_sum") or 0.0
+
+
+class TestLoopMonitor:
+    """LoopMonitor 테스트"""
+
+    @pytest.mark.unit
+    async def test_lag_histogram(self):
+        """루프를 막은 시간만큼 지연이 히스토그램에 기록"""
+        monitor = LoopMonitor(interval=0.01, detect_blocking=False)
+        before = _lag_sum()
+        monitor.start()
+        try:
+            await asyncio.sleep(0.02)
+            _blocking_call(0.1)
+            await asyncio.sleep(0.03)
+        finally:
+            await monitor.stop()
+        assert _lag_sum() - before >= 0.05
+        assert not monitor.reports
+
+    @pytest.mark.unit
+    async def test_reports_blocking_stack_with_route(self):
+        """임계값을 넘긴 블로킹은 호출 스택과 경로와 함께 한 번만 보고"""
+        monitor = LoopMonitor(interval=0.01, threshold_ms=30, detect_blocking=True)
+        monitor.start()
+        try:
+            async def handler():
+                monitor.track(asyncio.current_task(), "GET /api/slow")
+                try:
+                    await asyncio.sleep(0.02)
+                    _blocking_call(0.2)
+                finally:
+                    monitor.untrack(asyncio.current_task())
+
+            await asyncio.create_task(handler())
+            await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop()
+
+        assert len(monitor.reports) == 1
+        report = monitor.reports[0]
+        assert report["route"] == "GET /api/slow"
+        assert report["blocked_ms"] >= 30
+        assert "_blocking_call" in report["stack"]
+
+    @pytest.mark.unit
+    async def test_background_blocking_has_no_route(self):
+        """요청 밖의 블로킹은 경로 없이 태스크 이름으로 보고"""
+        monitor = LoopMonitor(interval=0.01, threshold_ms=30, detect_blocking=True)
+        monitor.start()
+        try:
+            async def refresh():
+                await asyncio.sleep(0.02)
+                _blocking_call(0.15)
+
+            await asyncio.create_task(refresh(), name="index-refresh")
+        finally:
+            await monitor.stop()
+        assert [(report["route"], report["task"]) for report in monitor.reports] == [(None, "index-refresh")]
+
+    @pytest.mark.unit
+    async def test_middleware_tags_route(self):
+        """미들웨어를 거친 요청의 블로킹은 메서드/경로로 보고"""
+        monitor = LoopMonitor(interval=0.01, threshold_ms=30, detect_blocking=True)
+        app = FastAPI()
+        app.add_middleware(LoopMonitorMiddleware, monitor=monitor)
+
+        @app.get("/api/slow")
+        async def slow():
+            await asyncio.sleep(0.02)
+            _blocking_call(0.15)
+            return {}
+
+        monitor.start()
+        try:
+            async with AsyncClient(app=app, base_url="http://test") as client:
+                assert (await client.get("/api/slow")).status_code == 200
+        finally:
+            await monitor.stop()
+        assert [report["route"] for report in monitor.reports] == ["GET /api/slow"]
+        assert not monitor._routes
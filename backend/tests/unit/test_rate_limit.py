@@ -0,0 +1,105 @@
+"""
+단위 테스트: 클라이언트별 토큰 버킷 속도 제한
+"""
+import pytest
+
+from app.rate_limit import Budget, MemoryTokenBuckets, RateLimitBackend, RateLimiter, client_key, default_limiter
+
+
+class TestMemoryTokenBuckets:
+    """MemoryTokenBuckets 테스트"""
+
+    @pytest.mark.unit
+    async def test_burst_then_reject(self):
+        """burst 만큼 허용 후 거절, 재시도 시간은 1/rate"""
+        buckets = MemoryTokenBuckets(max_keys=10)
+        results = [await buckets.take("c", rate=1.0, burst=3) for _ in range(4)]
+        assert [allowed for allowed, _ in results] == [True, True, True, False]
+        assert results[-1][1] == pytest.approx(1.0, abs=0.01)
+
+    @pytest.mark.unit
+    async def test_refill_over_time(self, monkeypatch):
+        """시간이 지나면 rate 만큼 충전 (burst 상한)"""
+        now = [100.0]
+        monkeypatch.setattr("app.rate_limit.time.monotonic", lambda: now[0])
+        buckets = MemoryTokenBuckets(max_keys=10)
+        assert (await buckets.take("c", rate=2.0, burst=1))[0]
+        assert not (await buckets.take("c", rate=2.0, burst=1))[0]
+        now[0] += 0.5
+        assert (await buckets.take("c", rate=2.0, burst=1))[0]
+
+    @pytest.mark.unit
+    async def test_lru_eviction_bounds_memory(self):
+        """max_keys 를 넘으면 가장 오래 쓰이지 않은 버킷부터 제거"""
+        buckets = MemoryTokenBuckets(max_keys=2)
+        await buckets.take("a", 1.0, 1)
+        await buckets.take("b", 1.0, 1)
+        await buckets.take("a", 1.0, 1)
+        await buckets.take("c", 1.0, 1)
+        assert len(buckets) == 2
+        # "b" was evicted, so it starts over with a full bucket
+        assert (await buckets.take("b", 1.0, 1))[0]
+        assert not (await buckets.take("c", 1.0, 1))[0]
+
+
+class TestRateLimiter:
+    """RateLimiter 테스트"""
+
+    @pytest.mark.unit
+    async def test_budgets_are_per_client_and_endpoint(self):
+        """클라이언트와 예산 그룹마다 버킷이 분리됨"""
+        tight = Budget("tight", 1.0, 1)
+        limiter = RateLimiter(MemoryTokenBuckets(100), {"/api/search/stats": tight}, Budget("default", 1.0, 1))
+        assert (await limiter.check("1.1.1.1", tight))[0]
+        assert not (await limiter.check("1.1.1.1", tight))[0]
+        assert (await limiter.check("2.2.2.2", tight))[0]
+        assert (await limiter.check("1.1.1.1", limiter.default))[0]
+
+    @pytest.mark.unit
+    async def test_backend_failure_fails_open(self):
+        """저장소 오류 시 요청 허용"""
+        class Broken(RateLimitBackend):
+            async def take(self, key, rate, burst, cost=1.0):
+                raise ConnectionError("down")
+
+        limiter = RateLimiter(Broken(), {}, Budget("default", 1.0, 1))
+        assert await limiter.check("c", limiter.default) == (True, 0.0)
+
+    @pytest.mark.unit
+    def test_budget_for(self):
+        """경로별 예산, 미등록 /api 경로는 기본 예산, 그 외는 제외"""
+        limiter = default_limiter()
+        assert limiter.budget_for("/api/autocomplete").name == "autocomplete"
+        assert limiter.budget_for("/api/search/stats").name == "aggregates"
+        assert limiter.budget_for("/api/search").name == "default"
+        assert limiter.budget_for("/api/search/cache-stats") is None
+        assert limiter.budget_for("/health") is None
+
+    @pytest.mark.unit
+    def test_client_key(self, monkeypatch):
+        """X-Forwarded-For 는 신뢰하는 프록시가 보낸 요청에서만 사용"""
+        scope = {"client": ("10.0.0.1", 1234), "headers": [(b"x-forwarded-for", b"203.0.113.7, 10.0.0.2")]}
+        assert client_key(scope) == "10.0.0.1"
+        monkeypatch.setattr("app.rate_limit.settings.RATE_LIMIT_TRUSTED_PROXIES", "10.0.0.0/8")
+        assert client_key(scope) == "203.0.113.7"
+        assert client_key({"client": None, "headers": []}) == "unknown"
+
+        # A peer outside the proxy ranges cannot choose its own key
+        direct = {"client": ("198.51.100.9", 1234), "headers": [(b"x-forwarded-for", b"203.0.113.7")]}
+        assert client_key(direct) == "198.51.100.9"
+
+    @pytest.mark.unit
+    def test_client_key_ignores_spoofed_hops(self, monkeypatch):
+        """클라이언트가 앞에 붙인 주소는 무시하고 프록시가 붙인 주소 사용"""
+        monkeypatch.setattr("app.rate_limit.settings.RATE_LIMIT_TRUSTED_PROXIES", "10.0.0.0/8, 172.16.0.0/12")
+        scope = {
+            "client": ("10.0.0.1", 1234),
+            "headers": [
+                (b"x-forwarded-for", b"1.2.3.4, 203.0.113.7"),
+                (b"x-forwarded-for", b"172.17.0.5"),
+            ],
+        }
+        assert client_key(scope) == "203.0.113.7"
+        only_proxies = {"client": ("10.0.0.1", 1234), "headers": [(b"x-forwarded-for", b"10.1.1.1, 10.2.2.2")]}
+        assert client_key(only_proxies) == "10.1.1.1"
+        assert client_key({"client": ("10.0.0.1", 1234), "headers": []}) == "10.0.0.1"
@@ -0,0 +1,114 @@
+"""
+단위 테스트: 검색 인덱스 증분 갱신 검증
+"""
+import pytest
+import numpy as np
+from datetime import datetime
+from app.services.columnar import ColumnarSnapshot
+from app.services.search_index import SearchIndex
+
+
+NOW = datetime(2024, 1, 1)
+
+ROWS = [
+    (1, "도서", 3000.0, 10, NOW),
+    (2, "의류", 20000.0, 20, NOW),
+    (4, "도서", 700.0, 30, NOW),
+]
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex(price_edges=[1000, 10000])
+    index.load(ColumnarSnapshot.from_rows(ROWS))
+    return index
+
+
+def filtered_ids(index, **filters):
+    bitmap = index.filters.filter_bitmap(**filters)
+    return index.ids[np.unpackbits(bitmap, count=index.size).astype(bool)].tolist()
+
+
+class TestSearchIndexUpdates:
+    """SearchIndex.apply_changes 테스트"""
+
+    @pytest.mark.unit
+    def test_update_in_place(self, index):
+        """기존 행 제자리 갱신 테스트 (위치 불변)"""
+        generation = index.generation
+        index.apply_changes([(1, "의류", 500.0, 99, NOW)], [])
+
+        assert index.generation == generation
+        assert filtered_ids(index, category="의류") == [1, 2]
+        assert filtered_ids(index, category="도서") == [4]
+        assert filtered_ids(index, max_price=999) == [1, 4]
+        assert index.columns.popularity[0] == 99
+
+    @pytest.mark.unit
+    def test_update_new_category(self, index):
+        """새 카테고리 등록 테스트"""
+        index.apply_changes([(2, "식품", 20000.0, 20, NOW)], [])
+        assert filtered_ids(index, category="식품") == [2]
+        assert filtered_ids(index, category="의류") == []
+
+    @pytest.mark.unit
+    def test_insert_appends(self, index):
+        """신규 행 추가 테스트"""
+        generation = index.generation
+        index.apply_changes([(7, "의류", 5000.0, 0, NOW), (5, None, None, 0, NOW)], [])
+
+        assert index.generation > generation
+        assert index.ids.tolist() == [1, 2, 4, 5, 7]
+        assert filtered_ids(index, category="의류") == [2, 7]
+        assert filtered_ids(index, min_price=1000, max_price=10000) == [1, 7]
+
+    @pytest.mark.unit
+    def test_insert_out_of_order(self, index):
+        """기존 최대 id 보다 작은 신규 id 테스트"""
+        index.apply_changes([(3, "도서", 100.0, 0, NOW)], [])
+        assert index.ids.tolist() == [1, 2, 3, 4]
+        assert filtered_ids(index, category="도서") == [1, 3, 4]
+
+    @pytest.mark.unit
+    def test_duplicate_rows_keep_latest(self, index):
+        """같은 배치의 중복 id 는 마지막 행 적용 테스트"""
+        index.apply_changes([(1, "의류", 1.0, 0, NOW), (1, "도서", 2.0, 0, NOW)], [])
+        assert index.columns.prices[0] == 2.0
+        assert filtered_ids(index, category="도서") == [1, 4]
+
+    @pytest.mark.unit
+    def test_delete_tombstones(self, index):
+        """삭제 tombstone 테스트"""
+        index.apply_changes([], [2])
+
+        assert index.tombstones == 1
+        assert index.live_ids().tolist() == [1, 4]
+        assert filtered_ids(index, category="의류") == []
+        assert index.match_bitmap([2]) is None
+
+    @pytest.mark.unit
+    def test_tombstones_survive_insert(self, index):
+        """tombstone 이 신규 행 추가 후에도 유지되는지 테스트"""
+        index.apply_changes([], [2])
+        index.apply_changes([(9, "의류", 1.0, 0, NOW)], [])
+        assert index.live_ids().tolist() == [1, 4, 9]
+        assert filtered_ids(index, category="의류") == [9]
+
+    @pytest.mark.unit
+    def test_upsert_revives_tombstone(self, index):
+        """삭제된 id 재등장 테스트"""
+        index.apply_changes([], [2])
+        index.apply_changes([(2, "의류", 1.0, 0, NOW)], [])
+        assert index.tombstones == 0
+        assert filtered_ids(index, category="의류") == [2]
+
+    @pytest.mark.unit
+    def test_compact(self, index):
+        """압축 테스트"""
+        index.apply_changes([], [1, 4])
+        index.compact()
+
+        assert index.tombstones == 0
+        assert index.ids.tolist() == [2]
+        assert filtered_ids(index, category="의류") == [2]
+        assert filtered_ids(index, category="도서") == []
@@ -0,0 +1,162 @@
+"""
+단위 테스트: 워커 간 공유 메모리 캐시 (mmap 슬랩 + CLOCK)
+"""
+import errno
+import multiprocessing
+import time
+import pytest
+from datetime import datetime
+
+from app.config import settings
+from app.services.item_cache import ItemCache, create_item_cache
+from app.services.shared_cache import SharedItemCache, SharedMemoryStore
+
+
+def _child_put(path, size):
+    store = SharedMemoryStore(path, size, slab_sizes=(128, 512), ways=4)
+    store.set(b"from-child", b"hello")
+    store.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SharedMemoryStore(str(tmp_path / "cache"), 64 * 1024, slab_sizes=(128, 512), ways=4)
+    yield store
+    store.close()
+
+
+class TestSharedMemoryStore:
+    """SharedMemoryStore 테스트"""
+
+    @pytest.mark.unit
+    def test_set_get_delete(self, store):
+        """저장/조회/덮어쓰기/삭제"""
+        assert store.get(b"a") is None
+        assert store.set(b"a", b"1")
+        assert store.get(b"a") == b"1"
+        assert store.set(b"a", b"x" * 300)  # moves to the larger slab class
+        assert store.get(b"a") == b"x" * 300
+        assert len(store) == 1
+        store.delete(b"a")
+        assert store.get(b"a") is None
+
+    @pytest.mark.unit
+    def test_oversized_values_are_skipped(self, store):
+        """가장 큰 슬롯보다 큰 값은 저장하지 않음"""
+        assert not store.set(b"big", b"x" * 1024)
+        assert store.get(b"big") is None
+
+    @pytest.mark.unit
+    def test_ttl_expiry(self, store, monkeypatch):
+        """ttl 이 지난 항목은 미스, ttl 0 은 만료 없음"""
+        store.set(b"a", b"1", ttl=10)
+        store.set(b"b", b"2")
+        now = time.time()
+        monkeypatch.setattr("app.services.shared_cache.time.time", lambda: now + 11)
+        assert store.get(b"a") is None
+        assert store.get(b"b") == b"2"
+
+    @pytest.mark.unit
+    def test_clock_keeps_referenced_entries(self, tmp_path):
+        """세트가 가득 차면 최근 참조된 항목은 남기고 다른 항목 교체"""
+        store = SharedMemoryStore(str(tmp_path / "clock"), 128 * 4, slab_sizes=(128,), ways=4)
+        assert store.classes[0][1] == 1  # a single set, so every key competes
+        for key in (b"a", b"b", b"c", b"d"):
+            store.set(key, b"v")
+        store.get(b"a")
+        store.set(b"e", b"v")
+        assert store.get(b"a") == b"v"
+        assert store.get(b"e") == b"v"
+        assert len(store) == 4
+        store.close()
+
+    @pytest.mark.unit
+    def test_visible_across_processes(self, tmp_path, store):
+        """다른 프로세스가 쓴 값을 읽음"""
+        process = multiprocessing.get_context("spawn").Process(target=_child_put, args=(store.path, 64 * 1024))
+        process.start()
+        process.join(30)
+        assert process.exitcode == 0
+        assert store.get(b"from-child") == b"hello"
+
+    @pytest.mark.unit
+    def test_get_many_takes_one_lock(self, store, monkeypatch):
+        """여러 키를 공유 락 한 번으로 키 순서대로 조회"""
+        store.set(b"a", b"1")
+        store.set(b"c", b"3")
+        calls = []
+        locked = store._locked
+        monkeypatch.setattr(store, "_locked", lambda exclusive: calls.append(exclusive) or locked(exclusive))
+        assert store.get_many([b"a", b"b", b"c"]) == [b"1", None, b"3"]
+        assert calls == [False]
+
+    @pytest.mark.unit
+    def test_used_counter(self, tmp_path):
+        """덮어쓰기/교체/삭제/비우기 후에도 사용 슬롯 수가 정확"""
+        store = SharedMemoryStore(str(tmp_path / "count"), 128 * 4, slab_sizes=(128,), ways=4)
+        for key in (b"a", b"b", b"c", b"d"):
+            store.set(key, b"v")
+        store.set(b"a", b"w")
+        store.set(b"e", b"v")  # evicts one slot
+        assert len(store) == 4
+        store.delete(b"e")
+        store.delete(b"missing")
+        assert len(store) == 3
+        store.clear()
+        assert len(store) == 0
+        store.close()
+
+    @pytest.mark.unit
+    def test_allocation_failure_raises(self, tmp_path, monkeypatch):
+        """tmpfs 공간이 부족하면 생성 시 OSError (빈 파일을 남김)"""
+        def no_space(fd, offset, length):
+            raise OSError(errno.ENOSPC, "No space left on device")
+        monkeypatch.setattr("app.services.shared_cache.os.posix_fallocate", no_space)
+        path = tmp_path / "full"
+        with pytest.raises(OSError):
+            SharedMemoryStore(str(path), 64 * 1024, slab_sizes=(128, 512), ways=4)
+        assert path.stat().st_size == 0
+
+        monkeypatch.setattr(settings, "ITEM_CACHE_BACKEND", "shared")
+        monkeypatch.setattr(settings, "SHARED_CACHE_PATH", str(path))
+        assert isinstance(create_item_cache(), ItemCache)
+
+    @pytest.mark.unit
+    def test_layout_change_recreates_file(self, tmp_path, store):
+        """레이아웃이 다르면 파일을 새로 만들어 이전 내용은 버림"""
+        store.set(b"a", b"1")
+        other = SharedMemoryStore(store.path, 64 * 1024, slab_sizes=(256,), ways=4)
+        assert other.get(b"a") is None
+        other.close()
+
+
+class TestSharedItemCache:
+    """SharedItemCache 테스트 (ItemCache 와 같은 인터페이스)"""
+
+    @pytest.mark.unit
+    def test_item_cache_interface(self, store):
+        """get_many/put_many/apply_changes/stats"""
+        cache = SharedItemCache(store, ttl=60)
+        created = datetime(2026, 10, 19, 12, 0)
+        cache.put_many({1: {"id": 1, "title": "노트북", "created_at": created}, 2: {"id": 2, "title": "마우스"}})
+
+        found, missing = cache.get_many([1, 2, 3])
+        assert found[1]["title"] == "노트북"
+        assert found[1]["created_at"] == created.isoformat()
+        assert missing == [3]
+
+        cache.apply_changes([(1, "노트북 v2")], [2])
+        found, missing = cache.get_many([1, 2])
+        assert found == {} and missing == [1, 2]
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["backend"]) == (2, 3, "shared")
+
+    @pytest.mark.unit
+    def test_undecodable_entry_is_a_miss(self, store):
+        """깨진 페이로드는 미스로 처리하고 지움"""
+        cache = SharedItemCache(store, ttl=60)
+        store.set(cache._key(1), b"\xff{not json")
+        found, missing = cache.get_many([1])
+        assert found == {} and missing == [1]
+        assert store.get(cache._key(1)) is None
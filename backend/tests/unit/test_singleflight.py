@@ -0,0 +1,84 @@
+"""
+단위 테스트: SingleFlight 요청 병합
+"""
+import asyncio
+import pytest
+
+from app.services.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """SingleFlight 테스트"""
+
+    @pytest.mark.unit
+    async def test_concurrent_calls_share_execution(self):
+        """동시 동일 키 호출은 한 번만 실행"""
+        flight = SingleFlight("test-share")
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(*(flight.do("q", work) for _ in range(10)))
+        assert results == [1] * 10
+        assert calls == 1
+        assert flight.stats()["coalesced"] == 9
+        assert flight.coalescing_ratio == pytest.approx(0.9)
+
+    @pytest.mark.unit
+    async def test_distinct_keys_run_separately(self):
+        """키가 다르면 각각 실행"""
+        flight = SingleFlight("test-keys")
+
+        async def work(value):
+            await asyncio.sleep(0)
+            return value
+
+        results = await asyncio.gather(flight.do("a", lambda: work(1)), flight.do("b", lambda: work(2)))
+        assert results == [1, 2]
+        assert flight.coalesced == 0
+
+    @pytest.mark.unit
+    async def test_completed_key_is_released(self):
+        """완료 후 다음 호출은 새로 실행"""
+        flight = SingleFlight("test-release")
+
+        async def work():
+            return object()
+
+        first = await flight.do("q", work)
+        await asyncio.sleep(0)
+        assert await flight.do("q", work) is not first
+        assert flight.stats()["inflight"] == 0
+
+    @pytest.mark.unit
+    async def test_errors_propagate_to_all_callers(self):
+        """예외는 모든 호출자에게 전달"""
+        flight = SingleFlight("test-error")
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(*(flight.do("q", work) for _ in range(3)), return_exceptions=True)
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.unit
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        """먼저 온 호출자가 취소되어도 나머지는 결과 수신"""
+        flight = SingleFlight("test-cancel")
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        leader = asyncio.create_task(flight.do("q", work))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("q", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "done"
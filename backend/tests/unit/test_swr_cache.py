@@ -0,0 +1,80 @@
+"""
+단위 테스트: stale-while-revalidate 캐시
+"""
+import asyncio
+import pytest
+
+from app.services.swr_cache import SWRCache
+
+
+def counting_loader(delay: float = 0.0):
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return len(calls)
+
+    return load, calls
+
+
+class TestSWRCache:
+    """SWRCache 테스트"""
+
+    @pytest.mark.unit
+    async def test_fresh_value_is_cached(self):
+        """ttl 이내에는 다시 로드하지 않음"""
+        cache = SWRCache("test", ttl=60, stale_ttl=60)
+        load, calls = counting_loader()
+        assert (await cache.get("k", load))[0] == 1
+        value, age = await cache.get("k", load)
+        assert value == 1
+        assert age >= 0
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    async def test_stale_value_served_while_revalidating(self):
+        """ttl 경과 후 기존 값을 즉시 반환하고 한 번만 백그라운드 갱신"""
+        cache = SWRCache("test", ttl=0, stale_ttl=60)
+        load, calls = counting_loader(delay=0.01)
+        await cache.get("k", load)
+
+        results = [await cache.get("k", load) for _ in range(5)]
+        assert all(value == 1 for value, _ in results)
+        assert cache.stats()["keys"]["k"]["refreshing"] is True
+
+        await asyncio.sleep(0.05)
+        assert len(calls) == 2
+        assert (await cache.get("k", load))[0] == 2
+
+    @pytest.mark.unit
+    async def test_expired_value_waits_for_load(self):
+        """stale 구간도 지나면 로드를 기다림"""
+        cache = SWRCache("test", ttl=0, stale_ttl=0)
+        load, calls = counting_loader()
+        await cache.get("k", load)
+        assert (await cache.get("k", load))[0] == 2
+
+    @pytest.mark.unit
+    async def test_concurrent_misses_load_once(self):
+        """동시 미스는 한 번만 로드"""
+        cache = SWRCache("test", ttl=60, stale_ttl=60)
+        load, calls = counting_loader(delay=0.01)
+        results = await asyncio.gather(*(cache.get("k", load) for _ in range(5)))
+        assert [value for value, _ in results] == [1] * 5
+        assert len(calls) == 1
+
+    @pytest.mark.unit
+    async def test_failed_refresh_keeps_stale_value(self):
+        """갱신 실패 시 기존 값 유지"""
+        cache = SWRCache("test", ttl=0, stale_ttl=60)
+        load, _ = counting_loader()
+        await cache.get("k", load)
+
+        async def failing():
+            raise RuntimeError("db down")
+
+        assert (await cache.get("k", failing))[0] == 1
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        assert (await cache.get("k", failing))[0] == 1
@@ -21,9 +21,24 @@ export interface SearchResponse {
   response_time_ms: number
   facets: {
     categories: Record<string, number>
+    price_ranges?: PriceRangeFacet[]
+    price_histogram?: PriceHistogramBin[]
   } | null
 }
 
+export interface PriceRangeFacet {
+  key: string
+  from: number | null
+  to: number | null
+  count: number
+}
+
+export interface PriceHistogramBin {
+  from: number | null
+  to: number | null
+  count: number
+}
+
 export interface SearchParams {
   q: string
   category?: string